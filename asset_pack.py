@@ -0,0 +1,187 @@
+"""
+Archive d'assets unique pour Minou - index en tête, lecture par mmap
+"""
+import json
+import mmap
+import os
+import struct
+import zlib
+from PyQt5.QtCore import QBuffer, QByteArray, QIODevice
+from PyQt5.QtGui import QImage, QImageReader
+
+ASSETS_DIR = os.path.join(os.path.dirname(__file__), 'assets')
+PACK_PATH = os.path.join(os.path.dirname(__file__), 'assets.pack')
+
+# Dossiers d'assets empaquetés (les captures et logos du README restent à part)
+PACKED_DIRS = ['cat', 'dog', 'food', 'poop', 'icons']
+
+
+class AssetPack:
+    """Archive en lecture seule : en-tête, index JSON nom -> (offset, taille,
+    format, crc32), puis les fichiers bout à bout"""
+
+    MAGIC = b"MINOUPAK"
+    VERSION = 1
+    _HEADER = struct.Struct("<8sII")  # magic, version, taille de l'index JSON
+
+    def __init__(self, path=PACK_PATH):
+        self.path = path
+        self._file = open(path, 'rb')
+        try:
+            self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+            magic, version, index_size = self._HEADER.unpack_from(self._map, 0)
+            if magic != self.MAGIC or version != self.VERSION:
+                raise ValueError(f"Archive d'assets invalide: {path}")
+
+            start = self._HEADER.size
+            self.index = json.loads(self._map[start:start + index_size].decode('utf-8'))
+            self._data_offset = start + index_size
+        except Exception:
+            self.close()
+            raise
+
+    def __contains__(self, name):
+        return name in self.index
+
+    def names(self):
+        return list(self.index)
+
+    def read(self, name):
+        """Contenu brut d'un fichier de l'archive : une vue sur la zone mappée,
+        sans copie (valable tant que l'archive est ouverte)"""
+        offset, length, _, _ = self.index[name]
+        start = self._data_offset + offset
+        return memoryview(self._map)[start:start + length]
+
+    def format(self, name):
+        return self.index[name][2]
+
+    def crc(self, name):
+        return self.index[name][3]
+
+    def image(self, name):
+        """Décode une image directement depuis la zone mappée"""
+        return QImage.fromData(QByteArray.fromRawData(self.read(name)), self.format(name))
+
+    def close(self):
+        if getattr(self, '_map', None) is not None:
+            try:
+                self._map.close()
+            except BufferError:
+                pass  # des vues sont encore lues : libéré avec la dernière
+            self._map = None
+        self._file.close()
+
+
+def build_pack(assets_dir=ASSETS_DIR, pack_path=PACK_PATH, packed_dirs=PACKED_DIRS):
+    """Empaquette les dossiers d'assets dans une archive unique.
+
+    Retourne le nombre de fichiers empaquetés.
+    """
+    index = {}
+    chunks = []
+    offset = 0
+    for dir_name in packed_dirs:
+        dir_path = os.path.join(assets_dir, dir_name)
+        if not os.path.isdir(dir_path):
+            continue
+        for file_name in sorted(os.listdir(dir_path)):
+            file_path = os.path.join(dir_path, file_name)
+            if not os.path.isfile(file_path):
+                continue
+            with open(file_path, 'rb') as f:
+                data = f.read()
+            file_format = os.path.splitext(file_name)[1].lstrip('.').lower()
+            index[f"{dir_name}/{file_name}"] = [offset, len(data), file_format,
+                                                zlib.crc32(data)]
+            chunks.append(data)
+            offset += len(data)
+
+    index_data = json.dumps(index, ensure_ascii=False).encode('utf-8')
+    tmp_path = pack_path + ".tmp"
+    with open(tmp_path, 'wb') as f:
+        f.write(AssetPack._HEADER.pack(AssetPack.MAGIC, AssetPack.VERSION, len(index_data)))
+        f.write(index_data)
+        for chunk in chunks:
+            f.write(chunk)
+    os.replace(tmp_path, pack_path)
+    return len(index)
+
+
+class AssetSource:
+    """Accès aux assets par nom relatif ("cat/Idle (1).png") : depuis
+    l'archive si elle existe, sinon depuis les fichiers du dossier assets/"""
+
+    def __init__(self, assets_dir=ASSETS_DIR, pack_path=PACK_PATH):
+        self.assets_dir = assets_dir
+        self.pack = None
+        if os.path.exists(pack_path):
+            try:
+                self.pack = AssetPack(pack_path)
+                print(f"📦 Archive d'assets chargée: {len(self.pack.index)} fichiers")
+            except Exception as e:
+                print(f"⚠️ Archive d'assets ignorée ({pack_path}): {e}")
+
+    def path(self, name):
+        """Chemin du fichier libre correspondant à un nom d'asset"""
+        return os.path.join(self.assets_dir, name)
+
+    def exists(self, name):
+        if self.pack is not None and name in self.pack:
+            return True
+        return os.path.exists(self.path(name))
+
+    def has_dir(self, dir_name):
+        if self.pack is not None:
+            prefix = dir_name.rstrip('/') + '/'
+            if any(name.startswith(prefix) for name in self.pack.index):
+                return True
+        return os.path.isdir(self.path(dir_name))
+
+    def list_dir(self, dir_name, extensions=None):
+        """Noms d'assets contenus directement dans un dossier"""
+        prefix = dir_name.rstrip('/') + '/'
+        if self.pack is not None:
+            names = [name for name in self.pack.index
+                     if name.startswith(prefix) and '/' not in name[len(prefix):]]
+        else:
+            dir_path = self.path(dir_name)
+            names = ([prefix + f for f in os.listdir(dir_path)]
+                     if os.path.isdir(dir_path) else [])
+        if extensions:
+            names = [name for name in names if name.lower().endswith(extensions)]
+        return sorted(names)
+
+    def image_reader(self, name):
+        """QImageReader sur l'asset (archive ou fichier).
+
+        Dans l'archive, le reader lit la zone mappée sans copie. Retourne
+        (reader, source) : la source (buffer et vue) doit rester vivante
+        pendant la lecture.
+        """
+        if self.pack is not None and name in self.pack:
+            data = self.pack.read(name)
+            buffer = QBuffer()
+            buffer.setData(QByteArray.fromRawData(data))
+            buffer.open(QIODevice.ReadOnly)
+            return QImageReader(buffer, self.pack.format(name).encode()), (buffer, data)
+        return QImageReader(self.path(name)), None
+
+    def signature(self, names):
+        """Signature servant à invalider les caches dérivés des assets"""
+        if self.pack is not None and all(name in self.pack for name in names):
+            # Aucun stat : le crc de chaque fichier est dans l'index
+            return [[name, self.pack.crc(name)] for name in names]
+
+        signature = []
+        for name in names:
+            try:
+                stat = os.stat(self.path(name))
+                signature.append([name, stat.st_size, stat.st_mtime_ns])
+            except OSError:
+                signature.append([name, None, None])
+        return signature
+
+
+# Instance globale
+asset_source = AssetSource()
@@ -0,0 +1,174 @@
+"""
+File d'attente des bulles de Minou - priorités, limites par source et
+regroupement des messages avant l'affichage dans l'unique SpeechBubble
+"""
+import time
+from collections import Counter
+from PyQt5.QtCore import QObject, QTimer
+
+from config import (BUBBLE_MIN_DISPLAY_MS, BUBBLE_MAX_WAIT_MS,
+                    BUBBLE_PIN_MAX_WAIT_MS, BUBBLE_SOURCE_INTERVALS)
+
+# Une bulle plus prioritaire remplace celle affichée (après son temps minimum)
+PRIORITIES = {"ambient": 0, "chat": 1, "reminder": 2, "alert": 3}
+
+
+class BubbleRequest:
+    """Message en attente ou affiché"""
+
+    __slots__ = ("message", "bubble_type", "duration", "priority", "level",
+                 "source", "posted", "seq")
+
+    def __init__(self, message, bubble_type, duration, priority, source, posted, seq):
+        self.message = message
+        self.bubble_type = bubble_type
+        self.duration = duration
+        self.priority = priority
+        self.level = PRIORITIES[priority]
+        self.source = source
+        self.posted = posted
+        self.seq = seq
+
+    def same_text(self, other):
+        return self.message == other.message and self.bubble_type == other.bubble_type
+
+
+class BubbleScheduler(QObject):
+    """Décide quel message occupe la bulle et quand.
+
+    - le plus prioritaire passe en premier (alert > reminder > chat > ambient)
+    - une bulle reste affichée au moins BUBBLE_MIN_DISPLAY_MS ; ensuite un
+      message plus prioritaire, ou plus récent de la même source, la remplace
+    - un message identique à celui affiché ou en attente est ignoré, et un
+      nouveau message d'une source remplace celui qu'elle avait en attente
+    - une source ne peut pas reparler avant BUBBLE_SOURCE_INTERVALS[source]
+    - un message qui a trop attendu (BUBBLE_MAX_WAIT_MS) est abandonné
+    - une bulle épinglée retient les messages ordinaires ; une alerte passe
+      après le temps minimum, un rappel après BUBBLE_PIN_MAX_WAIT_MS
+
+    `display(message, bubble_type, duration)` affiche réellement la bulle ;
+    la fin d'un message est détectée par le signal `hidden` de la bulle.
+    """
+
+    def __init__(self, bubble, display, parent=None):
+        super().__init__(parent)
+        self.bubble = bubble
+        self.display = display
+        self.stats = Counter()
+
+        self._queue = []
+        self._current = None
+        self._shown_at = 0.0
+        self._last_by_source = {}
+        self._seq = 0
+
+        # Réexamen de la file quand le temps minimum de la bulle actuelle expire
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.timeout.connect(self._pump)
+
+        bubble.hidden.connect(self._on_bubble_hidden)
+
+    def post(self, message, bubble_type="normal", duration=3000,
+             priority="ambient", source=None):
+        """Propose un message ; retourne False s'il est ignoré"""
+        now = time.monotonic()
+        self._seq += 1
+        request = BubbleRequest(message, bubble_type, duration, priority, source, now, self._seq)
+        self.stats["posted"] += 1
+
+        # Déjà à l'écran
+        if self._busy() and self._current.same_text(request):
+            self.stats["duplicates"] += 1
+            return False
+
+        # Limite de fréquence de la source
+        interval = BUBBLE_SOURCE_INTERVALS.get(source, 0) if source else 0
+        last = self._last_by_source.get(source)
+        if interval and last is not None and (now - last) * 1000 < interval:
+            self.stats["rate_limited"] += 1
+            return False
+        if source:
+            self._last_by_source[source] = now
+
+        # Regroupement avec les messages en attente
+        kept = [queued for queued in self._queue
+                if not queued.same_text(request) and
+                not (source and queued.source == source)]
+        if len(kept) != len(self._queue):
+            self.stats["coalesced"] += len(self._queue) - len(kept)
+            request.level = max([request.level] + [queued.level for queued in self._queue
+                                                   if queued not in kept])
+        self._queue = kept
+        self._queue.append(request)
+
+        self._pump()
+        return True
+
+    def clear(self):
+        """Oublie les messages en attente"""
+        self._queue.clear()
+        self._timer.stop()
+
+    def pending(self):
+        return len(self._queue)
+
+    def _busy(self):
+        return self._current is not None and self.bubble.isVisible()
+
+    def _pump(self):
+        self._timer.stop()
+        now = time.monotonic()
+
+        # Messages qui ne sont plus d'actualité
+        fresh = []
+        for request in self._queue:
+            max_wait = BUBBLE_MAX_WAIT_MS.get(request.priority)
+            if max_wait is not None and (now - request.posted) * 1000 > max_wait:
+                self.stats["expired"] += 1
+            else:
+                fresh.append(request)
+        self._queue = fresh
+        if not self._queue:
+            return
+
+        request = max(self._queue, key=lambda r: (r.level, -r.seq))
+
+        if self._busy():
+            current = self._current
+            if self.bubble.is_pinned:
+                if request.level < PRIORITIES["reminder"]:
+                    return  # attendra que la bulle soit désépinglée puis cachée
+                if request.level < PRIORITIES["alert"]:
+                    waited = (now - request.posted) * 1000
+                    if waited < BUBBLE_PIN_MAX_WAIT_MS:
+                        self._timer.start(int(BUBBLE_PIN_MAX_WAIT_MS - waited) + 1)
+                        return
+            elif not (request.level > current.level or
+                      (request.source is not None and request.source == current.source)):
+                return  # attendra que la bulle se cache
+
+            remaining = BUBBLE_MIN_DISPLAY_MS - (now - self._shown_at) * 1000
+            if remaining > 0:
+                self._timer.start(int(remaining) + 1)
+                return
+
+            # Un rappel ou une alerte interrompu sera réaffiché ensuite
+            self.stats["preempted"] += 1
+            if current.level >= PRIORITIES["reminder"] and current.source != request.source:
+                current.posted = now
+                self._queue.append(current)
+
+        self._queue.remove(request)
+        self._show(request)
+
+    def _show(self, request):
+        self._current = request
+        self._shown_at = time.monotonic()
+        self.stats["shown"] += 1
+        self.display(request.message, request.bubble_type,
+                     max(request.duration, BUBBLE_MIN_DISPLAY_MS))
+
+    def _on_bubble_hidden(self):
+        self._current = None
+        self._pump()
@@ -0,0 +1,26 @@
+#!/usr/bin/env python3
+"""
+Construit assets.pack à partir du dossier assets/
+
+Usage: python build_asset_pack.py [dossier_assets] [archive_sortie]
+"""
+import sys
+import time
+
+from asset_pack import ASSETS_DIR, PACK_PATH, build_pack
+
+
+def main():
+    assets_dir = sys.argv[1] if len(sys.argv) > 1 else ASSETS_DIR
+    pack_path = sys.argv[2] if len(sys.argv) > 2 else PACK_PATH
+
+    start = time.perf_counter()
+    count = build_pack(assets_dir, pack_path)
+    duration_ms = (time.perf_counter() - start) * 1000
+
+    print(f"📦 {count} fichiers empaquetés dans {pack_path} ({duration_ms:.0f} ms)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -13,6 +13,9 @@ from PyQt5.QtGui import QFont
 CAT_WIDTH = 120
 CAT_HEIGHT = 120
 ANIMATION_FRAME_RATE = 100
+FRAME_INTERVAL = 16  # Tick de base de l'horloge de frames (~60 FPS)
+PHYSICS_STEP_MS = 16  # Pas fixe de la physique (vitesses en pixels par pas)
+MAX_PHYSICS_STEPS = 5  # Pas rattrapés au plus par tick
 MOVEMENT_SPEED = 3
 MOVEMENT_CHANGE_DELAY = 3000
 RUN_SPEED_MULTIPLIER = 2.5
@@ -23,6 +26,30 @@ DEAD_ANIMATION_THRESHOLD = 5
 FOOD_SIZE = 40
 POOP_SIZE = 25
 POOP_SPAWN_INTERVAL = 15000
+POOP_LIFETIME_MS = 60000  # Un poop non nettoyé disparaît au bout d'une minute
+FOOD_LIFETIME_MS = 0  # Durée de vie de la nourriture (0 = illimitée)
+EXPIRY_SLACK_MS = 250  # Expirations aussi proches traitées dans le même passage
+ITEM_POOL_SIZE = 32  # Widgets de nourriture / poop cachés gardés pour réutilisation
+ITEM_MIN_SPACING = 60  # Distance minimale (px) entre objets déposés en lot
+WORLD_STATE_FILE = "minou_world.json"  # Animal, nourriture et poops de la dernière session
+WORLD_SAVE_DELAY_MS = 2000  # Regroupement des changements avant sauvegarde
+SPATIAL_CELL_SIZE = 128  # Côté (px) des cases de l'index spatial des objets
+SPRITE_MEMORY_BUDGET_MB = 64
+BUBBLE_CACHE_SIZE = 16  # Bulles rendues gardées en pixmap (LRU)
+TEXT_LAYOUT_CACHE_SIZE = 32  # Textes mis en page gardés pour les bulles (LRU)
+BUBBLE_MIN_DISPLAY_MS = 1500  # Temps d'affichage garanti d'une bulle
+BUBBLE_MAX_WAIT_MS = {  # Attente maximum avant abandon, par priorité (sans limite sinon)
+    "ambient": 20000,
+    "chat": 60000,
+}
+BUBBLE_PIN_MAX_WAIT_MS = 30000  # Attente maximum d'un rappel derrière une bulle épinglée
+BUBBLE_SOURCE_INTERVALS = {  # Délai minimum (ms) entre deux bulles d'une même source
+    "alert:memory": 300000,
+    "alert:cpu": 300000,
+    "alert:battery": 600000,
+    "food": 5000,
+    "poop": 5000,
+}
 
 ANIMATION_FRAMES = {
     "Dead": 10, "Fall": 8, "Hurt": 10, "Idle": 10, 
@@ -71,6 +98,14 @@ class ConfigManager:
             "animation_speed": 100,
             "sound_enabled": True,
             "poop_interval": 15000,
+            "poop_lifetime_ms": 60000,
+            "food_lifetime_ms": 0,  # 0 = la nourriture reste jusqu'à être mangée
+            "sprite_memory_budget_mb": 64,
+            "asset_hot_reload": False,
+            "adaptive_movement_tick": True,  # boucle de mouvement en veille à l'arrêt
+            "movement_frame_interval": 16,  # ms entre deux affichages (la physique reste à pas fixe)
+            "item_pool_size": 32,  # objets cachés réutilisés au lieu d'être recréés
+            "frame_stats_interval": 0,  # secondes entre deux rapports de l'horloge (0 = off)
             
             # IA et chat
             "ai_enabled": False,
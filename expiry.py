@@ -0,0 +1,103 @@
+"""
+Expiration des objets de Minou - un seul QTimer pour la durée de vie de
+toutes les nourritures et tous les poops
+"""
+import heapq
+import itertools
+import time
+from PyQt5.QtCore import QObject, QTimer
+
+from config import EXPIRY_SLACK_MS
+
+
+class ExpiryScheduler(QObject):
+    """Échéances d'objets dans un tas (min-heap), servies par un unique timer
+    armé sur la plus proche.
+
+    Les échéances à moins de EXPIRY_SLACK_MS les unes des autres sont traitées
+    dans le même passage. Une annulation ou une reprogrammation laisse
+    l'ancienne entrée dans le tas : elle est ignorée à sa sortie.
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._heap = []       # (échéance ms, n°, objet)
+        self._entries = {}    # objet -> (échéance ms, n°, callback)
+        self._counter = itertools.count()
+        self._timer = None
+        self.passes = 0
+        self.expired = 0
+
+    @staticmethod
+    def _now():
+        return time.monotonic() * 1000
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, item):
+        return item in self._entries
+
+    def schedule(self, item, ttl_ms, callback):
+        """`callback()` sera appelé dans `ttl_ms` ms (remplace l'échéance précédente)"""
+        deadline = self._now() + ttl_ms
+        seq = next(self._counter)
+        self._entries[item] = (deadline, seq, callback)
+        heapq.heappush(self._heap, (deadline, seq, item))
+        self._arm()
+
+    def cancel(self, item):
+        self._entries.pop(item, None)
+        if not self._entries:
+            self._heap.clear()
+            if self._timer is not None:
+                self._timer.stop()
+
+    def remaining(self, item):
+        """Temps restant (ms) avant l'expiration de `item`, ou None"""
+        entry = self._entries.get(item)
+        if entry is None:
+            return None
+        return max(0, entry[0] - self._now())
+
+    def _arm(self):
+        # Sauter les entrées annulées ou remplacées
+        while self._heap:
+            deadline, seq, item = self._heap[0]
+            entry = self._entries.get(item)
+            if entry is not None and entry[1] == seq:
+                break
+            heapq.heappop(self._heap)
+
+        if self._timer is None:
+            self._timer = QTimer(self)
+            self._timer.setSingleShot(True)
+            self._timer.timeout.connect(self._expire_due)
+
+        if not self._heap:
+            self._timer.stop()
+            return
+        delay = max(0, int(self._heap[0][0] - self._now()) + 1)
+        if not self._timer.isActive() or self._timer.remainingTime() > delay:
+            self._timer.start(delay)
+
+    def _expire_due(self):
+        """Un passage : retire puis rappelle tous les objets échus"""
+        limit = self._now() + EXPIRY_SLACK_MS
+        due = []
+        while self._heap and self._heap[0][0] <= limit:
+            deadline, seq, item = heapq.heappop(self._heap)
+            entry = self._entries.get(item)
+            if entry is not None and entry[1] == seq:
+                del self._entries[item]
+                due.append(entry[2])
+
+        self.passes += 1
+        self.expired += len(due)
+        for callback in due:
+            callback()
+        self._arm()
+
+
+# Instance globale
+item_expiry = ExpiryScheduler()
@@ -0,0 +1,169 @@
+"""
+Horloge de frames unique pour Minou - un seul QTimer pour l'animation,
+la physique et l'icône du tray
+"""
+import math
+import time
+from PyQt5.QtCore import QObject, QTimer
+
+from config import FRAME_INTERVAL, config_manager
+
+
+class FrameSubscription:
+    """Abonnement à l'horloge : appelé tous les `divisor` ticks.
+
+    Expose start/stop/isActive/interval comme un QTimer pour remplacer
+    les timers existants sans toucher au code qui les pilote.
+    """
+
+    def __init__(self, clock, callback, name):
+        self.clock = clock
+        self.callback = callback
+        self.name = name
+        self.divisor = 1
+        self.active = False
+        self.calls = 0
+        self.total_ms = 0.0
+
+    def start(self, interval_ms=None):
+        """Active l'abonnement ; un intervalle en ms est arrondi au diviseur le plus proche"""
+        if interval_ms is not None:
+            self.divisor = max(1, round(interval_ms / self.clock.base_interval))
+        self.active = True
+        self.clock._reschedule()
+
+    def stop(self):
+        if self.active:
+            self.active = False
+            self.clock._reschedule()
+
+    def isActive(self):
+        return self.active
+
+    def interval(self):
+        return self.divisor * self.clock.base_interval
+
+
+class FrameClock(QObject):
+    """Horloge centrale : les sous-systèmes s'abonnent avec un diviseur de
+    cadence et sont tous appelés sur des ticks alignés.
+
+    Le QTimer tourne au PGCD des diviseurs actifs : sans mouvement, l'horloge
+    ne se réveille qu'au rythme de l'animation.
+    """
+
+    def __init__(self, base_interval=FRAME_INTERVAL, parent=None):
+        super().__init__(parent)
+        self.base_interval = base_interval
+        self.subscriptions = []
+        self._tick = 0
+        self._step = 0
+        self._dispatching = False
+        self._reschedule_pending = False
+
+        self._timer = QTimer(self)
+        self._timer.timeout.connect(self._on_timeout)
+
+        # Statistiques (fenêtre glissante remise à zéro à chaque rapport)
+        self._window_start = time.perf_counter()
+        self._window_wakeups = 0
+        self._window_ms = 0.0
+        self._window_max_ms = 0.0
+
+        self._stats_timer = None
+        stats_interval = config_manager.get("frame_stats_interval", 0)
+        if stats_interval:
+            self._stats_timer = QTimer(self)
+            self._stats_timer.timeout.connect(lambda: print(self.report()))
+            self._stats_timer.start(stats_interval * 1000)
+
+    def subscribe(self, callback, name=None):
+        """Enregistre un sous-système (inactif tant que start() n'est pas appelé)"""
+        subscription = FrameSubscription(self, callback, name or callback.__name__)
+        self.subscriptions.append(subscription)
+        return subscription
+
+    def _reschedule(self):
+        """Recalcule l'intervalle du QTimer d'après les diviseurs actifs"""
+        if self._dispatching:
+            self._reschedule_pending = True
+            return
+
+        divisors = [s.divisor for s in self.subscriptions if s.active]
+        step = 0
+        for divisor in divisors:
+            step = math.gcd(step, divisor)
+
+        if step == 0:
+            self._timer.stop()
+            self._step = 0
+            return
+        if step == self._step and self._timer.isActive():
+            return
+
+        # Réaligner le compteur pour que chaque diviseur retombe sur un tick
+        self._step = step
+        self._tick = math.ceil(self._tick / step) * step
+        self._timer.start(step * self.base_interval)
+
+    def _on_timeout(self):
+        start = time.perf_counter()
+        self._tick += self._step
+        self._dispatching = True
+        try:
+            for subscription in list(self.subscriptions):
+                if subscription.active and self._tick % subscription.divisor == 0:
+                    call_start = time.perf_counter()
+                    subscription.callback()
+                    subscription.calls += 1
+                    subscription.total_ms += (time.perf_counter() - call_start) * 1000
+        finally:
+            self._dispatching = False
+            if self._reschedule_pending:
+                self._reschedule_pending = False
+                self._reschedule()
+
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        self._window_wakeups += 1
+        self._window_ms += elapsed_ms
+        self._window_max_ms = max(self._window_max_ms, elapsed_ms)
+
+    def stats(self, reset=False):
+        """FPS effectifs et coût des ticks depuis le dernier rapport"""
+        elapsed = max(time.perf_counter() - self._window_start, 1e-6)
+        wakeups = self._window_wakeups
+        stats = {
+            "wakeups_per_s": wakeups / elapsed,
+            "target_wakeups_per_s": 1000 / (self._step * self.base_interval) if self._step else 0,
+            "avg_tick_ms": self._window_ms / wakeups if wakeups else 0.0,
+            "max_tick_ms": self._window_max_ms,
+            "subscriptions": {
+                s.name: {
+                    "active": s.active,
+                    "divisor": s.divisor,
+                    "calls_per_s": s.calls / elapsed,
+                    "avg_ms": s.total_ms / s.calls if s.calls else 0.0,
+                }
+                for s in self.subscriptions
+            },
+        }
+        if reset:
+            self._window_start = time.perf_counter()
+            self._window_wakeups = 0
+            self._window_ms = 0.0
+            self._window_max_ms = 0.0
+            for subscription in self.subscriptions:
+                subscription.calls = 0
+                subscription.total_ms = 0.0
+        return stats
+
+    def report(self):
+        stats = self.stats(reset=True)
+        lines = [f"⏱️ Horloge: {stats['wakeups_per_s']:.1f} réveils/s "
+                 f"(cible {stats['target_wakeups_per_s']:.1f}), tick moyen "
+                 f"{stats['avg_tick_ms']:.2f} ms, max {stats['max_tick_ms']:.2f} ms"]
+        for name, sub in stats["subscriptions"].items():
+            if sub["active"] or sub["calls_per_s"]:
+                lines.append(f"   • {name} (/{sub['divisor']}): {sub['calls_per_s']:.1f} FPS, "
+                             f"{sub['avg_ms']:.2f} ms/appel")
+        return "\n".join(lines)
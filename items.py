@@ -1,35 +1,216 @@
 """
 Objets interactifs pour Minou - Nourriture et Poop (COMPLET)
 """
-import os
 import random
-from PyQt5.QtWidgets import QLabel, QApplication
-from PyQt5.QtGui import QPixmap, QPainter, QColor, QBrush, QPen
-from PyQt5.QtCore import Qt, QPoint, pyqtSignal, QTimer, QPropertyAnimation, QEasingCurve, QRectF, QPointF
-from config import FOOD_SIZE, POOP_SIZE, DARK_THEME
+from collections import Counter
+from PyQt5.QtWidgets import QLabel
+from PyQt5.QtGui import QPainter, QColor, QBrush, QPen, QPixmap, QFont, QLinearGradient
+from PyQt5.QtCore import Qt, QPoint, pyqtSignal, QPropertyAnimation, QEasingCurve, QRectF
+from config import (FOOD_SIZE, POOP_SIZE, DARK_THEME, ITEM_POOL_SIZE,
+                    FOOD_LIFETIME_MS, POOP_LIFETIME_MS, config_manager)
+from expiry import item_expiry
+from sprites import SpritePool
+from screens import screen_geometry
 
-class FoodItem(QLabel):
+class ItemLook:
+    """Apparences d'un type d'objet (normal, survol, sélection), rendues une
+    seule fois par sprite puis partagées par tous les objets.
+
+    Changer d'état revient à un setPixmap() d'un pixmap déjà prêt : la feuille
+    de style n'est jamais réécrite ni re-parsée.
+    """
+
+    def __init__(self, size, fallback, overlays, emoji_color):
+        self.size = size
+        self.fallback = fallback  # état -> (dégradé début, fin, bordure, épaisseur)
+        self.overlays = overlays  # état -> (bordure, épaisseur, remplissage) ou None
+        self.emoji_color = emoji_color
+        self._pixmaps = {}  # (cacheKey du sprite ou emoji, état) -> QPixmap
+
+    def sprite(self, base, state):
+        """Sprite `base` dans l'état `state`"""
+        overlay = self.overlays.get(state)
+        if overlay is None:
+            return base
+        key = (base.cacheKey(), state)
+        pixmap = self._pixmaps.get(key)
+        if pixmap is None:
+            pixmap = QPixmap(base)
+            painter = QPainter(pixmap)
+            painter.setRenderHint(QPainter.Antialiasing)
+            self._draw_overlay(painter, QRectF(0, 0, base.width(), base.height()), overlay,
+                               radius=6)
+            painter.end()
+            self._pixmaps[key] = pixmap
+        return pixmap
+
+    def emoji(self, emoji, state):
+        """Pastille de fallback (dégradé + emoji) dans l'état `state`"""
+        key = (emoji, state)
+        pixmap = self._pixmaps.get(key)
+        if pixmap is None:
+            pixmap = self._pixmaps[key] = self._render_emoji(emoji, state)
+        return pixmap
+
+    def _render_emoji(self, emoji, state):
+        pixmap = QPixmap(self.size, self.size)
+        pixmap.fill(Qt.transparent)
+        painter = QPainter(pixmap)
+        painter.setRenderHint(QPainter.Antialiasing)
+        painter.setRenderHint(QPainter.TextAntialiasing)
+
+        start, end, border, width = self.fallback.get(state, self.fallback["normal"])
+        rect = QRectF(width / 2, width / 2, self.size - width, self.size - width)
+        gradient = QLinearGradient(rect.topLeft(), rect.bottomRight())
+        gradient.setColorAt(0, QColor(start))
+        gradient.setColorAt(1, QColor(end))
+        painter.setBrush(QBrush(gradient))
+        painter.setPen(QPen(QColor(border), width))
+        painter.drawEllipse(rect)
+
+        font = QFont()
+        font.setPixelSize(self.size // 2)
+        font.setBold(True)
+        painter.setFont(font)
+        painter.setPen(QColor(self.emoji_color))
+        painter.drawText(QRectF(0, 0, self.size, self.size), Qt.AlignCenter, emoji)
+
+        overlay = self.overlays.get(state)
+        if overlay is not None:
+            self._draw_overlay(painter, rect, overlay, radius=self.size / 2)
+        painter.end()
+        return pixmap
+
+    @staticmethod
+    def _draw_overlay(painter, rect, overlay, radius):
+        border, width, fill = overlay
+        inner = rect.adjusted(width / 2, width / 2, -width / 2, -width / 2)
+        painter.setBrush(QBrush(QColor(*fill)))
+        painter.setPen(QPen(QColor(border), width))
+        painter.drawRoundedRect(inner, radius, radius)
+
+
+FOOD_LOOK = ItemLook(
+    FOOD_SIZE,
+    fallback={
+        "normal": (DARK_THEME['accent_green'], DARK_THEME['accent_blue'], DARK_THEME['accent_purple'], 3),
+        "hover": (DARK_THEME['accent_blue'], DARK_THEME['accent_green'], DARK_THEME['accent_blue'], 3),
+    },
+    overlays={
+        "selected": (DARK_THEME['accent_blue'], 4, (0, 212, 255, 50)),
+    },
+    emoji_color="white")
+
+POOP_LOOK = ItemLook(
+    POOP_SIZE,
+    fallback={
+        "normal": ("#8B4513", "#A0522D", "#654321", 2),
+        "hover": ("#A0522D", "#CD853F", DARK_THEME['error'], 2),
+    },
+    overlays={
+        "hover": (DARK_THEME['error'], 3, (239, 68, 68, 50)),
+    },
+    emoji_color="#8B4513")
+
+
+class LookMixin:
+    """Bascule d'un objet entre les états de son ItemLook"""
+
+    look = None
+
+    def _init_look(self):
+        self._base_pixmap = None
+        self._emoji = None
+        self._hovered = False
+        self._look_state = None
+
+    def _set_sprite(self, pixmap):
+        self._base_pixmap, self._emoji = pixmap, None
+        self._apply_look(force=True)
+
+    def _set_emoji(self, emoji):
+        self._base_pixmap, self._emoji = None, emoji
+        self._apply_look(force=True)
+
+    def _current_state(self):
+        if getattr(self, 'dragging', False):
+            return "selected"
+        return "hover" if self._hovered else "normal"
+
+    def _apply_look(self, force=False):
+        state = self._current_state()
+        if state == self._look_state and not force:
+            return
+        self._look_state = state
+        if self._base_pixmap is not None:
+            self.setPixmap(self.look.sprite(self._base_pixmap, state))
+        elif self._emoji is not None:
+            self.setPixmap(self.look.emoji(self._emoji, state))
+
+    def enterEvent(self, event):
+        """Effet visuel au survol"""
+        self._hovered = True
+        self._apply_look()
+
+    def leaveEvent(self, event):
+        """Retirer l'effet de survol"""
+        self._hovered = False
+        self._apply_look()
+
+
+class FoodItem(LookMixin, QLabel):
     food_removed = pyqtSignal(object)
+    food_moved = pyqtSignal(object)
+    food_visibility_changed = pyqtSignal(object)
+    sprite_pool = SpritePool('food', FOOD_SIZE)
+    look = FOOD_LOOK
     
     def __init__(self, image_path="", initial_pos=None):
         super().__init__()
         self.is_valid = False
-        self.setup_window()
-        self.load_food_sprite(image_path)
-        self.position_food(initial_pos)
         
         # Variables pour le drag
         self.dragging = False
         self.offset = QPoint()
         
+        self._init_look()
+        self.setup_window()
+        
         # Animation de spawn
         self.spawn_animation = QPropertyAnimation(self, b"windowOpacity")
         self.spawn_animation.setDuration(500)
         self.spawn_animation.setEasingCurve(QEasingCurve.OutBounce)
         
+        self.reset(image_path, initial_pos)
+    
+    def reset(self, image_path="", initial_pos=None):
+        """(Ré)initialise sprite, position et apparition (aussi à la sortie du pool)"""
+        self.is_valid = True
+        self.dragging = False
+        self._hovered = False
+        self.load_food_sprite(image_path)
+        self.position_food(initial_pos)
+        
+        # Durée de vie (0 = la nourriture attend d'être mangée)
+        lifetime = config_manager.get("food_lifetime_ms", FOOD_LIFETIME_MS)
+        if lifetime:
+            item_expiry.schedule(self, lifetime, self.expire)
+        
         if self.is_valid:
             self.animate_spawn()
     
+    def expire(self):
+        """Nourriture restée trop longtemps : retirée comme si elle était mangée"""
+        self.food_removed.emit(self)
+    
+    def recycle(self):
+        """Met la nourriture au repos avant son retour dans le pool"""
+        self.is_valid = False
+        item_expiry.cancel(self)
+        self.spawn_animation.stop()
+        self.dragging = False
+        self.hide()
+    
     def setup_window(self):
         """Configure la fenêtre de la nourriture"""
         self.setWindowFlags(
@@ -43,26 +224,17 @@ class FoodItem(QLabel):
         self.setToolTip("🍖 Clic et glisse pour déplacer la nourriture !")
     
     def load_food_sprite(self, image_path=""):
-        """Charge le sprite de nourriture"""
-        if not image_path:
-            # Choisir une nourriture aléatoire
-            food_dir = os.path.join(os.path.dirname(__file__), 'assets', 'food')
-            if os.path.exists(food_dir):
-                food_files = [f for f in os.listdir(food_dir) 
-                             if f.lower().endswith(('.png', '.jpg', '.jpeg', '.gif'))]
-                if food_files:
-                    image_path = os.path.join(food_dir, random.choice(food_files))
+        """Charge le sprite de nourriture depuis le pool partagé (aucune lecture disque)"""
+        name = image_path or self.sprite_pool.random_name()
+        pixmap = self.sprite_pool.get(name) if name else None
+        
+        if pixmap is not None:
+            self.image_name = name  # pour la sauvegarde du monde
+            self._set_sprite(pixmap)
+            self.is_valid = True
+            return
         
-        if image_path and os.path.exists(image_path):
-            original_pixmap = QPixmap(image_path)
-            if not original_pixmap.isNull():
-                scaled_pixmap = original_pixmap.scaled(
-                    FOOD_SIZE, FOOD_SIZE, 
-                    Qt.KeepAspectRatio, Qt.SmoothTransformation
-                )
-                self.setPixmap(scaled_pixmap)
-                self.is_valid = True
-                return
+        self.image_name = ""
         
         # Fallback : carré coloré avec effet moderne
         self.create_fallback_food()
@@ -73,37 +245,18 @@ class FoodItem(QLabel):
         food_emojis = ["🍖", "🍗", "🥩", "🦴", "🐟", "🍤"]
         emoji = random.choice(food_emojis)
         
-        self.setText(emoji)
-        self.setStyleSheet(f"""
-        QLabel {{
-            background: qlineargradient(x1:0, y1:0, x2:1, y2:1,
-                stop:0 {DARK_THEME['accent_green']}, 
-                stop:1 {DARK_THEME['accent_blue']});
-            border-radius: {FOOD_SIZE//2}px;
-            border: 3px solid {DARK_THEME['accent_purple']};
-            font-size: {FOOD_SIZE//2}px;
-            color: white;
-            font-weight: bold;
-        }}
-        QLabel:hover {{
-            border: 3px solid {DARK_THEME['accent_blue']};
-            background: qlineargradient(x1:0, y1:0, x2:1, y2:1,
-                stop:0 {DARK_THEME['accent_blue']}, 
-                stop:1 {DARK_THEME['accent_green']});
-        }}
-        """)
-        self.setAlignment(Qt.AlignCenter)
+        self._set_emoji(emoji)
     
     def position_food(self, initial_pos=None):
         """Positionne la nourriture sur l'écran"""
         if initial_pos:
             self.move(initial_pos)
         else:
-            screen_rect = QApplication.desktop().screenGeometry()
+            screen_rect = screen_geometry.random_screen()
             # Éviter les bords pour éviter que la nourriture soit hors écran
             margin = 50
-            x = random.randint(margin, screen_rect.width() - FOOD_SIZE - margin)
-            y = random.randint(margin, screen_rect.height() - FOOD_SIZE - margin)
+            x = screen_rect.left() + random.randint(margin, screen_rect.width() - FOOD_SIZE - margin)
+            y = screen_rect.top() + random.randint(margin, screen_rect.height() - FOOD_SIZE - margin)
             self.move(x, y)
     
     def animate_spawn(self):
@@ -122,25 +275,22 @@ class FoodItem(QLabel):
             self.raise_()  # Mettre au premier plan
             
             # Effet visuel de sélection
-            current_style = self.styleSheet()
-            self.setStyleSheet(current_style + f"""
-            QLabel {{
-                border: 4px solid {DARK_THEME['accent_blue']};
-                box-shadow: 0px 0px 15px {DARK_THEME['accent_blue']};
-                background-color: rgba(0, 212, 255, 50);
-            }}
-            """)
+            self._apply_look()
     
     def mouseMoveEvent(self, event):
         """Déplacement de la nourriture"""
         if self.dragging:
             new_pos = self.mapToGlobal(event.pos() - self.offset)
-            screen_rect = QApplication.desktop().screenGeometry()
+            cursor_pos = event.globalPos()
+            screen_rect = screen_geometry.screen_at(cursor_pos.x(), cursor_pos.y())
             
-            # Limiter aux bords de l'écran
-            x = max(0, min(new_pos.x(), screen_rect.width() - self.width()))
-            y = max(0, min(new_pos.y(), screen_rect.height() - self.height()))
+            # Limiter aux bords de l'écran sous le curseur
+            x = max(screen_rect.left(),
+                    min(new_pos.x(), screen_rect.left() + screen_rect.width() - self.width()))
+            y = max(screen_rect.top(),
+                    min(new_pos.y(), screen_rect.top() + screen_rect.height() - self.height()))
             self.move(x, y)
+            self.food_moved.emit(self)
     
     def mouseReleaseEvent(self, event):
         """Fin du drag"""
@@ -148,35 +298,63 @@ class FoodItem(QLabel):
             self.dragging = False
             
             # Retirer l'effet visuel de sélection
-            if hasattr(self, 'original_style'):
-                self.setStyleSheet(self.original_style)
-            else:
-                # Recréer le style de base
-                self.load_food_sprite()
+            self._apply_look()
 
-class PoopItem(QLabel):
+    def showEvent(self, event):
+        super().showEvent(event)
+        self.food_visibility_changed.emit(self)
+
+    def hideEvent(self, event):
+        super().hideEvent(event)
+        self.food_visibility_changed.emit(self)
+
+    # Interface attendue par la simulation (simulation.PetSimulation)
+    def sim_rect(self):
+        pos = self.pos()
+        return (pos.x(), pos.y(), self.width(), self.height())
+
+    def sim_visible(self):
+        return not self.isHidden()
+
+class PoopItem(LookMixin, QLabel):
     poop_removed = pyqtSignal(object)
+    sprite_pool = SpritePool('poop', POOP_SIZE)
+    look = POOP_LOOK
     
     def __init__(self, image_path="", initial_pos=None, near_pet=False, pet_pos=None):
         super().__init__()
         self.is_valid = False
+        self._init_look()
         self.setup_window()
-        self.load_poop_sprite(image_path)
-        self.position_poop(initial_pos, near_pet, pet_pos)
-        
-        # Timer pour la décomposition automatique
-        self.decay_timer = QTimer()
-        self.decay_timer.timeout.connect(self.auto_remove)
-        self.decay_timer.start(60000)  # Disparaît après 1 minute si pas nettoyé
         
         # Animation de spawn
         self.spawn_animation = QPropertyAnimation(self, b"windowOpacity")
         self.spawn_animation.setDuration(300)
         self.spawn_animation.setEasingCurve(QEasingCurve.OutCubic)
         
+        self.reset(image_path, initial_pos, near_pet, pet_pos)
+    
+    def reset(self, image_path="", initial_pos=None, near_pet=False, pet_pos=None):
+        """(Ré)initialise sprite, position, décomposition et apparition"""
+        self.is_valid = True
+        self._hovered = False
+        self.load_poop_sprite(image_path)
+        self.position_poop(initial_pos, near_pet, pet_pos)
+        
+        # Décomposition automatique si pas nettoyé (timer partagé)
+        item_expiry.schedule(self, config_manager.get("poop_lifetime_ms", POOP_LIFETIME_MS),
+                             self.auto_remove)
+        
         if self.is_valid:
             self.animate_spawn()
     
+    def recycle(self):
+        """Met le poop au repos avant son retour dans le pool"""
+        self.is_valid = False
+        item_expiry.cancel(self)
+        self.spawn_animation.stop()
+        self.hide()
+    
     def setup_window(self):
         """Configure la fenêtre du poop"""
         self.setWindowFlags(
@@ -191,26 +369,17 @@ class PoopItem(QLabel):
         self.setToolTip("💩 Clic pour nettoyer !")
     
     def load_poop_sprite(self, image_path=""):
-        """Charge le sprite de poop"""
-        if not image_path:
-            # Choisir un poop aléatoire
-            poop_dir = os.path.join(os.path.dirname(__file__), 'assets', 'poop')
-            if os.path.exists(poop_dir):
-                poop_files = [f for f in os.listdir(poop_dir)
-                             if f.lower().endswith(('.png', '.jpg', '.jpeg', '.gif'))]
-                if poop_files:
-                    image_path = os.path.join(poop_dir, random.choice(poop_files))
+        """Charge le sprite de poop depuis le pool partagé (aucune lecture disque)"""
+        name = image_path or self.sprite_pool.random_name()
+        pixmap = self.sprite_pool.get(name) if name else None
+        
+        if pixmap is not None:
+            self.image_name = name  # pour la sauvegarde du monde
+            self._set_sprite(pixmap)
+            self.is_valid = True
+            return
         
-        if image_path and os.path.exists(image_path):
-            original_pixmap = QPixmap(image_path)
-            if not original_pixmap.isNull():
-                scaled_pixmap = original_pixmap.scaled(
-                    POOP_SIZE, POOP_SIZE,
-                    Qt.KeepAspectRatio, Qt.SmoothTransformation
-                )
-                self.setPixmap(scaled_pixmap)
-                self.is_valid = True
-                return
+        self.image_name = ""
         
         # Fallback : emoji poop
         self.create_fallback_poop()
@@ -221,23 +390,7 @@ class PoopItem(QLabel):
         poop_emojis = ["💩", "💨", "🟤"]
         emoji = random.choice(poop_emojis)
         
-        self.setText(emoji)
-        self.setStyleSheet(f"""
-        QLabel {{
-            background: qlineargradient(x1:0, y1:0, x2:1, y2:1,
-                stop:0 #8B4513, stop:1 #A0522D);
-            border-radius: {POOP_SIZE//2}px;
-            border: 2px solid #654321;
-            font-size: {POOP_SIZE//2}px;
-            color: #8B4513;
-        }}
-        QLabel:hover {{
-            border: 2px solid {DARK_THEME['error']};
-            background: qlineargradient(x1:0, y1:0, x2:1, y2:1,
-                stop:0 #A0522D, stop:1 #CD853F);
-        }}
-        """)
-        self.setAlignment(Qt.AlignCenter)
+        self._set_emoji(emoji)
     
     def position_poop(self, initial_pos=None, near_pet=False, pet_pos=None):
         """Positionne le poop sur l'écran"""
@@ -251,18 +404,20 @@ class PoopItem(QLabel):
             x = pet_pos.x() + offset_x
             y = pet_pos.y() + offset_y
             
-            # S'assurer qu'on reste dans l'écran
-            screen_rect = QApplication.desktop().screenGeometry()
-            x = max(0, min(x, screen_rect.width() - POOP_SIZE))
-            y = max(0, min(y, screen_rect.height() - POOP_SIZE))
+            # S'assurer qu'on reste dans l'écran de l'animal
+            screen_rect = screen_geometry.screen_at(pet_pos.x(), pet_pos.y())
+            x = max(screen_rect.left(),
+                    min(x, screen_rect.left() + screen_rect.width() - POOP_SIZE))
+            y = max(screen_rect.top(),
+                    min(y, screen_rect.top() + screen_rect.height() - POOP_SIZE))
             
             self.move(x, y)
         else:
             # Position aléatoire
-            screen_rect = QApplication.desktop().screenGeometry()
+            screen_rect = screen_geometry.random_screen()
             margin = 30
-            x = random.randint(margin, screen_rect.width() - POOP_SIZE - margin)
-            y = random.randint(margin, screen_rect.height() - POOP_SIZE - margin)
+            x = screen_rect.left() + random.randint(margin, screen_rect.width() - POOP_SIZE - margin)
+            y = screen_rect.top() + random.randint(margin, screen_rect.height() - POOP_SIZE - margin)
             self.move(x, y)
     
     def animate_spawn(self):
@@ -282,9 +437,9 @@ class PoopItem(QLabel):
         """Nettoie le poop"""
         print(f"🧹 [PoopItem] clean_poop() appelé pour {self}")
         
-        # Arrêter le timer de décomposition
-        self.decay_timer.stop()
-        print("   ⏱️ Timer de décomposition arrêté")
+        # Annuler la décomposition
+        item_expiry.cancel(self)
+        print("   ⏱️ Décomposition annulée")
         
         # Émettre directement le signal au lieu de faire une animation qui bug
         print("   📡 Émission du signal poop_removed")
@@ -297,24 +452,8 @@ class PoopItem(QLabel):
     def auto_remove(self):
         """Suppression automatique après expiration"""
         print(f"⏰ [PoopItem] auto_remove() appelé pour {self}")
-        self.decay_timer.stop()
-        print("   ⏱️ Timer de décomposition arrêté")
         print("   📡 Émission du signal poop_removed")
         self.poop_removed.emit(self)
-    
-    def enterEvent(self, event):
-        """Effet visuel au survol"""
-        self.setStyleSheet(self.styleSheet() + f"""
-        QLabel {{
-            border: 3px solid {DARK_THEME['error']};
-            background-color: rgba(239, 68, 68, 50);
-        }}
-        """)
-    
-    def leaveEvent(self, event):
-        """Retirer l'effet de survol"""
-        # Recréer le style de base
-        self.create_fallback_poop()
 
 class InteractiveItem(QLabel):
     """Classe de base pour des objets interactifs personnalisés"""
@@ -380,6 +519,58 @@ class InteractiveItem(QLabel):
         painter.setPen(QPen(QColor(DARK_THEME['text_primary']), 2))
         painter.drawRoundedRect(5, 5, self.item_size-10, self.item_size-10, 10, 10)
 
+class ItemPool:
+    """Widgets d'objets cachés, gardés pour être réutilisés au lieu d'être
+    détruits puis recréés (fenêtres natives coûteuses).
+
+    Les objets doivent exposer reset(*args) et recycle(). `on_create(item)`
+    est appelé une seule fois par widget réellement créé (connexions).
+    """
+
+    def __init__(self, item_class, max_size=ITEM_POOL_SIZE, on_create=None):
+        self.item_class = item_class
+        self.max_size = max_size
+        self.on_create = on_create
+        self._idle = []
+        self.stats = Counter()
+
+    def __len__(self):
+        return len(self._idle)
+
+    def acquire(self, *args, **kwargs):
+        """Objet prêt et affiché, réutilisé si possible"""
+        if self._idle:
+            item = self._idle.pop()
+            item.reset(*args, **kwargs)
+            self.stats["reused"] += 1
+            return item
+
+        item = self.item_class(*args, **kwargs)
+        self.stats["created"] += 1
+        if self.on_create is not None:
+            self.on_create(item)
+        return item
+
+    def release(self, item):
+        """Cache l'objet et le garde pour plus tard (ou le détruit si le pool est plein)"""
+        if any(idle is item for idle in self._idle):
+            return
+        item.recycle()
+        if len(self._idle) < self.max_size:
+            self._idle.append(item)
+            self.stats["released"] += 1
+        else:
+            item.deleteLater()
+            self.stats["destroyed"] += 1
+
+    def clear(self):
+        """Détruit les objets au repos"""
+        for item in self._idle:
+            item.deleteLater()
+        self.stats["destroyed"] += len(self._idle)
+        self._idle.clear()
+
+
 # Classes utilitaires pour les collections d'objets
 class ItemManager:
     """Gestionnaire pour tous les objets interactifs"""
@@ -388,10 +579,12 @@ class ItemManager:
         self.food_items = []
         self.poop_items = []
         self.special_items = []
+        self.food_pool = ItemPool(FoodItem)
+        self.poop_pool = ItemPool(PoopItem)
     
     def add_food(self, pos=None):
         """Ajoute un élément de nourriture"""
-        food = FoodItem(initial_pos=pos)
+        food = self.food_pool.acquire(initial_pos=pos)
         if food.is_valid:
             self.food_items.append(food)
             return food
@@ -399,7 +592,7 @@ class ItemManager:
     
     def add_poop(self, pos=None, near_pet=False, pet_pos=None):
         """Ajoute un poop"""
-        poop = PoopItem(initial_pos=pos, near_pet=near_pet, pet_pos=pet_pos)
+        poop = self.poop_pool.acquire(initial_pos=pos, near_pet=near_pet, pet_pos=pet_pos)
         if poop.is_valid:
             self.poop_items.append(poop)
             return poop
@@ -408,15 +601,13 @@ class ItemManager:
     def remove_food(self, food_item):
         """Supprime un élément de nourriture"""
         if food_item in self.food_items:
-            food_item.hide()
-            food_item.deleteLater()
+            self.food_pool.release(food_item)
             self.food_items.remove(food_item)
     
     def remove_poop(self, poop_item):
         """Supprime un poop"""
         if poop_item in self.poop_items:
-            poop_item.hide()
-            poop_item.deleteLater()
+            self.poop_pool.release(poop_item)
             self.poop_items.remove(poop_item)
     
     def clear_all_food(self):
@@ -9,6 +9,10 @@ Version: 2.0
 
 import sys
 import os
+
+# Le traceur doit être importé avant le reste pour mesurer les imports
+from startup_trace import startup_tracer
+
 from PyQt5.QtWidgets import QApplication, QMessageBox
 from PyQt5.QtCore import Qt, QTimer
 from PyQt5.QtGui import QIcon, QFont
@@ -59,31 +63,25 @@ def check_dependencies():
     return True
 
 def check_assets():
-    """Vérifie que les assets nécessaires sont présents"""
-    base_dir = os.path.dirname(__file__)
+    """Vérifie que les assets nécessaires sont présents (dossiers ou assets.pack)"""
+    from asset_pack import asset_source
     
     # Dossiers requis
-    required_dirs = [
-        os.path.join(base_dir, 'assets', 'cat'),
-        os.path.join(base_dir, 'assets', 'dog')
-    ]
+    required_dirs = ['cat', 'dog']
     
     # Dossiers optionnels mais recommandés
-    optional_dirs = [
-        os.path.join(base_dir, 'assets', 'food'),
-        os.path.join(base_dir, 'assets', 'poop')
-    ]
+    optional_dirs = ['food', 'poop']
     
     missing_required = []
     missing_optional = []
     
-    for dir_path in required_dirs:
-        if not os.path.exists(dir_path) or not os.path.isdir(dir_path):
-            missing_required.append(dir_path)
+    for dir_name in required_dirs:
+        if not asset_source.has_dir(dir_name):
+            missing_required.append(asset_source.path(dir_name))
     
-    for dir_path in optional_dirs:
-        if not os.path.exists(dir_path) or not os.path.isdir(dir_path):
-            missing_optional.append(dir_path)
+    for dir_name in optional_dirs:
+        if not asset_source.has_dir(dir_name):
+            missing_optional.append(asset_source.path(dir_name))
     
     if missing_required:
         print("❌ Dossiers d'assets requis manquants:")
@@ -232,22 +230,28 @@ def main():
     print(f"🐱 Animal: {config_manager.get('pet_name', 'Minou')}")
     
     # Vérifications préliminaires
-    if not check_dependencies():
+    with startup_tracer.phase("check_dependencies"):
+        dependencies_ok = check_dependencies()
+    if not dependencies_ok:
         print("❌ Dépendances manquantes. Installation requise.")
         return 1
     
-    if not check_assets():
+    with startup_tracer.phase("check_assets"):
+        assets_ok = check_assets()
+    if not assets_ok:
         print("❌ Assets manquants. Vérifiez le dossier assets/.")
         return 1
     
     # Configuration de l'application
-    app = setup_application()
+    with startup_tracer.phase("setup_application"):
+        app = setup_application()
     setup_error_handlers()
     
     try:
         # Création de l'animal de compagnie
         print("🎮 Création de l'animal virtuel...")
-        pet = MinouPet()
+        with startup_tracer.phase("MinouPet"):
+            pet = MinouPet()
         
         # Tâches de démarrage
         create_startup_timer(pet)
@@ -268,6 +272,9 @@ def main():
         print("💬 Double-clic sur l'icône système pour ouvrir le chat")
         print("⚙️ Utilisez le menu système pour configurer l'IA et les paramètres")
         
+        # Répartition du démarrage (--trace-startup / MINOU_TRACE_STARTUP)
+        startup_tracer.report()
+        
         # Lancement de la boucle principale
         return app.exec_()
         
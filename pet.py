@@ -4,38 +4,46 @@ Classe principale Minou - Animal de compagnie virtuel intelligent
 import sys
 import os
 import random
-import math
 from PyQt5.QtWidgets import (QWidget, QLabel, QApplication, QSystemTrayIcon, 
                              QMenu, QAction, QStyle)
-from PyQt5.QtGui import QPixmap, QTransform, QIcon
+from PyQt5.QtGui import QPixmap
 from PyQt5.QtCore import Qt, QTimer, QPoint
 from PyQt5.QtMultimedia import QMediaPlayer, QMediaContent
 from PyQt5.QtCore import QUrl
 
 
-from config import (CAT_WIDTH, CAT_HEIGHT, ANIMATION_FRAME_RATE, MOVEMENT_SPEED,
-                    MOVEMENT_CHANGE_DELAY, RUN_SPEED_MULTIPLIER, CLICK_THRESHOLD,
-                    JUMP_INITIAL_VELOCITY, GRAVITY, DEAD_ANIMATION_THRESHOLD,
-                    ANIMATION_FRAMES, config_manager, SettingsDialog)
+from config import (CAT_WIDTH, CAT_HEIGHT, ANIMATION_FRAME_RATE, MOVEMENT_CHANGE_DELAY,
+                    CLICK_THRESHOLD, DEAD_ANIMATION_THRESHOLD, ANIMATION_FRAMES,
+                    FRAME_INTERVAL, ITEM_POOL_SIZE, ITEM_MIN_SPACING, FOOD_SIZE, POOP_SIZE,
+                    SPRITE_MEMORY_BUDGET_MB,
+                    config_manager, SettingsDialog)
 
 from ui_components import ControlBox, SpeechBubble, MinimalChatInterface
+from bubbles import BubbleScheduler
 from ai_manager import ConversationThread, gemini_ai
-from items import FoodItem, PoopItem
+from items import FoodItem, PoopItem, ItemPool
+from asset_pack import asset_source
+from startup_trace import startup_tracer
+from frame_clock import FrameClock
+from screens import screen_geometry
+from simulation import PetSimulation
+from spatial import poisson_disk_points
+from expiry import item_expiry
+from world_state import world_store
+from sprites import (AnimationFrames, AssetWatcher, SpriteLoader,
+                     decode_animation, load_cached_sprites, sprite_paths,
+                     sprite_store)
 from utils import (reminder_manager, system_monitor, message_generator, 
                    notes_manager, get_system_info)
 
 class MinouPet(QWidget):
     def __init__(self):
         super().__init__()
-        self.init_window()
-        self.init_variables()
-        self.init_ui_components()
-        self.init_timers()
-        self.init_audio()
-        self.init_tray_menu()
-        self.load_assets()
-        self.setup_connections()
-        self.start_pet()
+        for step in (self.init_window, self.init_variables, self.init_ui_components,
+                     self.init_timers, self.init_audio, self.init_tray_menu,
+                     self.load_assets, self.setup_connections, self.start_pet):
+            with startup_tracer.phase(step.__name__):
+                step()
 
     def init_window(self):
         """Initialise la fenêtre principale"""
@@ -50,40 +58,27 @@ class MinouPet(QWidget):
         # Animation et sprites
         self.current_asset_type = config_manager.get("pet_type", "cat")
         self.sprites = {}
-        self.current_animation = 'Idle'
+        self.sprite_loader = None
+        self.asset_watcher = None
         self.current_frame_index = 0
         
-        # Position et mouvement
-        self._current_x = 0.0
-        self._current_y = 0.0
-        self.cat_velocity_x = 0.0
-        self.cat_velocity_y = 0.0
-        self.moving_right = True
-        
-        # États
-        self.is_dead = False
-        self.is_playing_one_shot_animation = False
-        self._is_jumping = False
-        self._is_manual_moving = False
-        self.is_edge_running = False
-        self.is_sliding = False
-        self.dragging = False
-        self.quiet_mode = False  # AJOUT : Mode tranquille
+        # État, physique et comportement : ce widget n'en est que le rendu
+        self.sim = PetSimulation(bounds=self._sim_bounds, listener=self._on_sim_event)
+        
+        # Rendu du mouvement, mis en veille quand rien ne bouge
+        self.movement_interval = config_manager.get("movement_frame_interval", FRAME_INTERVAL)
+        self.adaptive_movement = config_manager.get("adaptive_movement_tick", True)
         
         # Interactions
-        self._click_count = 0
         self.offset = QPoint()
         self.mouse_press_pos = QPoint()
         
-        # Objets et cibles
-        self.active_food_items = []
+        # Objets (la nourriture suivie par l'animal est dans self.sim.foods),
+        # recyclés par des pools plutôt que détruits
         self.active_poop_items = []
-        self.target_food_item = None
-        
-        # Cibles pour mouvements spéciaux
-        self.target_x = 0
-        self.target_y = 0
-        self.slide_target_pos = QPoint()
+        pool_size = config_manager.get("item_pool_size", ITEM_POOL_SIZE)
+        self.food_pool = ItemPool(FoodItem, pool_size, on_create=self._connect_food)
+        self.poop_pool = ItemPool(PoopItem, pool_size, on_create=self._connect_poop)
         
         # Composants UI
         self.control_box = None
@@ -100,8 +95,9 @@ class MinouPet(QWidget):
         self.pet_label.setGeometry(0, 0, CAT_WIDTH, CAT_HEIGHT)
         self.pet_label.setAlignment(Qt.AlignCenter)
         
-        # Bulle de dialogue
+        # Bulle de dialogue et file d'attente de ses messages
         self.speech_bubble = SpeechBubble()
+        self.bubble_scheduler = BubbleScheduler(self.speech_bubble, self._display_bubble, self)
         
         # Interface de chat minimaliste
         self.chat_interface = MinimalChatInterface()
@@ -109,17 +105,19 @@ class MinouPet(QWidget):
 
     def init_timers(self):
         """Initialise tous les timers"""
-        # Timer d'animation (change les frames)
-        self.animation_timer = QTimer(self)
-        self.animation_timer.timeout.connect(self._next_frame)
+        # Horloge unique pour l'animation, le mouvement et le tray
+        self.frame_clock = FrameClock(FRAME_INTERVAL, self)
+        
+        # Animation (change les frames)
+        self.animation_timer = self.frame_clock.subscribe(self._next_frame, "animation")
         
-        # Timer de mouvement (met à jour la position)
-        self.movement_timer = QTimer(self)
-        self.movement_timer.timeout.connect(self._update_position)
+        # Mouvement (met à jour la position)
+        self.movement_timer = self.frame_clock.subscribe(self._update_position, "movement")
         
-        # Timer de comportement aléatoire
-        self.random_behavior_timer = QTimer(self)
-        self.random_behavior_timer.timeout.connect(self._random_movement)
+        # Réveil pour le prochain timer de la simulation pendant la veille
+        self._sim_wake_timer = QTimer(self)
+        self._sim_wake_timer.setSingleShot(True)
+        self._sim_wake_timer.timeout.connect(self._update_position)
         
         # Timer pour les messages aléatoires
         self.random_message_timer = QTimer(self)
@@ -128,11 +126,6 @@ class MinouPet(QWidget):
         # Timer pour spawn automatique de poop
         self.poop_spawn_timer = QTimer(self)
         self.poop_spawn_timer.timeout.connect(self._spawn_random_poop)
-        
-        # Timer cooldown après mort
-        self._dead_animation_cooldown_timer = QTimer(self)
-        self._dead_animation_cooldown_timer.setSingleShot(True)
-        self._dead_animation_cooldown_timer.timeout.connect(self._dead_animation_cooldown_finished)
 
     def init_audio(self):
         """Initialise le système audio"""
@@ -173,6 +166,10 @@ class MinouPet(QWidget):
         add_food_action.triggered.connect(self.add_random_food)
         food_menu.addAction(add_food_action)
         
+        feast_action = QAction("Festin ! (x20)", self)
+        feast_action.triggered.connect(lambda: self.spawn_food(20))
+        food_menu.addAction(feast_action)
+        
         clear_food_action = QAction("Nettoyer nourriture", self)
         clear_food_action.triggered.connect(self.clear_all_food)
         food_menu.addAction(clear_food_action)
@@ -249,8 +246,10 @@ class MinouPet(QWidget):
         
         # Animation de l'icône tray
         self.tray_icon_current_frame_index = 0
-        self.tray_animation_timer = QTimer(self)
-        self.tray_animation_timer.timeout.connect(self._update_tray_icon_animation)
+        self._current_tray_icon = None
+        self._tray_icon_extent = None
+        self.tray_animation_timer = self.frame_clock.subscribe(
+            self._update_tray_icon_animation, "tray")
 
     def setup_connections(self):
         """Configure toutes les connexions de signaux"""
@@ -258,24 +257,40 @@ class MinouPet(QWidget):
         reminder_manager.reminder_triggered.connect(self._show_reminder)
         system_monitor.alert_triggered.connect(self._show_system_alert)
         
+        # Ramener l'animal si un écran disparaît ou change de taille
+        screen_geometry.changed.connect(self._on_screens_changed)
+        
+        # Ne pas laisser le chargement des sprites tourner à la fermeture
+        QApplication.instance().aboutToQuit.connect(self._stop_sprite_loader)
+        
+        # Dernière sauvegarde du monde en quittant
+        QApplication.instance().aboutToQuit.connect(self._save_world_now)
+        
         # AJOUT: Démarrer la surveillance depuis le thread principal
         reminder_manager.start_monitoring()
         system_monitor.start_monitoring()
 
     def load_assets(self):
         """Charge tous les assets (sprites, audio, etc.)"""
+        if config_manager.get("asset_hot_reload", False):
+            self.asset_watcher = AssetWatcher(sprite_store, self)
+            self.asset_watcher.frame_reloaded.connect(self._on_frame_reloaded)
+        
         self.change_pet_type(self.current_asset_type)
-        self._set_initial_position()
+        
+        # Reprendre le monde de la dernière session avant le premier affichage
+        if not self._restore_world():
+            self._set_initial_position()
 
     def start_pet(self):
         """Démarre tous les timers et affiche l'animal"""
         # Démarrage des timers principaux
-        self.animation_timer.start(config_manager.get("animation_speed", ANIMATION_FRAME_RATE))
-        self.movement_timer.start(16)  # ~60 FPS
+        self._start_animation_timer()
+        self.movement_timer.start(self.movement_interval)  # ~60 FPS par défaut
         
         # CORRECTION : Premier intervalle aléatoire plus long
         initial_behavior_delay = random.randint(15000, 45000)  # 15-45 secondes
-        self.random_behavior_timer.start(initial_behavior_delay)
+        self.sim.start_behavior(initial_behavior_delay)
         
         # Poop encore moins fréquent
         self.poop_spawn_timer.start(random.randint(60000, 120000))  # 1-2 minutes
@@ -290,6 +305,14 @@ class MinouPet(QWidget):
         if config_manager.get("sound_enabled", True):
             self.audio_play_timer.start(random.randint(90000, 180000))  # 1.5-3 minutes
         
+        # Mode tranquille repris de la dernière session
+        if self.sim.quiet_mode:
+            self.sim.stop_behavior()
+            self.poop_spawn_timer.stop()
+            self.random_message_timer.stop()
+            self.audio_play_timer.stop()
+            QTimer.singleShot(random.randint(30000, 60000), self._check_activity)
+        
         # Animation du tray
         self.tray_animation_timer.start(ANIMATION_FRAME_RATE * 2)
         
@@ -301,35 +324,88 @@ class MinouPet(QWidget):
         user_name = config_manager.get("user_name", "theTigerFox")
         pet_name = config_manager.get("pet_name", "Minou")
         welcome_msg = f"Coucou {user_name} ! {pet_name} est là ! 😸✨"
-        self.show_bubble(welcome_msg, "love", 4000)
+        self.show_bubble(welcome_msg, "love", 4000, "chat", "welcome")
         
     def _load_sprites(self):
-        """Charge tous les sprites pour le type d'animal actuel"""
-        all_sprites = {}
-        asset_dir = os.path.join(os.path.dirname(__file__), 'assets', self.current_asset_type)
-        
-        if not os.path.exists(asset_dir):
-            print(f"❌ Dossier assets manquant: {asset_dir}")
+        """Charge les sprites pour le type d'animal actuel.
+
+        Les animations déjà en mémoire viennent du sprite_store. Sinon, tout
+        est lu depuis le cache disque s'il est valide ; à défaut Idle est
+        décodé immédiatement et le reste arrive depuis le SpriteLoader.
+        """
+        self._stop_sprite_loader()
+        pet_type = self.current_asset_type
+        
+        if not asset_source.has_dir(pet_type):
+            print(f"❌ Dossier assets manquant: {asset_source.path(pet_type)}")
             return {}
         
-        for anim_name, num_frames in ANIMATION_FRAMES.items():
-            all_sprites[anim_name] = []
-            for i in range(1, num_frames + 1):
-                sprite_path = os.path.join(asset_dir, f'{anim_name} ({i}).png')
-                try:
-                    pixmap = QPixmap(sprite_path)
-                    if not pixmap.isNull():
-                        scaled_pixmap = pixmap.scaled(
-                            CAT_WIDTH, CAT_HEIGHT, 
-                            Qt.KeepAspectRatio, Qt.SmoothTransformation
-                        )
-                        all_sprites[anim_name].append(scaled_pixmap)
-                    else:
-                        print(f"⚠️ Sprite manquant: {sprite_path}")
-                except Exception as e:
-                    print(f"❌ Erreur chargement sprite {sprite_path}: {e}")
-        
-        return all_sprites
+        dpr = QApplication.primaryScreen().devicePixelRatio()
+        if self.asset_watcher:
+            self.asset_watcher.watch(pet_type, CAT_WIDTH, CAT_HEIGHT, dpr)
+        
+        sprite_store.pin(pet_type)
+        sprites = sprite_store.animations(pet_type)
+        if len(sprites) == len(ANIMATION_FRAMES):
+            return sprites
+        
+        frames = load_cached_sprites(pet_type, CAT_WIDTH, CAT_HEIGHT, dpr) or {}
+        paths = sprite_paths(pet_type)
+        missing = [anim_name for anim_name in paths
+                   if anim_name not in frames and anim_name not in sprites]
+        
+        if missing:
+            # Idle d'abord sur le thread GUI, le reste en arrière-plan
+            if 'Idle' in missing:
+                frames['Idle'] = decode_animation(paths['Idle'], CAT_WIDTH, CAT_HEIGHT, dpr,
+                                                  f"{pet_type}/Idle")
+            
+            loader = SpriteLoader(pet_type, CAT_WIDTH, CAT_HEIGHT, dpr,
+                                  frames, sprites.keys(), self)
+            loader.animation_loaded.connect(self._on_animation_loaded)
+            loader.finished.connect(lambda: self._on_sprite_loader_finished(loader))
+            loader.finished.connect(loader.deleteLater)
+            self.sprite_loader = loader
+            loader.start()
+        
+        for anim_name, images in frames.items():
+            if anim_name not in sprites:
+                sprites[anim_name] = AnimationFrames(QPixmap.fromImage(image) for image in images)
+                sprite_store.put(pet_type, anim_name, sprites[anim_name])
+        
+        return sprites
+    
+    def _on_animation_loaded(self, pet_type, anim_name, images):
+        """Convertit en QPixmap une animation décodée en arrière-plan"""
+        if self.sender() is not self.sprite_loader or pet_type != self.current_asset_type:
+            return
+        
+        self.sprites[anim_name] = AnimationFrames(QPixmap.fromImage(image) for image in images)
+        sprite_store.put(pet_type, anim_name, self.sprites[anim_name])
+        self._sync_frame_counts()
+    
+    def _on_frame_reloaded(self, pet_type, anim_name, frame_index):
+        """Affiche immédiatement une frame rechargée à chaud si elle est visible"""
+        if pet_type != self.current_asset_type:
+            return
+        
+        if anim_name == self.sim.animation and frame_index == self.current_frame_index:
+            self._update_sprite_display()
+        if anim_name == 'Idle':
+            self._current_tray_icon = None
+    
+    def _on_sprite_loader_finished(self, loader):
+        """Oublie le SpriteLoader terminé (il se libère via deleteLater)"""
+        if loader is self.sprite_loader:
+            self.sprite_loader = None
+    
+    def _stop_sprite_loader(self):
+        """Interrompt le chargement en arrière-plan en cours et libère le thread"""
+        if self.sprite_loader:
+            self.sprite_loader.requestInterruption()
+            self.sprite_loader.wait()
+            self.sprite_loader.deleteLater()
+        self.sprite_loader = None
     
     def _load_audio_file(self, pet_type):
         """Charge le fichier audio pour le type d'animal"""
@@ -351,10 +427,11 @@ class MinouPet(QWidget):
         
         # Charger les nouveaux sprites
         self.sprites = self._load_sprites()
+        self._sync_frame_counts()
         self.audio_files[self.current_asset_type] = self._load_audio_file(self.current_asset_type)
         
         if self.sprites:
-            self._set_animation('Idle')
+            self.sim.set_animation('Idle')
             self._update_tray_icon_animation()
             print(f"✅ Changement vers {pet_type} réussi")
         else:
@@ -362,41 +439,137 @@ class MinouPet(QWidget):
             # Retour au chat par défaut
             self.current_asset_type = 'cat'
             self.sprites = self._load_sprites()
+            self._sync_frame_counts()
     
     def _set_initial_position(self):
-        """Place l'animal à une position aléatoire sur l'écran"""
-        screen_rect = QApplication.desktop().screenGeometry()
+        """Place l'animal à une position aléatoire sur l'écran principal"""
+        screen_rect = screen_geometry.primary()
         max_x = screen_rect.width() - self.width()
         max_y = screen_rect.height() - self.height()
         
-        self._current_x = float(random.randint(100, max(200, max_x - 100)))
-        self._current_y = float(random.randint(100, max(200, max_y - 100)))
-        self.move(int(self._current_x), int(self._current_y))
+        self.sim.place(screen_rect.left() + random.randint(100, max(200, max_x - 100)),
+                       screen_rect.top() + random.randint(100, max(200, max_y - 100)))
+        self.move(int(self.sim.x), int(self.sim.y))
     
-    def _set_animation(self, animation_name):
-        """Change l'animation actuelle"""
-        if (self.is_playing_one_shot_animation and 
-            animation_name != self.current_animation and 
-            animation_name != 'Dead'):
-            return
+    def _restore_world(self):
+        """Reprend l'animal, la nourriture et les poops sauvegardés ; False
+        s'il n'y a rien à reprendre"""
+        state = world_store.load()
+        if state is None:
+            return False
+        
+        pet_state = state["pet"]
+        if not self._on_a_screen(pet_state["x"] + self.width() // 2,
+                                 pet_state["y"] + self.height() // 2):
+            return False
+        self.sim.restore(pet_state)
+        self.move(int(self.sim.x), int(self.sim.y))
+        if self.sim.quiet_mode:
+            self.stay_quiet_action.setText("😸 Reprendre activité")
         
-        if (animation_name not in self.sprites or 
-            not self.sprites[animation_name]):
-            animation_name = 'Idle'
+        for x, y, name, ttl in state.get("food", []):
+            if self._on_a_screen(x, y):
+                food_item = self.food_pool.acquire(name, QPoint(x, y))
+                self.sim.add_food(food_item)
+                if ttl is not None:
+                    item_expiry.schedule(food_item, ttl, food_item.expire)
+        
+        for x, y, name, ttl in state.get("poop", []):
+            if self._on_a_screen(x, y):
+                poop_item = self.poop_pool.acquire(name, QPoint(x, y))
+                self.active_poop_items.append(poop_item)
+                if ttl is not None:
+                    item_expiry.schedule(poop_item, ttl, poop_item.auto_remove)
+        
+        print(f"🌍 Monde restauré ({len(self.sim.foods)} nourritures, "
+              f"{len(self.active_poop_items)} poops, lu en {world_store.load_ms:.2f} ms)")
+        return True
+    
+    @staticmethod
+    def _on_a_screen(x, y):
+        return screen_geometry.screen_at(int(x), int(y)).contains(int(x), int(y))
+    
+    def _world_snapshot(self):
+        """Instantané du monde pour world_store"""
+        return {"pet": self.sim.snapshot(),
+                "food": [self._item_state(food_item) for food_item in self.sim.foods],
+                "poop": [self._item_state(poop_item) for poop_item in self.active_poop_items]}
+    
+    @staticmethod
+    def _item_state(item):
+        pos = item.pos()
+        ttl = item_expiry.remaining(item)
+        return [pos.x(), pos.y(), item.image_name, None if ttl is None else int(ttl)]
+    
+    def _world_changed(self):
+        """Sauvegarde différée après un changement (les rafales sont regroupées)"""
+        world_store.save_later(self._world_snapshot)
+    
+    def _save_world_now(self):
+        world_store.close(self._world_snapshot)
+    
+    def _start_animation_timer(self):
+        """Démarre l'animation ; l'horloge arrondit l'intervalle à son tick,
+        et la simulation cale la durée des animations uniques sur cet intervalle réel"""
+        self.animation_timer.start(config_manager.get("animation_speed", ANIMATION_FRAME_RATE))
+        self.sim.frame_interval_ms = self.animation_timer.interval()
+    
+    def _sync_frame_counts(self):
+        """Durées des animations uniques de la simulation selon les sprites chargés"""
+        self.sim.frame_counts = {name: len(frames) for name, frames in self.sprites.items()}
+    
+    def _sim_bounds(self, x, y):
+        """Zone de déplacement (gauche, haut, largeur, hauteur) autour d'un point"""
+        return screen_geometry.area_at(x, y).getRect()
+    
+    def _on_screens_changed(self):
+        """Ramène l'animal dans les nouveaux écrans, hors du pas fixe de la physique"""
+        self.sim.clamp_to(self.sim.area())
+        self._render_position(1.0)
+    
+    def _on_sim_event(self, event, *args):
+        """Traduit les événements de la simulation en effets Qt"""
+        if event == "wake":
+            if self.sim.is_dead:
+                # Pas de boucle de mouvement pour un animal mort : seuls ses timers
+                self._sleep_movement()
+            else:
+                self._wake_movement()
+            return
         
-        if self.current_animation != animation_name:
-            self.current_animation = animation_name
+        self._world_changed()
+        if event == "animation":
             self.current_frame_index = 0
             self._update_sprite_display()
+        elif event == "bubble":
+            self.show_bubble(*args, priority="chat", source="meal")
+        elif event == "food_eaten":
+            food_item = args[0]
+            food_item.food_removed.emit(food_item)
+        elif event == "one_shot_finished":
+            if (config_manager.get("sound_enabled", True) and 
+                self.media_player.state() == QMediaPlayer.StoppedState and 
+                not self.sim.is_dead):
+                self.audio_play_timer.start(random.randint(60000, 300000))  # 1-5min
+        elif event == "died":
+            self._sleep_movement()
+            self.audio_play_timer.stop()
+            self.media_player.stop()
+        
+            # Message dramatique
+            pet_name = config_manager.get("pet_name", "Minou")
+            self.show_bubble(f"{pet_name} est K.O. ! 💀", "alert", 5000, "chat", "click")
+        elif event == "dead_frame_reached":
+            self._reached_last_dead_frame()
     
     def _next_frame(self):
         """Passe à la frame suivante de l'animation"""
-        sprites = self.sprites.get(self.current_animation)
+        sprites = self.sprites.get(self.sim.animation)
         if not sprites:
             return
         
         # Animation de mort : arrêter à la dernière frame
-        if (self.current_animation == 'Dead' and 
+        if (self.sim.animation == 'Dead' and 
             self.current_frame_index == len(sprites) - 1):
             self._update_sprite_display()
             return
@@ -406,329 +579,54 @@ class MinouPet(QWidget):
     
     def _update_sprite_display(self):
         """Met à jour l'affichage du sprite"""
-        sprites = self.sprites.get(self.current_animation)
+        sprites = self.sprites.get(self.sim.animation)
         if sprites and self.current_frame_index < len(sprites):
-            pixmap = sprites[self.current_frame_index]
-            
-            # Retourner le sprite si l'animal va vers la gauche
-            if not self.moving_right:
-                pixmap = pixmap.transformed(QTransform().scale(-1, 1))
-            
+            # Frames miroir pré-calculées si l'animal va vers la gauche
+            pixmap = sprites.frame(self.current_frame_index, self.sim.moving_right)
             self.pet_label.setPixmap(pixmap)
         else:
             self.pet_label.clear()
     
+    def _wake_movement(self):
+        """Relance la boucle de mouvement mise en veille"""
+        movement_timer = getattr(self, 'movement_timer', None)
+        if movement_timer is not None and not movement_timer.isActive():
+            self._sim_wake_timer.stop()
+            movement_timer.start(self.movement_interval)
+    
     def _update_position(self):
-        """Met à jour la position de l'animal (appelé 60 fois par seconde)"""
-        if self.is_dead or self.dragging:
-            return
-        
-        screen_rect = QApplication.desktop().screenGeometry()
-        max_x = screen_rect.width() - self.width()
-        ground_y = float(screen_rect.height() - self.height())
-        
-        # Gestion des sauts avec gravité
-        if self._is_jumping:
-            self._handle_jumping(ground_y, max_x)
-            return
-        
-        # Ne pas bouger pendant certaines animations
-        if (self.is_playing_one_shot_animation and not self._is_jumping) or \
-           self._dead_animation_cooldown_timer.isActive():
-            return
+        """Tick de mouvement : avance la simulation jusqu'à maintenant puis
+        affiche une position interpolée entre ses deux derniers pas"""
+        alpha = self.sim.advance()
         
-        # Gestion de la poursuite de nourriture
-        self._handle_food_chasing()
-        
-        # Mise à jour de la position
-        self._current_x += self.cat_velocity_x
-        self._current_y += self.cat_velocity_y
-        
-        # Gestion des différents types de mouvements
-        if self.is_sliding:
-            self._handle_sliding(max_x, ground_y)
-        elif self.is_edge_running:
-            self._handle_edge_running(max_x, ground_y)
+        if self.sim.is_dead or (self.adaptive_movement and self.sim.is_idle()):
+            self._render_position(1.0)
+            self._sleep_movement()
         else:
-            self._handle_normal_movement(max_x, ground_y)
-    
-    def _handle_jumping(self, ground_y, max_x):
-        """Gère la physique des sauts"""
-        self.cat_velocity_y += GRAVITY
-        self._current_y += self.cat_velocity_y
-        
-        # Atterrissage
-        if self._current_y >= ground_y:
-            self._current_y = ground_y
-            self.cat_velocity_y = 0.0
-            self._is_jumping = False
-            self.is_playing_one_shot_animation = False
-            self._set_animation('Idle')
-            
-            if not self._is_manual_moving:
-                self.random_behavior_timer.start(MOVEMENT_CHANGE_DELAY)
-        
-        # Mouvement horizontal pendant le saut
-        self._current_x += self.cat_velocity_x
-        self._current_x = max(0.0, min(self._current_x, float(max_x)))
-        self.move(int(self._current_x), int(self._current_y))
-    
-    def _handle_food_chasing(self):
-        """Gère la logique de poursuite de nourriture"""
-        if (self._is_manual_moving or self.is_sliding or 
-            self._is_jumping or self.is_playing_one_shot_animation):
+            self._render_position(alpha)
+    
+    def _sleep_movement(self):
+        """Met la boucle de mouvement en veille jusqu'au prochain timer de la simulation"""
+        movement_timer = getattr(self, 'movement_timer', None)
+        if movement_timer is None:
             return
-        
-        # Chercher la nourriture la plus proche
-        if not self.target_food_item or self.target_food_item.isHidden():
-            closest_food = None
-            min_distance = float('inf')
-            
-            for food in self.active_food_items:
-                if not food.isHidden():
-                    food_pos = food.pos()
-                    pet_pos = QPoint(int(self._current_x), int(self._current_y))
-                    distance = math.sqrt(
-                        (food_pos.x() - pet_pos.x())**2 + 
-                        (food_pos.y() - pet_pos.y())**2
-                    )
-                    if distance < min_distance:
-                        min_distance = distance
-                        closest_food = food
-            
-            self.target_food_item = closest_food
-        
-        # Poursuivre la nourriture ciblée
-        if self.target_food_item and not self.target_food_item.isHidden():
-            target_pos = self.target_food_item.pos()
-            target_x = target_pos.x() + self.target_food_item.width() // 2
-            target_y = target_pos.y() + self.target_food_item.height() // 2
-            
-            pet_center_x = self._current_x + CAT_WIDTH // 2
-            pet_center_y = self._current_y + CAT_HEIGHT // 2
-            
-            dx = target_x - pet_center_x
-            dy = target_y - pet_center_y
-            distance = math.sqrt(dx*dx + dy*dy)
-            
-            # Manger la nourriture si assez proche
-            if distance < 30:
-                self.target_food_item.food_removed.emit(self.target_food_item)
-                self.target_food_item = None
-                self.cat_velocity_x = 0.0
-                self.cat_velocity_y = 0.0
-                self._set_animation('Idle')
-                
-                # Montrer satisfaction
-                self.show_bubble("Miam miam ! Délicieux ! 😋", "love", 2000)
-                
-                if not self._is_manual_moving and not self.active_food_items:
-                    self.random_behavior_timer.start(MOVEMENT_CHANGE_DELAY)
-            else:
-                # Courir vers la nourriture
-                self.random_behavior_timer.stop()
-                speed = config_manager.get("movement_speed", MOVEMENT_SPEED)
-                self.cat_velocity_x = (dx / distance) * speed * RUN_SPEED_MULTIPLIER
-                self.cat_velocity_y = (dy / distance) * speed * RUN_SPEED_MULTIPLIER
-                self._set_animation('Run')
-    
-    def _handle_sliding(self, max_x, ground_y):
-        """Gère le mouvement de glissade"""
-        # Vérifier si on a atteint la cible
-        target_reached_x = (
-            (self.cat_velocity_x > 0 and self._current_x >= self.slide_target_pos.x()) or
-            (self.cat_velocity_x < 0 and self._current_x <= self.slide_target_pos.x()) or
-            abs(self.cat_velocity_x) < 0.1
-        )
-        
-        target_reached_y = (
-            (self.cat_velocity_y > 0 and self._current_y >= self.slide_target_pos.y()) or
-            (self.cat_velocity_y < 0 and self._current_y <= self.slide_target_pos.y()) or
-            abs(self.cat_velocity_y) < 0.1
-        )
-        
-        if target_reached_x and (self.cat_velocity_y == 0 or target_reached_y):
-            # Fin de la glissade
-            self._current_x = float(self.slide_target_pos.x())
-            if self.cat_velocity_y != 0:
-                self._current_y = float(self.slide_target_pos.y())
-            
-            self.is_sliding = False
-            self.cat_velocity_x = 0.0
-            self.cat_velocity_y = 0.0
-            self._set_animation('Idle')
-            
-            if not self._is_manual_moving and not self.target_food_item:
-                self.random_behavior_timer.start(MOVEMENT_CHANGE_DELAY)
-        else:
-            # Continuer la glissade
-            self._current_x = max(0.0, min(self._current_x, float(max_x)))
-            self._current_y = max(0.0, min(self._current_y, ground_y))
-            self.move(int(self._current_x), int(self._current_y))
-            
-            # Mettre à jour la direction
-            if self.cat_velocity_x > 0:
-                self.moving_right = True
-            elif self.cat_velocity_x < 0:
-                self.moving_right = False
-            
-            self._set_animation('Slide')
-    
-    def _handle_edge_running(self, max_x, ground_y):
-        """Gère la course vers les bords"""
-        self._current_x = max(0.0, min(self._current_x, float(max_x)))
-        self._current_y = max(0.0, min(self._current_y, ground_y))
-        self.move(int(self._current_x), int(self._current_y))
-        
-        # Vérifier si on a atteint la cible ou un bord
-        target_reached = (
-            abs(self._current_x - self.target_x) < 10 and
-            abs(self._current_y - self.target_y) < 10
-        )
-        
-        hit_boundary = (
-            self._current_x <= 0 or self._current_x >= max_x or
-            self._current_y <= 0 or self._current_y >= ground_y
-        )
-        
-        if target_reached or hit_boundary:
-            self.is_edge_running = False
-            self.cat_velocity_x = 0.0
-            self.cat_velocity_y = 0.0
-            self._set_animation('Idle')
-            
-            if (not self._is_manual_moving and not self.target_food_item and 
-                not self._dead_animation_cooldown_timer.isActive()):
-                self.random_behavior_timer.start(MOVEMENT_CHANGE_DELAY)
-        else:
-            # Continuer la course
-            if self.cat_velocity_x > 0:
-                self.moving_right = True
-            elif self.cat_velocity_x < 0:
-                self.moving_right = False
-            self._set_animation('Run')
-    
-    def _handle_normal_movement(self, max_x, ground_y):
-        """Gère les mouvements normaux avec rebonds"""
-        bounced = False
-        
-        # Rebonds sur les bords
-        if self._current_x < 0:
-            self._current_x = 0.0
-            if not self._is_manual_moving and not self.target_food_item:
-                self.cat_velocity_x *= -1
-            bounced = True
-        elif self._current_x > max_x:
-            self._current_x = float(max_x)
-            if not self._is_manual_moving and not self.target_food_item:
-                self.cat_velocity_x *= -1
-            bounced = True
-        
-        if self._current_y < 0:
-            self._current_y = 0.0
-            if not self._is_manual_moving and not self.target_food_item:
-                self.cat_velocity_y *= -1
-            bounced = True
-        elif self._current_y > ground_y:
-            self._current_y = ground_y
-            if not self._is_manual_moving and not self.target_food_item:
-                self.cat_velocity_y *= -1
-            bounced = True
-        
-        self.move(int(self._current_x), int(self._current_y))
-        
-        # Mettre à jour la direction
-        if self.cat_velocity_x > 0:
-            self.moving_right = True
-        elif self.cat_velocity_x < 0:
-            self.moving_right = False
-        
-        # Choisir l'animation appropriée
-        if not self.is_playing_one_shot_animation:
-            has_velocity = abs(self.cat_velocity_x) > 0.1 or abs(self.cat_velocity_y) > 0.1
-            
-            if not self._is_manual_moving and not self.target_food_item:
-                if has_velocity and self.current_animation != 'Walk':
-                    self._set_animation('Walk')
-                elif not has_velocity and self.current_animation != 'Idle':
-                    self._set_animation('Idle')
-            elif self._is_manual_moving:
-                if has_velocity:
-                    self._set_animation('Walk')
-                else:
-                    self._set_animation('Idle')
-    
-    def _random_movement(self):
-        """Génère un mouvement aléatoire avec de longues pauses"""
-        if (self.is_playing_one_shot_animation or self.is_sliding or 
-            self._is_manual_moving or self.is_dead or self.target_food_item or
-            self.quiet_mode):
+        movement_timer.stop()
+        self._sim_wake_timer.stop()
+        due = self.sim.next_timer_due()
+        if due is not None:
+            delay = max(0.0, due - self.sim.clock.now())
+            self._sim_wake_timer.start(int(delay * 1000) + 1)
+    
+    def _render_position(self, alpha):
+        """Affiche l'animal entre les deux derniers pas de physique"""
+        if self.sim.is_dead or self.sim.dragging:
             return
-        
-        choice = random.random()
-        speed = config_manager.get("movement_speed", MOVEMENT_SPEED)
-        
-        # NOUVELLES PROBABILITÉS : Beaucoup plus de pauses !
-        if choice < 0.60:  # 60% de chance de ne rien faire (LONG IDLE)
-            self.cat_velocity_x = 0.0
-            self.cat_velocity_y = 0.0
-            self._set_animation('Idle')
-            
-            # Programmer le prochain mouvement dans LONGTEMPS
-            next_delay = random.choice([
-                random.randint(30000, 60000),    # 30s-1min (40% de chance)
-                random.randint(60000, 120000),   # 1-2min (30% de chance)  
-                random.randint(120000, 300000),  # 2-5min (20% de chance)
-            ])
-            
-            print(f"😴 Minou se repose pendant {next_delay//1000} secondes")
-            self.random_behavior_timer.start(next_delay)
-            
-        elif choice < 0.75:  # 15% de chance de marcher un peu
-            angle = random.uniform(0, 2 * math.pi)
-            vx = speed * random.uniform(0.5, 1.0) * math.cos(angle)
-            vy = speed * random.uniform(0.5, 1.0) * math.sin(angle)
-            
-            self.cat_velocity_x = vx
-            self.cat_velocity_y = vy
-            self._set_animation('Walk')
-            
-            # Marcher pendant peu de temps seulement
-            walk_duration = random.randint(3000, 8000)  # 3-8 secondes
-            QTimer.singleShot(walk_duration, self._stop_walking)
-            
-            # Prochain comportement dans un délai moyen
-            next_delay = random.randint(20000, 90000)  # 20s-1.5min
-            self.random_behavior_timer.start(next_delay)
-            
-        elif choice < 0.85:  # 10% de chance de courir vers un bord
-            self._start_edge_run()
-            # Edge run programme son propre prochain délai
-            next_delay = random.randint(45000, 180000)  # 45s-3min après la course
-            QTimer.singleShot(10000, lambda: self.random_behavior_timer.start(next_delay))
-            
-        elif choice < 0.92:  # 7% de chance de glisser
-            self._start_slide_behavior()
-            # Même logique que pour la course
-            next_delay = random.randint(30000, 120000)  # 30s-2min après glissade
-            QTimer.singleShot(8000, lambda: self.random_behavior_timer.start(next_delay))
-            
-        else:  # 8% de chance de sauter
-            self._play_one_shot_animation('Jump')
-            # Délai après le saut
-            next_delay = random.randint(25000, 90000)  # 25s-1.5min
-            QTimer.singleShot(5000, lambda: self.random_behavior_timer.start(next_delay))
-
-    def _stop_walking(self):
-        """Arrête la marche et met en idle"""
-        if not self.is_playing_one_shot_animation and not self._is_manual_moving:
-            self.cat_velocity_x = 0.0
-            self.cat_velocity_y = 0.0
-            self._set_animation('Idle')
-
+        x, y = self.sim.render_position(alpha)
+        self.move(int(x), int(y))
+    
     def _check_activity(self):
         """Vérifie s'il faut reprendre l'activité après le mode tranquille"""
-        if self.quiet_mode:
+        if self.sim.quiet_mode:
             # Chance de reprendre l'activité automatiquement
             if random.random() < 0.3:  # 30% de chance de reprendre
                 self._resume_activity()
@@ -738,12 +636,13 @@ class MinouPet(QWidget):
 
     def _resume_activity(self):
         """Reprend l'activité normale"""
-        self.quiet_mode = False
+        self.sim.set_quiet(False)
+        self._world_changed()
         
-        if not self.is_dead:
+        if not self.sim.is_dead:
             # Reprendre avec un délai initial plus long
             initial_delay = random.randint(30000, 120000)  # 30s-2min
-            self.random_behavior_timer.start(initial_delay)
+            self.sim.start_behavior(initial_delay)
             
             if config_manager.get("sound_enabled", True):
                 self.audio_play_timer.start(random.randint(60000, 180000))
@@ -756,190 +655,10 @@ class MinouPet(QWidget):
         
         self.stay_quiet_action.setText("😴 Rester tranquille")
     
-    def _start_edge_run(self):
-        """Démarre une course vers un bord aléatoire"""
-        screen_rect = QApplication.desktop().screenGeometry()
-        edges = ['top', 'bottom', 'left', 'right']
-        edge = random.choice(edges)
-        
-        if edge == 'top':
-            self.target_x = random.randint(0, screen_rect.width() - CAT_WIDTH)
-            self.target_y = 0
-        elif edge == 'bottom':
-            self.target_x = random.randint(0, screen_rect.width() - CAT_WIDTH)
-            self.target_y = screen_rect.height() - CAT_HEIGHT
-        elif edge == 'left':
-            self.target_x = 0
-            self.target_y = random.randint(0, screen_rect.height() - CAT_HEIGHT)
-        else:  # right
-            self.target_x = screen_rect.width() - CAT_WIDTH
-            self.target_y = random.randint(0, screen_rect.height() - CAT_HEIGHT)
-        
-        dx = float(self.target_x) - self._current_x
-        dy = float(self.target_y) - self._current_y
-        distance = math.sqrt(dx*dx + dy*dy)
-        
-        if distance < 1.0:
-            return
-        
-        speed = config_manager.get("movement_speed", MOVEMENT_SPEED)
-        self.cat_velocity_x = (dx / distance) * speed * RUN_SPEED_MULTIPLIER
-        self.cat_velocity_y = (dy / distance) * speed * RUN_SPEED_MULTIPLIER
-        self.is_edge_running = True
-        self._set_animation('Run')
-    
-    def _start_slide_behavior(self):
-        """Démarre une glissade"""
-        screen_rect = QApplication.desktop().screenGeometry()
-        slide_types = ['horizontal', 'diagonal_down']
-        slide_type = random.choice(slide_types)
-        
-        if slide_type == 'horizontal':
-            # Glissade horizontale
-            self.target_y = int(self._current_y)
-            
-            # Choisir une direction avec assez d'espace
-            min_distance = 100
-            possible_targets = []
-            
-            if self._current_x + min_distance < screen_rect.width() - CAT_WIDTH:
-                possible_targets.extend(range(
-                    int(self._current_x + min_distance), 
-                    screen_rect.width() - CAT_WIDTH
-                ))
-            
-            if self._current_x - min_distance > 0:
-                possible_targets.extend(range(0, int(self._current_x - min_distance)))
-            
-            self.target_x = random.choice(possible_targets) if possible_targets else int(self._current_x)
-            
-        else:  # diagonal_down
-            # Glissade diagonale vers le bas
-            min_y = int(self._current_y + 50)
-            self.target_y = random.randint(
-                min_y, 
-                screen_rect.height() - CAT_HEIGHT
-            ) if min_y < screen_rect.height() - CAT_HEIGHT else int(self._current_y)
-            
-            # Position X légèrement décalée
-            offset = random.randint(-100, 100)
-            self.target_x = max(0, min(
-                int(self._current_x + offset), 
-                screen_rect.width() - CAT_WIDTH
-            ))
-        
-        # Calculer la vélocité
-        dx = float(self.target_x) - self._current_x
-        dy = float(self.target_y) - self._current_y
-        distance = math.sqrt(dx*dx + dy*dy)
-        
-        if distance < 1.0:
-            return
-        
-        speed = config_manager.get("movement_speed", MOVEMENT_SPEED) * 1.5
-        self.cat_velocity_x = (dx / distance) * speed
-        self.cat_velocity_y = (dy / distance) * speed
-        
-        self.is_sliding = True
-        self.slide_target_pos = QPoint(self.target_x, self.target_y)
-        self._set_animation('Slide')
-    
     def _play_one_shot_animation(self, animation_name):
         """Joue une animation unique (non-looping)"""
-        if self.is_dead or animation_name not in self.sprites:
-            return
-        
-        self.is_playing_one_shot_animation = True
-        self.random_behavior_timer.stop()
-        self._is_manual_moving = False
-        self.cat_velocity_x = 0.0
-        self.media_player.stop()
-        
-        if animation_name == 'Jump':
-            self.cat_velocity_y = -JUMP_INITIAL_VELOCITY
-            self._is_jumping = True
-        else:
-            self.cat_velocity_y = 0.0
-            duration_ms = len(self.sprites[animation_name]) * ANIMATION_FRAME_RATE
-            QTimer.singleShot(duration_ms, self._one_shot_animation_finished)
-        
-        self.current_animation = animation_name
-        self.current_frame_index = 0
-        self._update_sprite_display()
-    
-    def _one_shot_animation_finished(self):
-        """Appelé quand une animation unique se termine"""
-        if self.current_animation == 'Dead':
-            self.is_playing_one_shot_animation = False
-            self.is_dead = True
-            self.revive_pet_action.setEnabled(True)
-            return
-        
-        self.is_playing_one_shot_animation = False
-        self._set_animation('Idle')
-        
-        # CORRECTION : Ne pas redémarrer immédiatement, laisser du temps
-        if (not self._is_manual_moving and not self.is_dead and 
-            not self.target_food_item):
-            # Délai aléatoire long avant le prochain mouvement
-            delay = random.randint(20000, 120000)  # 20s-2min
-            self.random_behavior_timer.start(delay)
-        
-        if (config_manager.get("sound_enabled", True) and 
-            self.media_player.state() == QMediaPlayer.StoppedState and 
-            not self.is_dead):
-            self.audio_play_timer.start(random.randint(60000, 300000))  # 1-5min
-
-    def _on_control_box_closed(self):
-        """Appelé quand la boîte de contrôle est fermée"""
-        self.control_box = None
-        self._is_manual_moving = False
-        
-        # CORRECTION : Laisser un délai après fermeture des contrôles
-        if not self.is_playing_one_shot_animation and not self.is_dead and not self.active_food_items:
-            delay = random.randint(15000, 60000)  # 15s-1min de pause
-            self.random_behavior_timer.start(delay)
-        
-        self.cat_velocity_x = 0.0
-        self.cat_velocity_y = 0.0
-        self._set_animation('Idle')
-        
-        if config_manager.get("sound_enabled", True) and not self.is_dead:
-            self.audio_play_timer.start(random.randint(30000, 120000))  # 30s-2min
-        
-    def _play_dead_animation(self):
-        """Joue l'animation de mort"""
-        if 'Dead' not in self.sprites:
-            self._play_one_shot_animation('Hurt')
-            return
-        
-        self.is_playing_one_shot_animation = True
-        self.random_behavior_timer.stop()
-        self.movement_timer.stop()
-        self.audio_play_timer.stop()
-        self.media_player.stop()
-        self.target_food_item = None
-        self.is_dead = True
-        
-        # Arrêter tous les mouvements
-        self._is_manual_moving = False
-        self.is_edge_running = False
-        self.is_sliding = False
-        self._is_jumping = False
-        self.cat_velocity_x = 0.0
-        self.cat_velocity_y = 0.0
-        
-        self.current_animation = 'Dead'
-        self.current_frame_index = 0
-        self._update_sprite_display()
-        
-        # Aller à la dernière frame et s'arrêter
-        duration = (len(self.sprites['Dead']) - 1) * ANIMATION_FRAME_RATE
-        QTimer.singleShot(duration, self._reached_last_dead_frame)
-        
-        # Message dramatique
-        pet_name = config_manager.get("pet_name", "Minou")
-        self.show_bubble(f"{pet_name} est K.O. ! 💀", "alert", 5000)
+        if self.sim.play_one_shot(animation_name):
+            self.media_player.stop()
     
     def _reached_last_dead_frame(self):
         """Atteint la dernière frame de l'animation de mort"""
@@ -951,112 +670,134 @@ class MinouPet(QWidget):
         self.movement_timer.stop()
         self.revive_pet_action.setEnabled(True)
     
-    def _dead_animation_cooldown_finished(self):
-        """Appelé quand le cooldown après mort se termine"""
-        self.is_playing_one_shot_animation = False
-        self.animation_timer.start(config_manager.get("animation_speed", ANIMATION_FRAME_RATE))
-        self.movement_timer.start(16)
-        
-        self._set_animation('Idle')
-        if not self._is_manual_moving and not self.target_food_item:
-            self.random_behavior_timer.start(MOVEMENT_CHANGE_DELAY)
-        
-        if config_manager.get("sound_enabled", True):
-            self.audio_play_timer.start(random.randint(1000, 5000))
-    
     def _reset_pet(self):
         """Ressuscite l'animal"""
         pet_name = config_manager.get("pet_name", "Minou")
         
         # Remettre tous les états à zéro
-        self.is_dead = False
-        self.is_playing_one_shot_animation = False
-        self._is_manual_moving = False
-        self.is_edge_running = False
-        self.is_sliding = False
-        self._is_jumping = False
-        self.cat_velocity_x = 0.0
-        self.cat_velocity_y = 0.0
-        self._click_count = 0
-        self.target_food_item = None
+        self.sim.revive()
         self.revive_pet_action.setEnabled(False)
         
         # Redémarrer les timers
-        self.animation_timer.start(config_manager.get("animation_speed", ANIMATION_FRAME_RATE))
-        self.movement_timer.start(16)
-        self.random_behavior_timer.start(MOVEMENT_CHANGE_DELAY)
+        self._start_animation_timer()
+        self.movement_timer.start(self.movement_interval)
         
         if config_manager.get("sound_enabled", True):
             self.audio_play_timer.start(random.randint(1000, 5000))
         
-        self._set_animation('Idle')
-        
         # Message de résurrection
-        self.show_bubble(f"{pet_name} est de retour ! 💖", "love", 3000)
+        self.show_bubble(f"{pet_name} est de retour ! 💖", "love", 3000, "chat", "revive")
     
     # Méthodes de gestion de la nourriture et objets
     def add_random_food(self):
         """Ajoute un élément de nourriture aléatoire"""
-        food_item = FoodItem()
-        if food_item.is_valid:
-            food_item.food_removed.connect(self._on_food_removed)
-            self.active_food_items.append(food_item)
-            food_item.show()
-            self.raise_()
-            
-            # Message encourageant
-            self.show_bubble("Miam ! De la nourriture ! 🍖", "love", 2000)
-        else:
+        self.spawn_food(1)
+    
+    def spawn_food(self, count):
+        """Dépose `count` nourritures d'un coup, sans chevauchement, avec une
+        seule bulle et un seul passage au premier plan"""
+        spawned = 0
+        for x, y in self._free_item_points(count, FOOD_SIZE, margin=50):
+            food_item = self.food_pool.acquire(initial_pos=QPoint(x, y))
+            if food_item.is_valid:
+                self.sim.add_food(food_item)
+                spawned += 1
+        
+        if not spawned:
             print("⚠️ Impossible de créer la nourriture - assets manquants")
+            return 0
+        
+        self.raise_()
+        self._world_changed()
+        
+        # Message encourageant
+        if spawned == 1:
+            self.show_bubble("Miam ! De la nourriture ! 🍖", "love", 2000, "chat", "food")
+        else:
+            self.show_bubble(f"Un festin ! {spawned} bonnes choses ! 🍖", "love", 2000, "chat", "food")
+        return spawned
+    
+    def _free_item_points(self, count, size, margin):
+        """Positions (coin haut-gauche) sur les écrans, loin des objets présents"""
+        zones = [(rect.left() + margin, rect.top() + margin,
+                  rect.left() + rect.width() - size - margin,
+                  rect.top() + rect.height() - size - margin)
+                 for rect in screen_geometry.screens()]
+        existing = [self.sim.food_index.position(food) for food in self.sim.foods]
+        existing += [(poop.x(), poop.y()) for poop in self.active_poop_items]
+        return poisson_disk_points(zones, count, ITEM_MIN_SPACING, existing)
+    
+    def _connect_food(self, food_item):
+        """Connexions d'une nourriture, faites une seule fois par widget du pool"""
+        food_item.food_removed.connect(self._on_food_removed)
+        food_item.food_moved.connect(self.sim.move_food)
+        food_item.food_moved.connect(self._world_changed)
+        food_item.food_visibility_changed.connect(self.sim.update_food_visibility)
     
     def _on_food_removed(self, food_item):
         """Appelé quand une nourriture est supprimée/mangée"""
-        if food_item in self.active_food_items:
-            food_item.hide()
-            food_item.deleteLater()
-            self.active_food_items.remove(food_item)
-            
-            if self.target_food_item == food_item:
-                self.target_food_item = None
+        self.food_pool.release(food_item)
+        self.sim.remove_food(food_item)
+        self._world_changed()
     
     def clear_all_food(self):
         """Supprime toute la nourriture"""
-        for food_item in list(self.active_food_items):
-            food_item.hide()
-            food_item.deleteLater()
+        for food_item in list(self.sim.foods):
+            self.food_pool.release(food_item)
         
-        self.active_food_items.clear()
-        self.target_food_item = None
+        self.sim.clear_food()
+        self._world_changed()
         print("🧹 Toute la nourriture a été nettoyée")
     
     def add_random_poop(self):
         """Ajoute un élément poop près de l'animal"""
-        poop_item = PoopItem(near_pet=True, pet_pos=QPoint(int(self._current_x), int(self._current_y)))
+        poop_item = self.poop_pool.acquire(near_pet=True,
+                                           pet_pos=QPoint(int(self.sim.x), int(self.sim.y)))
         if poop_item.is_valid:
-            poop_item.poop_removed.connect(self._on_poop_removed)
             self.active_poop_items.append(poop_item)
             poop_item.show()
+            self._world_changed()
             
             # Message gêné
-            self.show_bubble("Oops... désolé ! 💩", "normal", 2000)
+            self.show_bubble("Oops... désolé ! 💩", "normal", 2000, "ambient", "poop")
         else:
             print("⚠️ Impossible de créer le poop - assets manquants")
     
+    def spawn_poop(self, count):
+        """Dépose `count` poops d'un coup, sans chevauchement"""
+        spawned = 0
+        for x, y in self._free_item_points(count, POOP_SIZE, margin=30):
+            poop_item = self.poop_pool.acquire(initial_pos=QPoint(x, y))
+            if poop_item.is_valid:
+                self.active_poop_items.append(poop_item)
+                spawned += 1
+        
+        if not spawned:
+            print("⚠️ Impossible de créer le poop - assets manquants")
+            return 0
+        
+        self.raise_()
+        self._world_changed()
+        self.show_bubble("Oops... désolé ! 💩", "normal", 2000, "ambient", "poop")
+        return spawned
+    
     def _spawn_random_poop(self):
         """Spawn automatique de poop (appelé par timer)"""
-        if not self.is_dead and random.random() < 0.3:  # 30% de chance
+        if not self.sim.is_dead and random.random() < 0.3:  # 30% de chance
             self.add_random_poop()
     
+    def _connect_poop(self, poop_item):
+        poop_item.poop_removed.connect(self._on_poop_removed)
+    
     def _on_poop_removed(self, poop_item):
         """Appelé quand un poop est nettoyé"""
         print(f"🧹 [MinouPet] _on_poop_removed() appelé pour {poop_item}")
         if poop_item in self.active_poop_items:
             print(f"   🔍 PoopItem trouvé dans active_poop_items (count: {len(self.active_poop_items)})")
-            poop_item.hide()
-            print("   👻 PoopItem masqué")
-            poop_item.deleteLater()
-            print("   🗑️  PoopItem marqué pour suppression")
+            self.poop_pool.release(poop_item)
+            print("   ♻️ PoopItem masqué et rendu au pool")
             self.active_poop_items.remove(poop_item)
+            self._world_changed()
             print(f"   ✅ PoopItem retiré de active_poop_items (nouveau count: {len(self.active_poop_items)})")
         else:
             print("   ❌ PoopItem non trouvé dans active_poop_items")
@@ -1064,16 +805,16 @@ class MinouPet(QWidget):
     def clear_all_poop(self):
         """Nettoie tous les poops"""
         for poop_item in list(self.active_poop_items):
-            poop_item.hide()
-            poop_item.deleteLater()
+            self.poop_pool.release(poop_item)
         
         self.active_poop_items.clear()
+        self._world_changed()
         print("🧹 Tout le poop a été nettoyé")
     
     # Méthodes audio
     def _play_random_audio(self):
         """Joue un son aléatoire"""
-        if not config_manager.get("sound_enabled", True) or self.is_dead:
+        if not config_manager.get("sound_enabled", True) or self.sim.is_dead:
             return
         
         audio_url = self.audio_files.get(self.current_asset_type)
@@ -1095,9 +836,9 @@ class MinouPet(QWidget):
         """Appelé quand l'état audio change"""
         if (state == QMediaPlayer.StoppedState and 
             config_manager.get("sound_enabled", True) and 
-            not self._is_manual_moving and 
-            not self.is_playing_one_shot_animation and 
-            not self.is_dead):
+            not self.sim.is_manual_moving and 
+            not self.sim.is_playing_one_shot and 
+            not self.sim.is_dead):
             self.audio_play_timer.start(random.randint(5000, 15000))
     
     def _toggle_audio(self):
@@ -1107,7 +848,7 @@ class MinouPet(QWidget):
         
         if config_manager.get("sound_enabled", True):
             self.toggle_audio_action.setText("🔊 Désactiver son")
-            if not self.is_dead:
+            if not self.sim.is_dead:
                 self.audio_play_timer.start(random.randint(1000, 5000))
         else:
             self.toggle_audio_action.setText("🔇 Activer son")
@@ -1139,63 +880,30 @@ class MinouPet(QWidget):
         self.control_box.raise_()
         
         # Arrêter les mouvements automatiques
-        if not self.is_dead:
-            self.random_behavior_timer.stop()
-        
-        self.is_edge_running = False
-        self.is_sliding = False
-        self._is_jumping = False
-        self._is_manual_moving = True
-        self.cat_velocity_x = 0.0
-        self.cat_velocity_y = 0.0
-        self._set_animation('Idle')
+        self.sim.take_manual_control()
         self.media_player.stop()
         self.audio_play_timer.stop()
-        self.target_food_item = None
     
     def _on_control_box_closed(self):
         """Appelé quand la boîte de contrôle est fermée"""
         self.control_box = None
-        self._is_manual_moving = False
-        
-        if not self.is_playing_one_shot_animation and not self.is_dead and not self.active_food_items:
-            self.random_behavior_timer.start(MOVEMENT_CHANGE_DELAY)
-        
-        self.cat_velocity_x = 0.0
-        self.cat_velocity_y = 0.0
-        self._set_animation('Idle')
+        self.sim.end_manual_control()
         
-        if config_manager.get("sound_enabled", True) and not self.is_dead:
+        if config_manager.get("sound_enabled", True) and not self.sim.is_dead:
             self.audio_play_timer.start(random.randint(1000, 5000))
     
     def _start_manual_movement(self, vx, vy):
         """Démarre un mouvement manuel"""
-        if self._is_jumping or self.is_sliding or self.is_dead:
-            return
-        
-        self._is_manual_moving = True
-        self.random_behavior_timer.stop()
-        self.is_edge_running = False
-        
-        speed = config_manager.get("movement_speed", MOVEMENT_SPEED)
-        self.cat_velocity_x = vx * speed
-        self.cat_velocity_y = vy * speed
-        
-        if abs(vx) > 0.1 or abs(vy) > 0.1:
-            self._set_animation('Walk')
-        else:
-            self._set_animation('Idle')
-        
-        self.media_player.stop()
-        self.audio_play_timer.stop()
-        self.target_food_item = None
+        if self.sim.start_manual_movement(vx, vy):
+            self.media_player.stop()
+            self.audio_play_timer.stop()
     
     def start_manual_move_left(self):
-        self.moving_right = False
+        self.sim.moving_right = False
         self._start_manual_movement(-1.0, 0.0)
     
     def start_manual_move_right(self):
-        self.moving_right = True
+        self.sim.moving_right = True
         self._start_manual_movement(1.0, 0.0)
     
     def start_manual_move_up(self):
@@ -1206,30 +914,37 @@ class MinouPet(QWidget):
     
     def stop_manual_movement(self):
         """Arrête le mouvement manuel"""
-        if not self._is_jumping and not self.is_sliding and not self.is_dead:
-            self.cat_velocity_x = 0.0
-            self.cat_velocity_y = 0.0
-            self._set_animation('Idle')
+        self.sim.stop_manual_movement()
         
         if (config_manager.get("sound_enabled", True) and 
             self.media_player.state() == QMediaPlayer.StoppedState and 
-            not self.is_dead):
+            not self.sim.is_dead):
             self.audio_play_timer.start(random.randint(1000, 5000))
     
     def _manual_jump(self):
         """Saut manuel"""
-        if not self._is_jumping and not self.is_playing_one_shot_animation and not self.is_dead:
+        sim = self.sim
+        if not sim.is_jumping and not sim.is_playing_one_shot and not sim.is_dead:
             self.stop_manual_movement()
             self._play_one_shot_animation('Jump')
     
     def _manual_slide(self):
         """Glissade manuelle"""
-        if not self.is_sliding and not self.is_playing_one_shot_animation and not self.is_dead:
+        sim = self.sim
+        if not sim.is_sliding and not sim.is_playing_one_shot and not sim.is_dead:
             self.stop_manual_movement()
-            self._start_slide_behavior()
+            sim.start_slide()
     
     # Méthodes d'interface utilisateur
-    def show_bubble(self, message, bubble_type="normal", duration=3000):
+    def show_bubble(self, message, bubble_type="normal", duration=3000,
+                    priority="ambient", source=None):
+        """Propose un message à la file des bulles (voir bubbles.BubbleScheduler).
+        
+        Retourne False si le message est ignoré (doublon, source trop bavarde).
+        """
+        return self.bubble_scheduler.post(message, bubble_type, duration, priority, source)
+    
+    def _display_bubble(self, message, bubble_type="normal", duration=3000):
         """Affiche une bulle de dialogue au-dessus de l'animal avec durée adaptative"""
         if not self.speech_bubble:
             return
@@ -1258,10 +973,12 @@ class MinouPet(QWidget):
         bubble_x = pet_pos.x() + CAT_WIDTH // 2 - 100  # Centrer approximativement
         bubble_y = pet_pos.y() - 80  # Au-dessus de l'animal
         
-        # S'assurer que la bulle reste à l'écran
-        screen_rect = QApplication.desktop().screenGeometry()
-        bubble_x = max(10, min(bubble_x, screen_rect.width() - 220))
-        bubble_y = max(10, bubble_y)
+        # S'assurer que la bulle reste sur l'écran de l'animal
+        screen_rect = screen_geometry.screen_at(pet_pos.x() + CAT_WIDTH // 2,
+                                                pet_pos.y() + CAT_HEIGHT // 2)
+        bubble_x = max(screen_rect.left() + 10,
+                       min(bubble_x, screen_rect.left() + screen_rect.width() - 220))
+        bubble_y = max(screen_rect.top() + 10, bubble_y)
         
         self.speech_bubble.move(bubble_x, bubble_y)
         self.speech_bubble.show_message(message, bubble_type, duration)
@@ -1276,10 +993,12 @@ class MinouPet(QWidget):
         chat_x = pet_pos.x() + CAT_WIDTH // 2 - 150
         chat_y = pet_pos.y() - 50
         
-        # S'assurer que le chat reste à l'écran
-        screen_rect = QApplication.desktop().screenGeometry()
-        chat_x = max(10, min(chat_x, screen_rect.width() - 310))
-        chat_y = max(10, chat_y)
+        # S'assurer que le chat reste sur l'écran de l'animal
+        screen_rect = screen_geometry.screen_at(pet_pos.x() + CAT_WIDTH // 2,
+                                                pet_pos.y() + CAT_HEIGHT // 2)
+        chat_x = max(screen_rect.left() + 10,
+                     min(chat_x, screen_rect.left() + screen_rect.width() - 310))
+        chat_y = max(screen_rect.top() + 10, chat_y)
         
         self.chat_interface.move(chat_x, chat_y)
         self.chat_interface.show_chat()
@@ -1297,7 +1016,7 @@ class MinouPet(QWidget):
         self.conversation_thread.start()
         
         # Montrer que Minou "réfléchit"
-        self.show_bubble("🤔 Hmm...", "info", 1000)
+        self.show_bubble("🤔 Hmm...", "info", 1000, "chat", "chat")
     
     def _handle_ai_response(self, response, message_type):
         """Traite la réponse de l'IA"""
@@ -1327,12 +1046,12 @@ class MinouPet(QWidget):
                                 print(f"📝 Note sauvegardée: {content}")
                                 
                                 # Confirmation à l'utilisateur
-                                self.show_bubble(f"📝 Note sauvegardée: {content[:40]}...", "info", 4000)
+                                self.show_bubble(f"📝 Note sauvegardée: {content[:40]}...", "info", 4000, "chat")
                                 
                                 # Ne pas afficher le JSON dans la bulle
                                 clean_response = response.replace(json_str, "").strip()
                                 if clean_response:
-                                    self.show_bubble(clean_response, message_type, 5000)
+                                    self.show_bubble(clean_response, message_type, 5000, "chat", "chat")
                                 return
                         
                         elif action == "reminder":
@@ -1341,12 +1060,12 @@ class MinouPet(QWidget):
                             if time_str and message:
                                 # TODO: Implémenter les rappels avec reminder_manager
                                 print(f"⏰ Rappel programmé: {time_str} - {message}")
-                                self.show_bubble(f"⏰ Rappel programmé: {message}", "info", 4000)
+                                self.show_bubble(f"⏰ Rappel programmé: {message}", "info", 4000, "chat")
                                 
                                 # Ne pas afficher le JSON dans la bulle
                                 clean_response = response.replace(json_str, "").strip()
                                 if clean_response:
-                                    self.show_bubble(clean_response, message_type, 5000)
+                                    self.show_bubble(clean_response, message_type, 5000, "chat", "chat")
                                 return
                                 
                     except json.JSONDecodeError:
@@ -1357,12 +1076,12 @@ class MinouPet(QWidget):
             print(f"❌ Erreur lors du traitement de la réponse IA: {e}")
         
         # Afficher la réponse normale dans une bulle (sans JSON)
-        self.show_bubble(response, message_type, 5000)
+        self.show_bubble(response, message_type, 5000, "chat", "chat")
         
     # Méthodes de messages et notifications
     def _show_random_message(self):
         """Affiche un message aléatoire"""
-        if self.is_dead:
+        if self.sim.is_dead:
             return
         
         message_types = []
@@ -1391,7 +1110,7 @@ class MinouPet(QWidget):
             message = f"💡 {message_generator.get_random_research_suggestion()}"
             bubble_type = "normal"
         
-        self.show_bubble(message, bubble_type, 4000)
+        self.show_bubble(message, bubble_type, 4000, "ambient", "random")
         
         # Programmer le prochain message
         if config_manager.get("random_messages_enabled", True):
@@ -1401,7 +1120,7 @@ class MinouPet(QWidget):
     
     def _show_reminder(self, reminder_message):
         """Affiche un rappel"""
-        self.show_bubble(f"⏰ Rappel: {reminder_message}", "alert", 6000)
+        self.show_bubble(f"⏰ Rappel: {reminder_message}", "alert", 6000, "reminder")
         
         # Notification système si disponible
         pet_name = config_manager.get("pet_name", "Minou")
@@ -1415,13 +1134,14 @@ class MinouPet(QWidget):
     
     def _show_system_alert(self, alert_type, message):
         """Affiche une alerte système"""
-        self.show_bubble(message, "alert", 5000)
+        if not self.show_bubble(message, "alert", 5000, "alert", f"alert:{alert_type}"):
+            return  # Même alerte trop récente : ni bulle ni animation
         
         # Jouer une animation selon le type
-        if alert_type == "memory" and not self.is_dead:
+        if alert_type == "memory" and not self.sim.is_dead:
             self._play_one_shot_animation('Hurt')
-        elif alert_type == "battery" and not self.is_dead:
-            self._set_animation('Idle')  # Animation calme pour économiser
+        elif alert_type == "battery" and not self.sim.is_dead:
+            self.sim.set_animation('Idle')  # Animation calme pour économiser
     
     # Méthodes de menu et paramètres
     def _open_settings(self):
@@ -1435,6 +1155,10 @@ class MinouPet(QWidget):
         # Mettre à jour la vitesse de mouvement
         # (sera appliqué automatiquement via config_manager)
         
+        # Budget mémoire des sprites (évince tout de suite s'il a baissé)
+        sprite_store.set_budget_mb(config_manager.get("sprite_memory_budget_mb",
+                                                      SPRITE_MEMORY_BUDGET_MB))
+        
         # Mettre à jour le type d'animal si nécessaire
         new_pet_type = config_manager.get("pet_type", "cat")
         if new_pet_type != self.current_asset_type:
@@ -1442,7 +1166,7 @@ class MinouPet(QWidget):
         
         # Mettre à jour l'audio
         if config_manager.get("sound_enabled", True):
-            if not self.audio_play_timer.isActive() and not self.is_dead:
+            if not self.audio_play_timer.isActive() and not self.sim.is_dead:
                 self.audio_play_timer.start(random.randint(1000, 5000))
         else:
             self.media_player.stop()
@@ -1465,7 +1189,7 @@ class MinouPet(QWidget):
     def _show_system_info(self):
         """Affiche les informations système"""
         info = get_system_info()
-        self.show_bubble(info, "info", 8000)
+        self.show_bubble(info, "info", 8000, "chat", "menu")
     
     def _show_notes(self):
         """Affiche les notes récentes"""
@@ -1479,19 +1203,37 @@ class MinouPet(QWidget):
                 content = note['content'][:30] + "..." if len(note['content']) > 30 else note['content']
                 message += f"{i}. {content}\n"
         
-        self.show_bubble(message, "info", 6000)
+        self.show_bubble(message, "info", 6000, "chat", "menu")
     
     # Méthodes de tray icon
     def _update_tray_icon_animation(self):
         """Met à jour l'animation de l'icône tray"""
         idle_sprites = self.sprites.get('Idle')
         if idle_sprites:
+            # Rien à redessiner si la barre système n'affiche pas l'icône
+            if self._current_tray_icon is not None and not self.tray_icon.isVisible():
+                return
+            
             self.tray_icon_current_frame_index = (self.tray_icon_current_frame_index + 1) % len(idle_sprites)
-            pixmap = idle_sprites[self.tray_icon_current_frame_index]
-            self.tray_icon.setIcon(QIcon(pixmap))
+            if self.tray_icon_current_frame_index == 0 or self._tray_icon_extent is None:
+                self._tray_icon_extent = self._get_tray_icon_extent()
+            
+            icons = idle_sprites.icons(self._tray_icon_extent, self.devicePixelRatioF())
+            icon = icons[self.tray_icon_current_frame_index]
+            if icon is not self._current_tray_icon:
+                self._current_tray_icon = icon
+                self.tray_icon.setIcon(icon)
         else:
+            self._current_tray_icon = None
             self.tray_icon.setIcon(self.style().standardIcon(QStyle.SP_ComputerIcon))
     
+    def _get_tray_icon_extent(self):
+        """Taille de l'icône rapportée par la barre système (ou taille par défaut)"""
+        size = self.tray_icon.geometry().size()
+        if size.isEmpty():
+            return self.style().pixelMetric(QStyle.PM_SmallIconSize)
+        return min(size.width(), size.height())
+    
     def toggle_visibility(self):
         """Bascule la visibilité de l'animal"""
         if self.isVisible():
@@ -1501,8 +1243,8 @@ class MinouPet(QWidget):
             self.show()
             self.toggle_visibility_action.setText("Masquer")
             
-            if not self._is_manual_moving and not self.is_dead:
-                self.random_behavior_timer.start(MOVEMENT_CHANGE_DELAY)
+            if not self.sim.is_manual_moving and not self.sim.is_dead:
+                self.sim.start_behavior(MOVEMENT_CHANGE_DELAY)
     
     def on_tray_icon_activated(self, reason):
         """Appelé quand l'icône tray est activée"""
@@ -1515,100 +1257,60 @@ class MinouPet(QWidget):
     def mousePressEvent(self, event):
         """Gestion du clic de souris"""
         if event.button() == Qt.LeftButton:
-            self.dragging = True
             self.mouse_press_pos = event.globalPos()
             self.offset = event.pos()
-            
+        
             # Arrêter les mouvements automatiques
-            self.random_behavior_timer.stop()
-            self._dead_animation_cooldown_timer.stop()
-            self._is_manual_moving = False
-            self.cat_velocity_x = 0.0
-            self.cat_velocity_y = 0.0
-            self._set_animation('Idle')
-            self.is_edge_running = False
-            self.is_sliding = False
-            self._is_jumping = False
+            self.sim.grab()
             self.media_player.stop()
-            self.target_food_item = None
-            
-            if self.is_dead:
-                self.is_dead = False  # Permettre de bouger même mort
     
     def mouseMoveEvent(self, event):
         """Gestion du déplacement de souris (drag)"""
-        if self.dragging:
+        if self.sim.dragging:
             new_pos = self.mapToGlobal(event.pos() - self.offset)
             self.move(new_pos)
-            self._current_x = float(new_pos.x())
-            self._current_y = float(new_pos.y())
+            self.sim.drag_to(new_pos.x(), new_pos.y())
     
     def mouseReleaseEvent(self, event):
         """Gestion du relâchement de souris"""
         if event.button() == Qt.LeftButton:
-            self.dragging = False
             mouse_release_pos = event.globalPos()
             distance_moved = (mouse_release_pos - self.mouse_press_pos).manhattanLength()
-            
-            # Si c'est un clic (pas un drag)
-            if distance_moved < CLICK_THRESHOLD and not self.is_dead:
-                self._click_count += 1
-                
-                if self._click_count >= DEAD_ANIMATION_THRESHOLD:
-                    self._play_dead_animation()
-                    self._click_count = 0
-                else:
-                    self._play_one_shot_animation('Hurt')
-                    
-                    # Messages selon le nombre de clics
-                    if self._click_count == 1:
-                        self.show_bubble("Aïe ! 😿", "normal", 2000)
-                    elif self._click_count == 2:
-                        self.show_bubble("Arrête ! 😾", "alert", 2000)
-                    elif self._click_count >= 3:
-                        self.show_bubble("Tu me fais mal ! 😭", "alert", 2000)
-            
-            elif self.is_dead:
-                self._click_count = 0
-            
-            # Reprendre les activités normales si pas mort
-            if not self.is_dead:
-                if not self._is_manual_moving and not self.active_food_items:
-                    self.random_behavior_timer.start(MOVEMENT_CHANGE_DELAY)
-                
-                if (config_manager.get("sound_enabled", True) and 
-                    self.media_player.state() == QMediaPlayer.StoppedState):
-                    self.audio_play_timer.start(random.randint(1000, 5000))
-        
-        # Vérifier si on doit chasser de la nourriture
-        if (not self.dragging and not self.target_food_item and 
-            self.active_food_items and not self.is_dead):
-            self.target_food_item = self.active_food_items[0]
-            if self.target_food_item:
-                pass
+        
+            # Un clic (pas un drag) fait mal, trop de clics mettent K.O.
+            clicks = self.sim.release(distance_moved < CLICK_THRESHOLD)
+            self._world_changed()
+        
+            # Messages selon le nombre de clics
+            if clicks == 1:
+                self.show_bubble("Aïe ! 😿", "normal", 2000, "chat", "click")
+            elif clicks == 2:
+                self.show_bubble("Arrête ! 😾", "alert", 2000, "chat", "click")
+            elif 3 <= clicks < DEAD_ANIMATION_THRESHOLD:
+                self.show_bubble("Tu me fais mal ! 😭", "alert", 2000, "chat", "click")
+        
+            # Reprendre les sons si pas mort
+            if (not self.sim.is_dead and 
+                config_manager.get("sound_enabled", True) and 
+                self.media_player.state() == QMediaPlayer.StoppedState):
+                self.audio_play_timer.start(random.randint(1000, 5000))
     
     def _toggle_quiet_mode(self):
         """Active/désactive le mode tranquille"""
-        self.quiet_mode = not self.quiet_mode
+        self.sim.set_quiet(not self.sim.quiet_mode)
+        self._world_changed()
         
-        if self.quiet_mode:
-            # Arrêter tous les mouvements et sons
-            self.random_behavior_timer.stop()
+        if self.sim.quiet_mode:
+            # Arrêter tous les sons (la simulation arrête les mouvements)
             self.audio_play_timer.stop()
             self.random_message_timer.stop()
             self.poop_spawn_timer.stop()
             self.media_player.stop()
             
-            # Arrêter les mouvements en cours
-            self.cat_velocity_x = 0.0
-            self.cat_velocity_y = 0.0
-            self.is_edge_running = False
-            self.is_sliding = False
-            self._set_animation('Idle')
-            
             # Mettre à jour l'interface
             self.stay_quiet_action.setText("😸 Reprendre activité")
-            self.show_bubble("😴 Mode tranquille activé - Je vais me reposer un peu...", "info", 4000)
+            self.show_bubble("😴 Mode tranquille activé - Je vais me reposer un peu...", "info", 4000,
+                             "chat", "quiet")
             
             # Planifier un retour à l'activité plus tard (30-60 secondes)
             QTimer.singleShot(random.randint(30000, 60000), self._check_activity)
@@ -1617,9 +1319,9 @@ class MinouPet(QWidget):
             self._resume_activity()
             
             self.stay_quiet_action.setText("😴 Rester tranquille")
-            self.show_bubble("😸 Je reprends mes activités !", "love", 2000)
+            self.show_bubble("😸 Je reprends mes activités !", "love", 2000, "chat", "quiet")
 
-# ... (code inchangé)
+    def closeEvent(self, event):
         """Gestion de la fermeture de l'application"""
         if self.control_box:
             self.control_box.close()
@@ -1633,12 +1335,17 @@ class MinouPet(QWidget):
         # Arrêter tous les timers
         self.media_player.stop()
         self.audio_play_timer.stop()
-        self._dead_animation_cooldown_timer.stop()
         self.random_message_timer.stop()
         
-        # Nettoyer les objets
-        self.clear_all_food()
-        self.clear_all_poop()
+        # En quittant : dernière sauvegarde du monde, puis nettoyage des objets.
+        # Si l'application continue dans la barre système, l'animal est
+        # seulement masqué et ses objets restent (comme avec "Masquer")
+        if QApplication.quitOnLastWindowClosed():
+            self._save_world_now()
+            self.clear_all_food()
+            self.clear_all_poop()
+            self.food_pool.clear()
+            self.poop_pool.clear()
         
         # Arrêter les threads
         if self.conversation_thread and self.conversation_thread.isRunning():
@@ -0,0 +1,141 @@
+"""
+Géométrie des écrans pour Minou - cache multi-écrans de availableGeometry
+"""
+import random
+from PyQt5.QtCore import QObject, QRect, pyqtSignal
+from PyQt5.QtGui import QGuiApplication
+
+# Écart toléré entre deux écrans voisins (barre des tâches sur un bord commun)
+ADJACENT_TOLERANCE = 80
+
+
+class ScreenGeometry(QObject):
+    """Zones disponibles de chaque écran, recalculées uniquement quand un
+    écran est ajouté, retiré ou change de géométrie"""
+
+    changed = pyqtSignal()
+
+    def __init__(self):
+        super().__init__()
+        self._rects = None   # (left, top, right, bottom), bornes droite/bas exclues
+        self._areas = {}     # (écran, écrans sur la ligne, sur la colonne) -> zone
+        self._connected_app = None
+        self._connected_screens = set()
+
+    def _ensure(self):
+        if self._rects is not None:
+            return self._rects
+
+        app = QGuiApplication.instance()
+        if app is not None and self._connected_app is not app:
+            app.screenAdded.connect(self._on_screen_added)
+            app.screenRemoved.connect(self._on_screen_removed)
+            app.primaryScreenChanged.connect(self.invalidate)
+            self._connected_app = app
+
+        screens = QGuiApplication.screens() if app is not None else []
+        primary = QGuiApplication.primaryScreen() if app is not None else None
+        screens.sort(key=lambda screen: screen is not primary)  # primaire en premier
+
+        self._rects = []
+        for screen in screens:
+            self._watch_screen(screen)
+            rect = screen.availableGeometry()
+            self._rects.append((rect.left(), rect.top(),
+                                rect.left() + rect.width(), rect.top() + rect.height()))
+        if not self._rects:
+            self._rects.append((0, 0, 800, 600))
+        return self._rects
+
+    def _watch_screen(self, screen):
+        if id(screen) in self._connected_screens:
+            return
+        screen.availableGeometryChanged.connect(self.invalidate)
+        screen.geometryChanged.connect(self.invalidate)
+        self._connected_screens.add(id(screen))
+
+    def _on_screen_added(self, screen):
+        self._watch_screen(screen)
+        self.invalidate()
+
+    def _on_screen_removed(self, screen):
+        self._connected_screens.discard(id(screen))
+        self.invalidate()
+
+    def invalidate(self, *args):
+        self._rects = None
+        self._areas.clear()
+        self.changed.emit()
+
+    @staticmethod
+    def _to_qrect(rect):
+        left, top, right, bottom = rect
+        return QRect(left, top, right - left, bottom - top)
+
+    def _index_at(self, x, y):
+        """Index de l'écran contenant le point, sinon du plus proche"""
+        rects = self._ensure()
+        best, best_distance = 0, None
+        for index, (left, top, right, bottom) in enumerate(rects):
+            dx = max(left - x, 0, x - right + 1)
+            dy = max(top - y, 0, y - bottom + 1)
+            if dx == 0 and dy == 0:
+                return index
+            distance = dx * dx + dy * dy
+            if best_distance is None or distance < best_distance:
+                best, best_distance = index, distance
+        return best
+
+    def screens(self):
+        return [self._to_qrect(rect) for rect in self._ensure()]
+
+    def primary(self):
+        return self._to_qrect(self._ensure()[0])
+
+    def screen_at(self, x, y):
+        """Zone disponible de l'écran contenant (x, y) ou le plus proche"""
+        return self._to_qrect(self._ensure()[self._index_at(x, y)])
+
+    def random_screen(self):
+        """Écran tiré au hasard, pondéré par sa surface"""
+        rects = self._ensure()
+        weights = [(right - left) * (bottom - top) for left, top, right, bottom in rects]
+        return self._to_qrect(random.choices(rects, weights)[0])
+
+    def area_at(self, x, y):
+        """Zone de déplacement autour de (x, y) : l'écran courant prolongé par
+        les écrans voisins qu'une ligne passant par le point permet d'atteindre"""
+        rects = self._ensure()
+        index = self._index_at(x, y)
+        left, top, right, bottom = rects[index]
+
+        # Le résultat ne dépend que des écrans traversés par les lignes du point
+        key = (index,
+               tuple(i for i, r in enumerate(rects) if r[1] <= y < r[3]),
+               tuple(i for i, r in enumerate(rects) if r[0] <= x < r[2]))
+        area = self._areas.get(key)
+        if area is not None:
+            return area
+
+        extended = True
+        while extended:
+            extended = False
+            for r_left, r_top, r_right, r_bottom in rects:
+                if r_top <= y < r_bottom:
+                    if r_left < left and abs(r_right - left) <= ADJACENT_TOLERANCE:
+                        left, extended = r_left, True
+                    elif r_right > right and abs(r_left - right) <= ADJACENT_TOLERANCE:
+                        right, extended = r_right, True
+                if r_left <= x < r_right:
+                    if r_top < top and abs(r_bottom - top) <= ADJACENT_TOLERANCE:
+                        top, extended = r_top, True
+                    elif r_bottom > bottom and abs(r_top - bottom) <= ADJACENT_TOLERANCE:
+                        bottom, extended = r_bottom, True
+
+        area = self._to_qrect((left, top, right, bottom))
+        self._areas[key] = area
+        return area
+
+
+# Instance globale
+screen_geometry = ScreenGeometry()
@@ -0,0 +1,975 @@
+"""
+Moteur de simulation de Minou - état, physique et comportement de l'animal
+sans aucun widget : tourne sans écran, en temps réel ou plus vite, sur une
+horloge injectée. MinouPet n'en est que le rendu.
+"""
+import heapq
+import math
+import random
+import time
+from collections import Counter
+
+from config import (CAT_WIDTH, CAT_HEIGHT, ANIMATION_FRAME_RATE, ANIMATION_FRAMES,
+                    MOVEMENT_SPEED, MOVEMENT_CHANGE_DELAY, RUN_SPEED_MULTIPLIER,
+                    JUMP_INITIAL_VELOCITY, GRAVITY, DEAD_ANIMATION_THRESHOLD,
+                    PHYSICS_STEP_MS, MAX_PHYSICS_STEPS, SPATIAL_CELL_SIZE, config_manager)
+from spatial import SpatialGrid
+
+
+class MonotonicClock:
+    """Horloge réelle (secondes)"""
+
+    def now(self):
+        return time.monotonic()
+
+
+class ManualClock:
+    """Horloge simulée : le temps n'avance que par advance()"""
+
+    def __init__(self, start=0.0):
+        self.time = start
+
+    def now(self):
+        return self.time
+
+    def advance(self, seconds):
+        self.time += seconds
+
+
+class SimTimers:
+    """Timers de la simulation sur son propre temps (secondes).
+
+    Les timers nommés se comportent comme des QTimer (répétitifs, redémarrer
+    remplace l'échéance) ; call_later est l'équivalent de QTimer.singleShot.
+    """
+
+    def __init__(self):
+        self._heap = []       # (échéance, seq, nom, callback, intervalle ou None)
+        self._named = {}      # nom -> seq de l'entrée valide
+        self._seq = 0
+        self.now = 0.0
+
+    def _push(self, due, name, callback, interval):
+        self._seq += 1
+        heapq.heappush(self._heap, (due, self._seq, name, callback, interval))
+        return self._seq
+
+    def start(self, name, delay_ms, callback):
+        self._named[name] = self._push(self.now + delay_ms / 1000.0, name, callback,
+                                       delay_ms / 1000.0)
+
+    def stop(self, name):
+        self._named.pop(name, None)
+
+    def is_active(self, name):
+        return name in self._named
+
+    def call_later(self, delay_ms, callback):
+        self._push(self.now + delay_ms / 1000.0, None, callback, None)
+
+    def _is_stale(self, seq, name):
+        return name is not None and self._named.get(name) != seq
+
+    def next_due(self):
+        while self._heap and self._is_stale(self._heap[0][1], self._heap[0][2]):
+            heapq.heappop(self._heap)
+        return self._heap[0][0] if self._heap else None
+
+    def run_due(self, now):
+        """Exécute dans l'ordre tous les timers échus à `now`"""
+        fired = 0
+        while True:
+            due = self.next_due()
+            if due is None or due > now:
+                break
+            _, seq, name, callback, interval = heapq.heappop(self._heap)
+            self.now = due
+            if name is not None:
+                # Timer répétitif : réarmer avant l'appel (qui peut le redémarrer)
+                self._named[name] = self._push(due + interval, name, callback, interval)
+            callback()
+            fired += 1
+        self.now = now
+        return fired
+
+
+class SimFood:
+    """Nourriture de la simulation sans écran"""
+
+    def __init__(self, x, y, size=40):
+        self.x, self.y, self.size = x, y, size
+        self.visible = True
+
+    def sim_rect(self):
+        return (self.x, self.y, self.size, self.size)
+
+    def sim_visible(self):
+        return self.visible
+
+
+def _food_visible(food):
+    return food.sim_visible()
+
+
+def default_bounds(x, y):
+    """Zone de déplacement par défaut (un écran 1920x1080)"""
+    return (0, 0, 1920, 1080)
+
+
+class PetSimulation:
+    """État et comportement de l'animal.
+
+    - `bounds(x, y)` donne la zone (gauche, haut, largeur, hauteur) autour d'un point
+    - `listener(event, *args)` reçoit les événements pour le rendu :
+      "animation", "bubble", "food_eaten", "one_shot_finished", "died",
+      "dead_frame_reached", "wake" (l'animal peut se remettre à bouger)
+    - la nourriture expose sim_rect() et sim_visible()
+    """
+
+    def __init__(self, clock=None, bounds=default_bounds, listener=None,
+                 rng=None, width=CAT_WIDTH, height=CAT_HEIGHT, verbose=True):
+        self.clock = clock or MonotonicClock()
+        self.bounds = bounds
+        self.listener = listener
+        self.rng = rng or random.Random()
+        self.width = width
+        self.height = height
+        self.verbose = verbose
+        self.timers = SimTimers()
+        self.stats = Counter()
+        self._advancing = False
+
+        # Nombre de frames par animation et durée réelle d'une frame (ms) :
+        # les animations uniques se terminent avec leur dernière frame affichée
+        self.frame_counts = dict(ANIMATION_FRAMES)
+        self.frame_interval_ms = ANIMATION_FRAME_RATE
+
+        # Temps de la physique (en retard de moins d'un pas sur l'horloge)
+        self.time = self.clock.now()
+        self.timers.now = self.time
+
+        # Position et mouvement
+        self.x = 0.0
+        self.y = 0.0
+        self.previous_x = 0.0
+        self.previous_y = 0.0
+        self._velocity_x = 0.0
+        self._velocity_y = 0.0
+        self.moving_right = True
+        self.animation = 'Idle'
+
+        # États
+        self.is_dead = False
+        self.is_playing_one_shot = False
+        self.is_jumping = False
+        self.is_manual_moving = False
+        self.is_edge_running = False
+        self.is_sliding = False
+        self.dragging = False
+        self.quiet_mode = False
+        self.click_count = 0
+
+        # Objets et cibles
+        self.foods = []
+        self.food_index = SpatialGrid(SPATIAL_CELL_SIZE)  # coin haut-gauche de chaque nourriture
+        self._visible_foods = set()  # tenu à jour pour is_idle(), appelé à chaque tick
+        self.target_food = None
+        self.target_x = 0
+        self.target_y = 0
+        self.slide_target = (0, 0)
+
+    # --- Événements et vitesses ---
+
+    def _emit(self, event, *args):
+        if self.listener is not None:
+            self.listener(event, *args)
+
+    def _wake(self):
+        """À appeler avant tout changement qui peut remettre l'animal en mouvement"""
+        self._skip_idle_time()
+        self._emit("wake")
+
+    def _skip_idle_time(self):
+        """N'exécute ni timer ni pas de physique : le temps passé à l'arrêt est
+        seulement sauté, et le prochain advance() repart de maintenant (en
+        lançant d'abord les timers arrivés à échéance entre-temps)"""
+        if not self._advancing and self.is_idle():
+            self.time = max(self.time, self.clock.now())
+            self.timers.now = self.time
+            self.previous_x, self.previous_y = self.x, self.y
+
+    @property
+    def velocity_x(self):
+        return self._velocity_x
+
+    @velocity_x.setter
+    def velocity_x(self, value):
+        if value:
+            self._wake()
+        self._velocity_x = value
+
+    @property
+    def velocity_y(self):
+        return self._velocity_y
+
+    @velocity_y.setter
+    def velocity_y(self, value):
+        if value:
+            self._wake()
+        self._velocity_y = value
+
+    def _start_timer(self, name, delay_ms, callback):
+        # "wake" une fois le timer en file : le rendu peut viser son échéance
+        self._skip_idle_time()
+        self.timers.start(name, delay_ms, callback)
+        self._emit("wake")
+
+    def _call_later(self, delay_ms, callback):
+        self._skip_idle_time()
+        self.timers.call_later(delay_ms, callback)
+        self._emit("wake")
+
+    def start_behavior(self, delay_ms):
+        """(Re)programme le prochain comportement aléatoire"""
+        self._start_timer("behavior", delay_ms, self.random_movement)
+
+    def stop_behavior(self):
+        self.timers.stop("behavior")
+
+    # --- Boucle principale ---
+
+    def is_idle(self):
+        """Vrai si un pas de physique ne changerait rien"""
+        if self.is_dead or self.dragging:
+            return True
+        return (not self.is_jumping and not self.is_sliding and not self.is_edge_running and
+                self._velocity_x == 0 and self._velocity_y == 0 and
+                not self._visible_foods)
+
+    def next_timer_due(self):
+        return self.timers.next_due()
+
+    def advance(self, now=None, max_steps=MAX_PHYSICS_STEPS):
+        """Avance la simulation jusqu'à `now` par pas fixes de PHYSICS_STEP_MS.
+
+        À l'arrêt, le temps saute directement au prochain timer. Retourne la
+        fraction de pas restante pour interpoler l'affichage.
+        """
+        now = self.clock.now() if now is None else now
+        self._advancing = True
+        try:
+            return self._advance(now, max_steps)
+        finally:
+            self._advancing = False
+
+    def _advance(self, now, max_steps):
+        step = PHYSICS_STEP_MS / 1000.0
+        steps = 0
+        while True:
+            if self.is_idle():
+                due = self.timers.next_due()
+                if due is None or due > now:
+                    self.time = max(self.time, now)
+                    self.timers.now = self.time
+                    self.previous_x, self.previous_y = self.x, self.y
+                    return 1.0
+                self.time = max(self.time, due)
+                self.timers.run_due(self.time)
+                continue
+
+            if self.time + step > now:
+                break
+            if max_steps is not None and steps >= max_steps:
+                # Trop de retard (machine suspendue, grosse charge) : abandonner l'arriéré
+                self.time = now - step
+                break
+
+            self.time += step
+            self.timers.run_due(self.time)
+            self.previous_x, self.previous_y = self.x, self.y
+            self.step()
+            steps += 1
+
+        return min(1.0, max(0.0, (now - self.time) / step))
+
+    def run_for(self, seconds, chunk=60.0):
+        """Simule `seconds` secondes d'un coup (horloge ManualClock)"""
+        end = self.clock.now() + seconds
+        while self.clock.now() < end:
+            self.clock.advance(min(chunk, end - self.clock.now()))
+            self.advance(self.clock.now(), max_steps=None)
+
+    def render_position(self, alpha):
+        """Position affichée entre les deux derniers pas"""
+        return (self.previous_x + (self.x - self.previous_x) * alpha,
+                self.previous_y + (self.y - self.previous_y) * alpha)
+
+    def place(self, x, y):
+        """Place l'animal directement (sans interpolation)"""
+        self.x = self.previous_x = float(x)
+        self.y = self.previous_y = float(y)
+
+    def area(self):
+        """Zone de déplacement autour du centre de l'animal"""
+        return self.bounds(int(self.x) + self.width // 2, int(self.y) + self.height // 2)
+
+    def clamp_to(self, area):
+        """Ramène l'animal dans `area` (gauche, haut, largeur, hauteur), sans pas de physique"""
+        left, top, area_width, area_height = area
+        x = max(left, min(self.x, left + area_width - self.width))
+        y = max(top, min(self.y, top + area_height - self.height))
+        self.place(x, y)
+
+    # --- Animations ---
+
+    def set_animation(self, animation_name):
+        """Change l'animation actuelle"""
+        if (self.is_playing_one_shot and
+                animation_name != self.animation and
+                animation_name != 'Dead'):
+            return
+
+        if not self.frame_counts.get(animation_name):
+            animation_name = 'Idle'
+
+        if self.animation != animation_name:
+            self.animation = animation_name
+            self._emit("animation", animation_name)
+
+    def _force_animation(self, animation_name):
+        self.animation = animation_name
+        self._emit("animation", animation_name)
+
+    # --- Physique ---
+
+    def step(self):
+        """Avance la physique d'un pas fixe"""
+        if self.is_dead or self.dragging:
+            return
+        self.stats["physics_steps"] += 1
+
+        # Zone de l'écran courant, prolongée vers les écrans voisins
+        left, top, area_width, area_height = self.area()
+        min_x = float(left)
+        min_y = float(top)
+        max_x = left + area_width - self.width
+        ground_y = float(top + area_height - self.height)
+
+        # Gestion des sauts avec gravité
+        if self.is_jumping:
+            self._handle_jumping(min_x, ground_y, max_x)
+            return
+
+        # Ne pas bouger pendant certaines animations
+        if self.is_playing_one_shot and not self.is_jumping:
+            return
+
+        # Gestion de la poursuite de nourriture
+        self._handle_food_chasing()
+
+        # Mise à jour de la position
+        self.x += self.velocity_x
+        self.y += self.velocity_y
+
+        # Gestion des différents types de mouvements
+        if self.is_sliding:
+            self._handle_sliding(min_x, min_y, max_x, ground_y)
+        elif self.is_edge_running:
+            self._handle_edge_running(min_x, min_y, max_x, ground_y)
+        else:
+            self._handle_normal_movement(min_x, min_y, max_x, ground_y)
+
+    def _handle_jumping(self, min_x, ground_y, max_x):
+        """Gère la physique des sauts"""
+        self.velocity_y += GRAVITY
+        self.y += self.velocity_y
+
+        # Atterrissage
+        if self.y >= ground_y:
+            self.y = ground_y
+            self.velocity_y = 0.0
+            self.is_jumping = False
+            self.is_playing_one_shot = False
+            self.set_animation('Idle')
+
+            if not self.is_manual_moving:
+                self.start_behavior(MOVEMENT_CHANGE_DELAY)
+
+        # Mouvement horizontal pendant le saut
+        self.x += self.velocity_x
+        self.x = max(min_x, min(self.x, float(max_x)))
+
+    def _handle_food_chasing(self):
+        """Gère la logique de poursuite de nourriture"""
+        if (self.is_manual_moving or self.is_sliding or
+                self.is_jumping or self.is_playing_one_shot):
+            return
+
+        # Chercher la nourriture la plus proche
+        if not self.target_food or not self.target_food.sim_visible():
+            self.target_food = self.food_index.nearest(int(self.x), int(self.y),
+                                                       accept=_food_visible)
+
+        # Poursuivre la nourriture ciblée
+        if self.target_food and self.target_food.sim_visible():
+            food_x, food_y, food_width, food_height = self.target_food.sim_rect()
+            target_x = food_x + food_width // 2
+            target_y = food_y + food_height // 2
+
+            dx = target_x - (self.x + self.width // 2)
+            dy = target_y - (self.y + self.height // 2)
+            distance = math.sqrt(dx*dx + dy*dy)
+
+            # Manger la nourriture si assez proche
+            if distance < 30:
+                food = self.target_food
+                self.remove_food(food)
+                self.stats["food_eaten"] += 1
+                self._emit("food_eaten", food)
+                self.target_food = None
+                self.velocity_x = 0.0
+                self.velocity_y = 0.0
+                self.set_animation('Idle')
+
+                # Montrer satisfaction
+                self._emit("bubble", "Miam miam ! Délicieux ! 😋", "love", 2000)
+
+                if not self.is_manual_moving and not self.foods:
+                    self.start_behavior(MOVEMENT_CHANGE_DELAY)
+            else:
+                # Courir vers la nourriture
+                self.stop_behavior()
+                speed = config_manager.get("movement_speed", MOVEMENT_SPEED)
+                self.velocity_x = (dx / distance) * speed * RUN_SPEED_MULTIPLIER
+                self.velocity_y = (dy / distance) * speed * RUN_SPEED_MULTIPLIER
+                self.set_animation('Run')
+
+    def _handle_sliding(self, min_x, min_y, max_x, ground_y):
+        """Gère le mouvement de glissade"""
+        slide_x, slide_y = self.slide_target
+
+        # Vérifier si on a atteint la cible
+        target_reached_x = (
+            (self.velocity_x > 0 and self.x >= slide_x) or
+            (self.velocity_x < 0 and self.x <= slide_x) or
+            abs(self.velocity_x) < 0.1
+        )
+
+        target_reached_y = (
+            (self.velocity_y > 0 and self.y >= slide_y) or
+            (self.velocity_y < 0 and self.y <= slide_y) or
+            abs(self.velocity_y) < 0.1
+        )
+
+        if target_reached_x and (self.velocity_y == 0 or target_reached_y):
+            # Fin de la glissade
+            self.x = float(slide_x)
+            if self.velocity_y != 0:
+                self.y = float(slide_y)
+
+            self.is_sliding = False
+            self.velocity_x = 0.0
+            self.velocity_y = 0.0
+            self.set_animation('Idle')
+
+            if not self.is_manual_moving and not self.target_food:
+                self.start_behavior(MOVEMENT_CHANGE_DELAY)
+        else:
+            # Continuer la glissade
+            self.x = max(min_x, min(self.x, float(max_x)))
+            self.y = max(min_y, min(self.y, ground_y))
+
+            # Mettre à jour la direction
+            if self.velocity_x > 0:
+                self.moving_right = True
+            elif self.velocity_x < 0:
+                self.moving_right = False
+
+            self.set_animation('Slide')
+
+    def _handle_edge_running(self, min_x, min_y, max_x, ground_y):
+        """Gère la course vers les bords"""
+        self.x = max(min_x, min(self.x, float(max_x)))
+        self.y = max(min_y, min(self.y, ground_y))
+
+        # Vérifier si on a atteint la cible ou un bord
+        target_reached = (
+            abs(self.x - self.target_x) < 10 and
+            abs(self.y - self.target_y) < 10
+        )
+
+        hit_boundary = (
+            self.x <= min_x or self.x >= max_x or
+            self.y <= min_y or self.y >= ground_y
+        )
+
+        if target_reached or hit_boundary:
+            self.is_edge_running = False
+            self.velocity_x = 0.0
+            self.velocity_y = 0.0
+            self.set_animation('Idle')
+
+            if not self.is_manual_moving and not self.target_food:
+                self.start_behavior(MOVEMENT_CHANGE_DELAY)
+        else:
+            # Continuer la course
+            if self.velocity_x > 0:
+                self.moving_right = True
+            elif self.velocity_x < 0:
+                self.moving_right = False
+            self.set_animation('Run')
+
+    def _handle_normal_movement(self, min_x, min_y, max_x, ground_y):
+        """Gère les mouvements normaux avec rebonds"""
+        free = not self.is_manual_moving and not self.target_food
+
+        # Rebonds sur les bords
+        if self.x < min_x:
+            self.x = min_x
+            if free:
+                self.velocity_x *= -1
+        elif self.x > max_x:
+            self.x = float(max_x)
+            if free:
+                self.velocity_x *= -1
+
+        if self.y < min_y:
+            self.y = min_y
+            if free:
+                self.velocity_y *= -1
+        elif self.y > ground_y:
+            self.y = ground_y
+            if free:
+                self.velocity_y *= -1
+
+        # Mettre à jour la direction
+        if self.velocity_x > 0:
+            self.moving_right = True
+        elif self.velocity_x < 0:
+            self.moving_right = False
+
+        # Choisir l'animation appropriée
+        if not self.is_playing_one_shot:
+            has_velocity = abs(self.velocity_x) > 0.1 or abs(self.velocity_y) > 0.1
+
+            if free:
+                if has_velocity and self.animation != 'Walk':
+                    self.set_animation('Walk')
+                elif not has_velocity and self.animation != 'Idle':
+                    self.set_animation('Idle')
+            elif self.is_manual_moving:
+                self.set_animation('Walk' if has_velocity else 'Idle')
+
+    # --- Comportements ---
+
+    def random_movement(self):
+        """Génère un mouvement aléatoire avec de longues pauses"""
+        if (self.is_playing_one_shot or self.is_sliding or
+                self.is_manual_moving or self.is_dead or self.target_food or
+                self.quiet_mode):
+            return
+
+        choice = self.rng.random()
+        speed = config_manager.get("movement_speed", MOVEMENT_SPEED)
+
+        # NOUVELLES PROBABILITÉS : Beaucoup plus de pauses !
+        if choice < 0.60:  # 60% de chance de ne rien faire (LONG IDLE)
+            self.stats["behavior:idle"] += 1
+            self.velocity_x = 0.0
+            self.velocity_y = 0.0
+            self.set_animation('Idle')
+
+            # Programmer le prochain mouvement dans LONGTEMPS
+            next_delay = self.rng.choice([
+                self.rng.randint(30000, 60000),    # 30s-1min (40% de chance)
+                self.rng.randint(60000, 120000),   # 1-2min (30% de chance)
+                self.rng.randint(120000, 300000),  # 2-5min (20% de chance)
+            ])
+
+            if self.verbose:
+                print(f"😴 Minou se repose pendant {next_delay//1000} secondes")
+            self.start_behavior(next_delay)
+
+        elif choice < 0.75:  # 15% de chance de marcher un peu
+            self.stats["behavior:walk"] += 1
+            angle = self.rng.uniform(0, 2 * math.pi)
+            self.velocity_x = speed * self.rng.uniform(0.5, 1.0) * math.cos(angle)
+            self.velocity_y = speed * self.rng.uniform(0.5, 1.0) * math.sin(angle)
+            self.set_animation('Walk')
+
+            # Marcher pendant peu de temps seulement
+            self._call_later(self.rng.randint(3000, 8000), self.stop_walking)  # 3-8 secondes
+
+            # Prochain comportement dans un délai moyen
+            self.start_behavior(self.rng.randint(20000, 90000))  # 20s-1.5min
+
+        elif choice < 0.85:  # 10% de chance de courir vers un bord
+            self.stats["behavior:edge_run"] += 1
+            self.start_edge_run()
+            # Edge run programme son propre prochain délai
+            next_delay = self.rng.randint(45000, 180000)  # 45s-3min après la course
+            self._call_later(10000, lambda: self.start_behavior(next_delay))
+
+        elif choice < 0.92:  # 7% de chance de glisser
+            self.stats["behavior:slide"] += 1
+            self.start_slide()
+            # Même logique que pour la course
+            next_delay = self.rng.randint(30000, 120000)  # 30s-2min après glissade
+            self._call_later(8000, lambda: self.start_behavior(next_delay))
+
+        else:  # 8% de chance de sauter
+            self.stats["behavior:jump"] += 1
+            self.play_one_shot('Jump')
+            # Délai après le saut
+            next_delay = self.rng.randint(25000, 90000)  # 25s-1.5min
+            self._call_later(5000, lambda: self.start_behavior(next_delay))
+
+    def stop_walking(self):
+        """Arrête la marche et met en idle"""
+        if not self.is_playing_one_shot and not self.is_manual_moving:
+            self.velocity_x = 0.0
+            self.velocity_y = 0.0
+            self.set_animation('Idle')
+
+    def start_edge_run(self):
+        """Démarre une course vers un bord aléatoire"""
+        left, top, area_width, area_height = self.area()
+        right = left + area_width - self.width
+        bottom = top + area_height - self.height
+        edge = self.rng.choice(['top', 'bottom', 'left', 'right'])
+
+        if edge == 'top':
+            self.target_x = self.rng.randint(left, right)
+            self.target_y = top
+        elif edge == 'bottom':
+            self.target_x = self.rng.randint(left, right)
+            self.target_y = bottom
+        elif edge == 'left':
+            self.target_x = left
+            self.target_y = self.rng.randint(top, bottom)
+        else:  # right
+            self.target_x = right
+            self.target_y = self.rng.randint(top, bottom)
+
+        dx = float(self.target_x) - self.x
+        dy = float(self.target_y) - self.y
+        distance = math.sqrt(dx*dx + dy*dy)
+
+        if distance < 1.0:
+            return
+
+        speed = config_manager.get("movement_speed", MOVEMENT_SPEED)
+        self.velocity_x = (dx / distance) * speed * RUN_SPEED_MULTIPLIER
+        self.velocity_y = (dy / distance) * speed * RUN_SPEED_MULTIPLIER
+        self.is_edge_running = True
+        self.set_animation('Run')
+
+    def start_slide(self):
+        """Démarre une glissade"""
+        left, top, area_width, area_height = self.area()
+        right = left + area_width - self.width
+        bottom = top + area_height - self.height
+
+        if self.rng.choice(['horizontal', 'diagonal_down']) == 'horizontal':
+            # Glissade horizontale
+            self.target_y = int(self.y)
+
+            # Choisir une direction avec assez d'espace
+            min_distance = 100
+            possible_targets = []
+
+            if self.x + min_distance < right:
+                possible_targets.extend(range(int(self.x + min_distance), right))
+
+            if self.x - min_distance > left:
+                possible_targets.extend(range(left, int(self.x - min_distance)))
+
+            self.target_x = self.rng.choice(possible_targets) if possible_targets else int(self.x)
+
+        else:  # diagonal_down
+            # Glissade diagonale vers le bas
+            min_y = int(self.y + 50)
+            self.target_y = self.rng.randint(min_y, bottom) if min_y < bottom else int(self.y)
+
+            # Position X légèrement décalée
+            offset = self.rng.randint(-100, 100)
+            self.target_x = max(left, min(int(self.x + offset), right))
+
+        # Calculer la vélocité
+        dx = float(self.target_x) - self.x
+        dy = float(self.target_y) - self.y
+        distance = math.sqrt(dx*dx + dy*dy)
+
+        if distance < 1.0:
+            return
+
+        speed = config_manager.get("movement_speed", MOVEMENT_SPEED) * 1.5
+        self.velocity_x = (dx / distance) * speed
+        self.velocity_y = (dy / distance) * speed
+
+        self.is_sliding = True
+        self.slide_target = (self.target_x, self.target_y)
+        self.set_animation('Slide')
+
+    def play_one_shot(self, animation_name):
+        """Joue une animation unique (non-looping)"""
+        if self.is_dead or not self.frame_counts.get(animation_name):
+            return False
+
+        self.is_playing_one_shot = True
+        self.stop_behavior()
+        self.is_manual_moving = False
+        self.velocity_x = 0.0
+
+        if animation_name == 'Jump':
+            self.velocity_y = -JUMP_INITIAL_VELOCITY
+            self.is_jumping = True
+        else:
+            self.velocity_y = 0.0
+            duration_ms = self.frame_counts[animation_name] * self.frame_interval_ms
+            self._call_later(duration_ms, self._one_shot_finished)
+
+        self._force_animation(animation_name)
+        return True
+
+    def _one_shot_finished(self):
+        """Appelé quand une animation unique se termine"""
+        if self.animation == 'Dead':
+            self.is_playing_one_shot = False
+            self.is_dead = True
+            self._emit("dead_frame_reached")
+            return
+
+        self.is_playing_one_shot = False
+        self.set_animation('Idle')
+
+        # CORRECTION : Ne pas redémarrer immédiatement, laisser du temps
+        if not self.is_manual_moving and not self.is_dead and not self.target_food:
+            # Délai aléatoire long avant le prochain mouvement
+            self.start_behavior(self.rng.randint(20000, 120000))  # 20s-2min
+
+        self._emit("one_shot_finished")
+
+    def play_dead(self):
+        """Joue l'animation de mort"""
+        if not self.frame_counts.get('Dead'):
+            return self.play_one_shot('Hurt')
+
+        self.stats["deaths"] += 1
+        self.is_playing_one_shot = True
+        self.stop_behavior()
+        self.target_food = None
+        self.is_dead = True
+
+        # Arrêter tous les mouvements
+        self.is_manual_moving = False
+        self.is_edge_running = False
+        self.is_sliding = False
+        self.is_jumping = False
+        self.velocity_x = 0.0
+        self.velocity_y = 0.0
+
+        self._force_animation('Dead')
+        self._emit("died")
+
+        # Aller à la dernière frame et s'arrêter
+        duration = (self.frame_counts['Dead'] - 1) * self.frame_interval_ms
+        self._call_later(duration, lambda: self._emit("dead_frame_reached"))
+        return True
+
+    def revive(self):
+        """Remet tous les états à zéro après la mort"""
+        self.is_dead = False
+        self.is_playing_one_shot = False
+        self.is_manual_moving = False
+        self.is_edge_running = False
+        self.is_sliding = False
+        self.is_jumping = False
+        self.velocity_x = 0.0
+        self.velocity_y = 0.0
+        self.click_count = 0
+        self.target_food = None
+        self.start_behavior(MOVEMENT_CHANGE_DELAY)
+        self.set_animation('Idle')
+
+    # --- Contrôle manuel ---
+
+    def take_manual_control(self):
+        """Ouverture de la télécommande : plus de mouvements automatiques"""
+        if not self.is_dead:
+            self.stop_behavior()
+
+        self.is_edge_running = False
+        self.is_sliding = False
+        self.is_jumping = False
+        self.is_manual_moving = True
+        self.velocity_x = 0.0
+        self.velocity_y = 0.0
+        self.set_animation('Idle')
+        self.target_food = None
+
+    def start_manual_movement(self, vx, vy):
+        """Démarre un mouvement manuel"""
+        if self.is_jumping or self.is_sliding or self.is_dead:
+            return False
+
+        self.is_manual_moving = True
+        self.stop_behavior()
+        self.is_edge_running = False
+
+        speed = config_manager.get("movement_speed", MOVEMENT_SPEED)
+        self.velocity_x = vx * speed
+        self.velocity_y = vy * speed
+
+        self.set_animation('Walk' if abs(vx) > 0.1 or abs(vy) > 0.1 else 'Idle')
+        self.target_food = None
+        return True
+
+    def stop_manual_movement(self):
+        """Arrête le mouvement manuel"""
+        if not self.is_jumping and not self.is_sliding and not self.is_dead:
+            self.velocity_x = 0.0
+            self.velocity_y = 0.0
+            self.set_animation('Idle')
+
+    def end_manual_control(self):
+        """Fin du contrôle manuel (boîte de contrôle fermée)"""
+        self.is_manual_moving = False
+
+        if not self.is_playing_one_shot and not self.is_dead and not self.foods:
+            self.start_behavior(MOVEMENT_CHANGE_DELAY)
+
+        self.velocity_x = 0.0
+        self.velocity_y = 0.0
+        self.set_animation('Idle')
+
+    # --- Souris ---
+
+    def grab(self):
+        """Début d'un drag : tout mouvement automatique s'arrête"""
+        self.dragging = True
+        self.stop_behavior()
+        self.is_manual_moving = False
+        self.velocity_x = 0.0
+        self.velocity_y = 0.0
+        self.set_animation('Idle')
+        self.is_edge_running = False
+        self.is_sliding = False
+        self.is_jumping = False
+        self.target_food = None
+
+        if self.is_dead:
+            self.is_dead = False  # Permettre de bouger même mort
+
+    def drag_to(self, x, y):
+        self.place(x, y)
+
+    def release(self, clicked):
+        """Fin d'un drag ; `clicked` si la souris n'a presque pas bougé.
+
+        Retourne le nombre de clics consécutifs (0 si ce n'était pas un clic).
+        """
+        self._wake()
+        self.dragging = False
+        clicks = 0
+
+        if clicked and not self.is_dead:
+            self.click_count += 1
+            clicks = self.click_count
+
+            if self.click_count >= DEAD_ANIMATION_THRESHOLD:
+                self.play_dead()
+                self.click_count = 0
+            else:
+                self.play_one_shot('Hurt')
+
+        elif self.is_dead:
+            self.click_count = 0
+
+        # Reprendre les activités normales si pas mort
+        if not self.is_dead and not self.is_manual_moving and not self.foods:
+            self.start_behavior(MOVEMENT_CHANGE_DELAY)
+
+        # Vérifier si on doit chasser de la nourriture
+        if not self.target_food and self.foods and not self.is_dead:
+            self.target_food = self.foods[0]
+        return clicks
+
+    # --- Mode tranquille ---
+
+    def set_quiet(self, quiet):
+        self.quiet_mode = quiet
+        if quiet:
+            # Arrêter les mouvements en cours
+            self.stop_behavior()
+            self.velocity_x = 0.0
+            self.velocity_y = 0.0
+            self.is_edge_running = False
+            self.is_sliding = False
+            self.set_animation('Idle')
+
+    # --- Sauvegarde ---
+
+    def snapshot(self):
+        """État de l'animal à sauvegarder (relu par restore())"""
+        return {"x": round(self.x, 1), "y": round(self.y, 1),
+                "vx": round(self._velocity_x, 3), "vy": round(self._velocity_y, 3),
+                "animation": self.animation, "right": self.moving_right,
+                "quiet": self.quiet_mode}
+
+    def restore(self, state):
+        """Reprend un état sauvegardé. Les animations uniques (saut, glissade,
+        K.O...) ne sont pas rejouées ; une marche reprend quelques secondes."""
+        self.place(state["x"], state["y"])
+        self.moving_right = bool(state["right"])
+        if state["quiet"]:
+            self.set_quiet(True)
+            return
+
+        if state["animation"] in ('Walk', 'Run') and (state["vx"] or state["vy"]):
+            self.velocity_x = state["vx"]
+            self.velocity_y = state["vy"]
+            self.set_animation(state["animation"])
+            self._call_later(self.rng.randint(3000, 8000), self.stop_walking)
+        else:
+            self.set_animation('Idle')
+
+    # --- Nourriture ---
+
+    def add_food(self, food):
+        self._wake()
+        self.foods.append(food)
+        food_x, food_y, _, _ = food.sim_rect()
+        self.food_index.add(food, food_x, food_y)
+        if food.sim_visible():
+            self._visible_foods.add(food)
+
+    def update_food_visibility(self, food):
+        """À appeler quand une nourriture est montrée ou cachée"""
+        if food not in self.food_index:
+            return
+        if food.sim_visible():
+            self._wake()
+            self._visible_foods.add(food)
+        else:
+            self._visible_foods.discard(food)
+
+    def move_food(self, food):
+        """À appeler quand une nourriture a été déplacée (drag)"""
+        if food in self.food_index:
+            food_x, food_y, _, _ = food.sim_rect()
+            self.food_index.add(food, food_x, food_y)
+
+    def remove_food(self, food):
+        if food in self.food_index:
+            self.foods.remove(food)
+            self.food_index.remove(food)
+            self._visible_foods.discard(food)
+        if self.target_food is food:
+            self.target_food = None
+
+    def clear_food(self):
+        self.foods.clear()
+        self.food_index.clear()
+        self._visible_foods.clear()
+        self.target_food = None
@@ -0,0 +1,175 @@
+"""
+Index spatial de Minou - grille uniforme des objets du monde (nourriture...)
+pour trouver le plus proche sans parcourir tous les objets, et placement
+sans chevauchement des objets déposés en lot
+"""
+import math
+import random
+
+
+class SpatialGrid:
+    """Grille de cases carrées de `cell_size` pixels, chaque objet rangé dans
+    la case de son point (x, y).
+
+    add() sert aussi au déplacement ; nearest() explore les cases en anneaux
+    autour du point et s'arrête dès qu'aucun anneau ne peut faire mieux.
+    """
+
+    def __init__(self, cell_size):
+        self.cell_size = cell_size
+        self._cells = {}      # (cx, cy) -> {objet: (x, y)}, ordre d'insertion
+        self._positions = {}  # objet -> (x, y, case)
+        self._bounds = None   # cases extrêmes occupées (min_cx, min_cy, max_cx, max_cy)
+
+    def __len__(self):
+        return len(self._positions)
+
+    def __contains__(self, item):
+        return item in self._positions
+
+    def _cell(self, x, y):
+        return (math.floor(x / self.cell_size), math.floor(y / self.cell_size))
+
+    def add(self, item, x, y):
+        """Range `item` en (x, y), ou le déplace s'il est déjà indexé"""
+        cell = self._cell(x, y)
+        old = self._positions.get(item)
+        if old is not None and old[2] != cell:
+            self._discard(item, old[2])
+        self._positions[item] = (x, y, cell)
+        self._cells.setdefault(cell, {})[item] = (x, y)
+
+        cx, cy = cell
+        if self._bounds is None:
+            self._bounds = (cx, cy, cx, cy)
+        else:
+            min_cx, min_cy, max_cx, max_cy = self._bounds
+            self._bounds = (min(min_cx, cx), min(min_cy, cy), max(max_cx, cx), max(max_cy, cy))
+
+    def remove(self, item):
+        old = self._positions.pop(item, None)
+        if old is not None:
+            self._discard(item, old[2])
+        if not self._positions:
+            self._bounds = None
+
+    def clear(self):
+        self._cells.clear()
+        self._positions.clear()
+        self._bounds = None
+
+    def _discard(self, item, cell):
+        bucket = self._cells[cell]
+        del bucket[item]
+        if not bucket:
+            del self._cells[cell]
+
+    def position(self, item):
+        """(x, y) indexé pour `item`, ou None"""
+        entry = self._positions.get(item)
+        return None if entry is None else entry[:2]
+
+    def nearest(self, x, y, accept=None):
+        """Objet le plus proche de (x, y) pour lequel `accept(objet)` est vrai"""
+        if self._bounds is None:
+            return None
+        cx, cy = self._cell(x, y)
+        min_cx, min_cy, max_cx, max_cy = self._bounds
+        last_ring = max(cx - min_cx, max_cx - cx, cy - min_cy, max_cy - cy, 0)
+
+        best, best_d2 = None, math.inf
+        for ring in range(last_ring + 1):
+            # Tout objet d'un anneau est au moins à (ring - 1) cases du point
+            if best is not None:
+                reach = (ring - 1) * self.cell_size
+                if reach > 0 and reach * reach > best_d2:
+                    break
+            for cell in self._ring(cx, cy, ring):
+                bucket = self._cells.get(cell)
+                if not bucket:
+                    continue
+                for item, (item_x, item_y) in bucket.items():
+                    d2 = (item_x - x) ** 2 + (item_y - y) ** 2
+                    if d2 < best_d2 and (accept is None or accept(item)):
+                        best, best_d2 = item, d2
+        return best
+
+    def within(self, x, y, radius):
+        """Objets à moins de `radius` pixels de (x, y)"""
+        min_cx, min_cy = self._cell(x - radius, y - radius)
+        max_cx, max_cy = self._cell(x + radius, y + radius)
+        r2 = radius * radius
+        found = []
+        for cell_x in range(min_cx, max_cx + 1):
+            for cell_y in range(min_cy, max_cy + 1):
+                bucket = self._cells.get((cell_x, cell_y))
+                if not bucket:
+                    continue
+                found.extend(item for item, (item_x, item_y) in bucket.items()
+                             if (item_x - x) ** 2 + (item_y - y) ** 2 <= r2)
+        return found
+
+    @staticmethod
+    def _ring(cx, cy, ring):
+        """Cases à exactement `ring` cases (distance de Chebyshev) de (cx, cy)"""
+        if ring == 0:
+            yield (cx, cy)
+            return
+        for cell_x in range(cx - ring, cx + ring + 1):
+            yield (cell_x, cy - ring)
+            yield (cell_x, cy + ring)
+        for cell_y in range(cy - ring + 1, cy + ring):
+            yield (cx - ring, cell_y)
+            yield (cx + ring, cell_y)
+
+
+def poisson_disk_points(zones, count, min_distance, existing=(), rng=random, attempts=100):
+    """Jusqu'à `count` points entiers tirés uniformément dans `zones`
+    (gauche, haut, droite, bas ; bornes incluses, pondérées par leur surface),
+    tous à au moins `min_distance` les uns des autres et des points `existing`.
+
+    Échantillonnage de Poisson par rejet : une grille de cases de
+    min_distance/√2 limite chaque test aux 5x5 cases voisines. Quand la place
+    manque (`attempts` échecs de suite), moins de `count` points sont retournés.
+    """
+    zones = [zone for zone in zones if zone[2] >= zone[0] and zone[3] >= zone[1]]
+    if count <= 0 or not zones:
+        return []
+    weights = [(right - left + 1) * (bottom - top + 1) for left, top, right, bottom in zones]
+
+    cell = min_distance / math.sqrt(2)
+    min_d2 = min_distance * min_distance
+    grid = {}  # (cx, cy) -> [(x, y)]
+
+    def cell_of(x, y):
+        return (math.floor(x / cell), math.floor(y / cell))
+
+    def is_free(x, y):
+        cx, cy = cell_of(x, y)
+        for cell_x in range(cx - 2, cx + 3):
+            for cell_y in range(cy - 2, cy + 3):
+                for other_x, other_y in grid.get((cell_x, cell_y), ()):
+                    if (other_x - x) ** 2 + (other_y - y) ** 2 < min_d2:
+                        return False
+        return True
+
+    for x, y in existing:
+        grid.setdefault(cell_of(x, y), []).append((x, y))
+
+    # Arrêt après `attempts` tirages ratés d'affilée : la zone est pleine
+    points = []
+    misses = 0
+    while len(points) < count and misses < attempts:
+        if len(zones) == 1:
+            left, top, right, bottom = zones[0]
+        else:
+            left, top, right, bottom = rng.choices(zones, weights)[0]
+        x = left + int(rng.random() * (right - left + 1))
+        y = top + int(rng.random() * (bottom - top + 1))
+        if is_free(x, y):
+            points.append((x, y))
+            grid.setdefault(cell_of(x, y), []).append((x, y))
+            misses = 0
+        else:
+            misses += 1
+    return points
@@ -0,0 +1,550 @@
+"""
+Chargement et cache des sprites pour Minou
+"""
+import json
+import os
+import random
+import struct
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from PyQt5.QtGui import QIcon, QImage, QPixmap
+from PyQt5.QtCore import Qt, QFileSystemWatcher, QObject, QThread, QTimer, pyqtSignal
+
+from config import ANIMATION_FRAMES, SPRITE_MEMORY_BUDGET_MB, config_manager
+from asset_pack import asset_source
+
+# Ordre de chargement : Idle d'abord (premières frames), puis les plus fréquentes
+ANIMATION_LOAD_ORDER = ['Idle', 'Walk', 'Run', 'Hurt', 'Jump', 'Slide', 'Fall', 'Dead']
+
+
+def sprite_paths(pet_type):
+    """Retourne les noms d'assets des frames de chaque animation d'un type d'animal"""
+    return {
+        anim_name: [f'{pet_type}/{anim_name} ({i}).png' for i in range(1, num_frames + 1)]
+        for anim_name, num_frames in ANIMATION_FRAMES.items()
+    }
+
+
+def decode_sprite(name, width, height, dpr=1.0):
+    """Décode un asset image directement à la taille cible (en pixels physiques)"""
+    reader, source = asset_source.image_reader(name)
+    source_size = reader.size()
+    if source_size.isValid():
+        # Le décodeur produit directement l'image réduite, sans passer par un
+        # QImage pleine résolution côté Python
+        reader.setScaledSize(source_size.scaled(
+            int(round(width * dpr)), int(round(height * dpr)), Qt.KeepAspectRatio
+        ))
+
+    image = reader.read()
+    if image.isNull():
+        return None
+
+    # Format natif des QPixmap : la conversion sur le thread GUI devient une simple copie
+    image = image.convertToFormat(QImage.Format_ARGB32_Premultiplied)
+    image.setDevicePixelRatio(dpr)
+    return image
+
+
+class DecodeReport:
+    """Rapport de temps de décodage, frame par frame"""
+
+    def __init__(self, label):
+        self.label = label
+        self.frames = []  # (nom du fichier, durée en ms)
+        self.wall_ms = 0.0
+
+    def add(self, path, duration_ms):
+        self.frames.append((os.path.basename(path), duration_ms))
+
+    def details(self):
+        """Une ligne par frame, de la plus lente à la plus rapide"""
+        return "\n".join(f"   {name}: {duration:.1f} ms"
+                         for name, duration in sorted(self.frames, key=lambda f: -f[1]))
+
+    def __str__(self):
+        if not self.frames:
+            return f"📊 {self.label}: aucune frame"
+        slowest_name, slowest_ms = max(self.frames, key=lambda f: f[1])
+        total_ms = sum(duration for _, duration in self.frames)
+        return (f"📊 {self.label}: {len(self.frames)} frames en {self.wall_ms:.1f} ms "
+                f"({total_ms / len(self.frames):.1f} ms/frame, "
+                f"max {slowest_ms:.1f} ms: {slowest_name})")
+
+
+_decode_pool = None
+
+
+def _get_decode_pool():
+    """Pool de décodage partagé, dimensionné sur le nombre de cœurs"""
+    global _decode_pool
+    if _decode_pool is None:
+        _decode_pool = ThreadPoolExecutor(max_workers=os.cpu_count() or 1,
+                                          thread_name_prefix="sprite-decode")
+    return _decode_pool
+
+
+def decode_sprites(paths, width, height, dpr=1.0, label="Sprites"):
+    """Décode plusieurs images en parallèle.
+
+    Retourne (images, rapport) ; les images sont dans l'ordre des chemins,
+    None pour celles qui n'ont pas pu être décodées.
+    """
+    report = DecodeReport(label)
+
+    def timed_decode(path):
+        start = time.perf_counter()
+        try:
+            image = decode_sprite(path, width, height, dpr)
+        except Exception as e:
+            print(f"❌ Erreur chargement sprite {path}: {e}")
+            image = None
+        return image, (time.perf_counter() - start) * 1000
+
+    start = time.perf_counter()
+    results = list(_get_decode_pool().map(timed_decode, paths))
+    report.wall_ms = (time.perf_counter() - start) * 1000
+
+    images = []
+    for path, (image, duration_ms) in zip(paths, results):
+        report.add(path, duration_ms)
+        images.append(image)
+    return images, report
+
+
+class SpriteCache:
+    """Cache disque des frames déjà redimensionnées, un fichier par
+    (type d'animal, taille, device pixel ratio)"""
+
+    MAGIC = b"MINOUSPR"
+    VERSION = 2
+    _HEADER = struct.Struct("<8sII")  # magic, version, taille de l'index JSON
+
+    def __init__(self, cache_dir="minou_cache"):
+        self.cache_dir = cache_dir
+
+    def cache_path(self, pet_type, width, height, dpr):
+        """Chemin du fichier de cache pour une configuration donnée"""
+        return os.path.join(self.cache_dir, f"sprites_{pet_type}_{width}x{height}@{dpr:g}.bin")
+
+    def source_signature(self, paths):
+        """Signature des assets sources, dans l'ordre des animations"""
+        return asset_source.signature([name for anim_paths in paths.values()
+                                       for name in anim_paths])
+
+    def load(self, pet_type, width, height, dpr, paths):
+        """Charge les frames depuis le cache en une seule lecture.
+
+        Le cache peut ne contenir qu'une partie des animations (chargement
+        interrompu). Retourne None s'il est absent, corrompu ou périmé.
+        """
+        cache_path = self.cache_path(pet_type, width, height, dpr)
+        try:
+            with open(cache_path, 'rb') as f:
+                data = f.read()
+        except OSError:
+            return None
+
+        try:
+            magic, version, index_size = self._HEADER.unpack_from(data, 0)
+            if magic != self.MAGIC or version != self.VERSION:
+                return None
+
+            offset = self._HEADER.size
+            index = json.loads(data[offset:offset + index_size].decode('utf-8'))
+            offset += index_size
+
+            if index.get("signature") != self.source_signature(paths):
+                return None
+
+            frames = {}
+            for anim_name, frame_specs in index["frames"].items():
+                frames[anim_name] = []
+                for frame_width, frame_height, bytes_per_line in frame_specs:
+                    size = bytes_per_line * frame_height
+                    image = QImage(data[offset:offset + size], frame_width, frame_height,
+                                   bytes_per_line, QImage.Format_ARGB32_Premultiplied).copy()
+                    image.setDevicePixelRatio(dpr)
+                    frames[anim_name].append(image)
+                    offset += size
+            return frames
+        except Exception as e:
+            print(f"⚠️ Cache sprites invalide ({cache_path}): {e}")
+            return None
+
+    def save(self, pet_type, width, height, dpr, paths, frames):
+        """Écrit les frames redimensionnées dans le cache (écriture atomique)"""
+        cache_path = self.cache_path(pet_type, width, height, dpr)
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+
+            index = {"signature": self.source_signature(paths), "frames": {}}
+            chunks = []
+            for anim_name, images in frames.items():
+                index["frames"][anim_name] = []
+                for image in images:
+                    image = image.convertToFormat(QImage.Format_ARGB32_Premultiplied)
+                    index["frames"][anim_name].append(
+                        [image.width(), image.height(), image.bytesPerLine()]
+                    )
+                    ptr = image.constBits()
+                    ptr.setsize(image.sizeInBytes())
+                    chunks.append(bytes(ptr))
+
+            index_data = json.dumps(index).encode('utf-8')
+            tmp_path = cache_path + ".tmp"
+            with open(tmp_path, 'wb') as f:
+                f.write(self._HEADER.pack(self.MAGIC, self.VERSION, len(index_data)))
+                f.write(index_data)
+                for chunk in chunks:
+                    f.write(chunk)
+            os.replace(tmp_path, cache_path)
+        except Exception as e:
+            print(f"⚠️ Impossible d'écrire le cache sprites ({cache_path}): {e}")
+
+
+class AnimationFrames:
+    """Frames d'une animation dans les deux orientations.
+
+    Les frames tournées vers la gauche sont construites une seule fois,
+    au premier besoin : afficher une frame n'est plus qu'une lecture.
+    """
+
+    def __init__(self, pixmaps):
+        self.right = list(pixmaps)
+        self._left = None
+        self._icons = {}  # tailles -> QIcon par frame
+
+    @property
+    def left(self):
+        if self._left is None:
+            self._left = [QPixmap.fromImage(pixmap.toImage().mirrored(True, False))
+                          for pixmap in self.right]
+        return self._left
+
+    def frame(self, index, facing_right=True):
+        """Retourne la frame demandée dans l'orientation voulue"""
+        return self.right[index] if facing_right else self.left[index]
+
+    def icons(self, extent, dpr=1.0):
+        """QIcon pré-redimensionnés (extent x extent) pour chaque frame.
+
+        Des frames identiques à cette taille partagent le même QIcon.
+        """
+        key = (extent, dpr)
+        icons = self._icons.get(key)
+        if icons is None:
+            icons = []
+            previous_image = None
+            physical = int(round(extent * dpr))
+            for pixmap in self.right:
+                image = pixmap.toImage().scaled(physical, physical,
+                                                Qt.KeepAspectRatio, Qt.SmoothTransformation)
+                if icons and image == previous_image:
+                    icons.append(icons[-1])
+                    continue
+                image.setDevicePixelRatio(dpr)
+                icons.append(QIcon(QPixmap.fromImage(image)))
+                previous_image = image
+            # Une seule taille de barre système à la fois
+            self._icons = {key: icons}
+        return icons
+
+    def replace_frame(self, index, pixmap):
+        """Remplace une frame en place (les deux orientations)"""
+        self.right[index] = pixmap
+        if self._left is not None:
+            self._left[index] = QPixmap.fromImage(pixmap.toImage().mirrored(True, False))
+        self._icons = {}
+
+    @property
+    def nbytes(self):
+        """Mémoire occupée par les pixels, orientations construites comprises"""
+        pixmaps = self.right + (self._left or [])
+        return sum(p.width() * p.height() * p.depth() // 8 for p in pixmaps)
+
+    def __len__(self):
+        return len(self.right)
+
+    def __getitem__(self, index):
+        return self.right[index]
+
+
+def decode_animation(paths, width, height, dpr=1.0, label="Animation"):
+    """Décode toutes les frames d'une animation"""
+    images, report = decode_sprites(paths, width, height, dpr, label)
+    print(report)
+
+    for sprite_path, image in zip(paths, images):
+        if image is None:
+            print(f"⚠️ Sprite manquant: {sprite_path}")
+    return [image for image in images if image is not None]
+
+
+def load_cached_sprites(pet_type, width, height, dpr=1.0):
+    """Charge les frames en cache d'un type d'animal (parfois une partie seulement), ou None"""
+    frames = sprite_cache.load(pet_type, width, height, dpr, sprite_paths(pet_type))
+    if frames is not None:
+        print(f"⚡ Sprites {pet_type} chargés depuis le cache")
+    return frames
+
+
+class SpritePool:
+    """Pixmaps pré-redimensionnés d'un dossier d'assets (nourriture, poop...),
+    décodés une seule fois et partagés par tous les objets"""
+
+    IMAGE_EXTENSIONS = ('.png', '.jpg', '.jpeg', '.gif')
+
+    def __init__(self, dir_name, size):
+        self.dir_name = dir_name
+        self.size = size
+        self._pixmaps = None  # nom d'asset -> QPixmap
+
+    def _build(self):
+        names = asset_source.list_dir(self.dir_name, self.IMAGE_EXTENSIONS)
+        images, report = decode_sprites(names, self.size, self.size, label=self.dir_name)
+        print(report)
+        self._pixmaps = {name: QPixmap.fromImage(image)
+                         for name, image in zip(names, images) if image is not None}
+
+    def get(self, name):
+        """Pixmap d'un asset précis (décodé une fois s'il n'est pas dans le pool)"""
+        if self._pixmaps is None:
+            self._build()
+        pixmap = self._pixmaps.get(name)
+        if pixmap is None and asset_source.exists(name):
+            image = decode_sprite(name, self.size, self.size)
+            if image is not None:
+                pixmap = self._pixmaps[name] = QPixmap.fromImage(image)
+        return pixmap
+
+    def random_name(self):
+        """Nom d'un asset au hasard parmi le pool, ou None s'il est vide"""
+        if self._pixmaps is None:
+            self._build()
+        if not self._pixmaps:
+            return None
+        return random.choice(list(self._pixmaps))
+
+    def random(self):
+        """Pixmap au hasard parmi le pool, ou None s'il est vide"""
+        name = self.random_name()
+        return None if name is None else self._pixmaps[name]
+
+
+class SpriteStore:
+    """Store partagé des animations, par (type d'animal, animation).
+
+    Les animations récemment utilisées restent en mémoire dans la limite du
+    budget ; au-delà, les moins récemment utilisées sont évincées en premier.
+    Les types d'animaux épinglés (affichés) ne sont jamais évincés.
+    """
+
+    def __init__(self, budget_mb=SPRITE_MEMORY_BUDGET_MB):
+        self._entries = OrderedDict()  # (pet_type, animation) -> AnimationFrames
+        self._pinned = set()
+        self.budget_bytes = int(budget_mb * 1024 * 1024)
+
+        # Compteurs
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.evicted_bytes = 0
+
+    def get(self, pet_type, anim_name):
+        """Retourne l'animation si elle est en mémoire, sinon None"""
+        key = (pet_type, anim_name)
+        frames = self._entries.get(key)
+        if frames is None:
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        self._entries.move_to_end(key)
+        return frames
+
+    def peek(self, pet_type, anim_name):
+        """Comme get(), sans toucher à l'ordre LRU ni aux compteurs"""
+        return self._entries.get((pet_type, anim_name))
+
+    def put(self, pet_type, anim_name, frames):
+        """Ajoute (ou remplace) une animation puis applique le budget"""
+        key = (pet_type, anim_name)
+        self._entries[key] = frames
+        self._entries.move_to_end(key)
+        self._evict(keep=key)
+
+    def animations(self, pet_type):
+        """Animations en mémoire pour un type d'animal.
+
+        Compte une seule recherche : un hit si toutes sont en mémoire,
+        sinon un miss.
+        """
+        sprites = {}
+        for anim_name in ANIMATION_FRAMES:
+            key = (pet_type, anim_name)
+            frames = self._entries.get(key)
+            if frames is not None:
+                self._entries.move_to_end(key)
+                sprites[anim_name] = frames
+
+        if len(sprites) == len(ANIMATION_FRAMES):
+            self.hits += 1
+        else:
+            self.misses += 1
+        return sprites
+
+    def pin(self, pet_type):
+        """Épingle le type d'animal affiché (et libère le précédent)"""
+        self._pinned = {pet_type}
+        self._evict()
+
+    def set_budget_mb(self, budget_mb):
+        self.budget_bytes = int(budget_mb * 1024 * 1024)
+        self._evict()
+
+    def memory_bytes(self):
+        return sum(frames.nbytes for frames in self._entries.values())
+
+    def _evict(self, keep=None):
+        """Évince les animations les moins récemment utilisées au-delà du budget"""
+        total = self.memory_bytes()
+        for key in list(self._entries):
+            if total <= self.budget_bytes:
+                break
+            if key == keep or key[0] in self._pinned:
+                continue
+
+            frames = self._entries.pop(key)
+            total -= frames.nbytes
+            self.evictions += 1
+            self.evicted_bytes += frames.nbytes
+
+    def __str__(self):
+        return (f"🗃️ Sprites: {self.hits} hits, {self.misses} misses, "
+                f"{self.evicted_bytes / (1024 * 1024):.1f} Mo évincés, "
+                f"{self.memory_bytes() / (1024 * 1024):.1f}/"
+                f"{self.budget_bytes / (1024 * 1024):.0f} Mo en mémoire")
+
+
+class SpriteLoader(QThread):
+    """Décode en arrière-plan les animations restantes d'un type d'animal,
+    dans l'ordre de priorité, et les transmet une par une en QImage"""
+    animation_loaded = pyqtSignal(str, str, list)  # pet_type, animation, images
+
+    def __init__(self, pet_type, width, height, dpr=1.0, loaded_frames=None,
+                 skip=(), parent=None):
+        super().__init__(parent)
+        self.pet_type = pet_type
+        self.width = width
+        self.height = height
+        self.dpr = dpr
+        self.frames = dict(loaded_frames or {})
+        self.skip = set(skip)  # animations déjà en mémoire
+
+    def run(self):
+        paths = sprite_paths(self.pet_type)
+
+        decoded = 0
+
+        for anim_name in ANIMATION_LOAD_ORDER:
+            if anim_name in self.frames or anim_name in self.skip or anim_name not in paths:
+                continue
+            if self.isInterruptionRequested():
+                break
+
+            images = decode_animation(paths[anim_name], self.width, self.height, self.dpr,
+                                      f"{self.pet_type}/{anim_name}")
+            self.frames[anim_name] = images
+            decoded += 1
+            self.animation_loaded.emit(self.pet_type, anim_name, images)
+
+        # Même interrompu, ce qui a été décodé va au cache : le prochain
+        # lancement ne décodera que les animations manquantes
+        if decoded:
+            sprite_cache.save(self.pet_type, self.width, self.height, self.dpr, paths, self.frames)
+
+
+class AssetWatcher(QObject):
+    """Surveille les fichiers de sprites (assets libres) et ne redécode que
+    les frames modifiées, remplacées en place dans le sprite store"""
+    frame_reloaded = pyqtSignal(str, str, int)  # pet_type, animation, index
+
+    def __init__(self, store, parent=None):
+        super().__init__(parent)
+        self.store = store
+        self._targets = {}  # pet_type -> (width, height, dpr)
+        self._stamps = {}   # nom d'asset -> (taille, mtime)
+
+        self._watcher = QFileSystemWatcher(self)
+        self._watcher.fileChanged.connect(self._on_path_changed)
+        self._watcher.directoryChanged.connect(self._on_path_changed)
+
+        # Les éditeurs écrivent souvent en plusieurs fois : on regroupe les notifications
+        self._reload_timer = QTimer(self)
+        self._reload_timer.setSingleShot(True)
+        self._reload_timer.setInterval(200)
+        self._reload_timer.timeout.connect(self._reload_changed_frames)
+
+    def watch(self, pet_type, width, height, dpr=1.0):
+        """Surveille les frames d'un type d'animal"""
+        if asset_source.pack is not None:
+            print("⚠️ Rechargement à chaud indisponible avec assets.pack")
+            return
+        if self._targets.get(pet_type) == (width, height, dpr):
+            return
+
+        self._targets[pet_type] = (width, height, dpr)
+        paths = [asset_source.path(pet_type)]
+        for anim_paths in sprite_paths(pet_type).values():
+            for name in anim_paths:
+                self._stamps[name] = self._stamp(name)
+                paths.append(asset_source.path(name))
+        self._watcher.addPaths([path for path in paths if os.path.exists(path)])
+        print(f"👀 Rechargement à chaud actif pour {pet_type}")
+
+    def _stamp(self, name):
+        try:
+            stat = os.stat(asset_source.path(name))
+            return stat.st_size, stat.st_mtime_ns
+        except OSError:
+            return None
+
+    def _on_path_changed(self, path):
+        self._reload_timer.start()
+
+    def _reload_changed_frames(self):
+        """Redécode uniquement les frames dont le fichier a changé"""
+        watched_files = set(self._watcher.files())
+
+        for pet_type, (width, height, dpr) in self._targets.items():
+            for anim_name, anim_paths in sprite_paths(pet_type).items():
+                for index, name in enumerate(anim_paths):
+                    stamp = self._stamp(name)
+                    if stamp == self._stamps.get(name):
+                        continue
+                    self._stamps[name] = stamp
+                    if stamp is None:
+                        continue
+
+                    # Un enregistrement atomique remplace le fichier : le resurveiller
+                    path = asset_source.path(name)
+                    if path not in watched_files:
+                        self._watcher.addPath(path)
+
+                    frames = self.store.peek(pet_type, anim_name)
+                    if frames is None or index >= len(frames):
+                        continue
+
+                    image = decode_sprite(name, width, height, dpr)
+                    if image is None:
+                        continue
+                    frames.replace_frame(index, QPixmap.fromImage(image))
+                    print(f"🔄 Frame rechargée: {name}")
+                    self.frame_reloaded.emit(pet_type, anim_name, index)
+
+
+# Instances globales
+sprite_cache = SpriteCache()
+sprite_store = SpriteStore(config_manager.get("sprite_memory_budget_mb", SPRITE_MEMORY_BUDGET_MB))
@@ -0,0 +1,159 @@
+"""
+Traçage du démarrage de Minou - temps et mémoire par phase et par import
+
+Activation :
+    python main.py --trace-startup[=rapport.json]
+    MINOU_TRACE_STARTUP=1 (ou =rapport.json) python main.py
+"""
+import builtins
+import json
+import os
+import sys
+import time
+import tracemalloc
+from contextlib import contextmanager
+
+
+class StartupTracer:
+    """Mesure le temps écoulé et les allocations de chaque phase du démarrage,
+    ainsi que le coût de chaque import de module"""
+
+    def __init__(self):
+        self.enabled = False
+        self.export_path = None
+        self.phases = []   # dicts : name, depth, wall_ms, py_alloc_kb, rss_kb
+        self.imports = []  # dicts : name, depth, inclusive_ms, self_ms
+        self._depth = 0
+        self._import_stack = []
+        self._original_import = None
+        self._process = None
+        self._start = None
+
+    def configure(self, argv=None, environ=None):
+        """Active le traçage selon --trace-startup ou MINOU_TRACE_STARTUP"""
+        argv = sys.argv if argv is None else argv
+        environ = os.environ if environ is None else environ
+
+        setting = environ.get("MINOU_TRACE_STARTUP", "")
+        for arg in argv[1:]:
+            if arg == "--trace-startup":
+                setting = setting or "1"
+            elif arg.startswith("--trace-startup="):
+                setting = arg.split("=", 1)[1]
+
+        if not setting or setting == "0":
+            return
+        if setting.lower().endswith(".json"):
+            self.export_path = setting
+        self.start()
+
+    def start(self):
+        if self.enabled:
+            return
+        self.enabled = True
+        self._start = time.perf_counter()
+        tracemalloc.start()
+        self._install_import_hook()
+
+    def _rss_kb(self):
+        """Mémoire résidente du processus (inclut les allocations Qt natives)"""
+        if self._process is None:
+            try:
+                import psutil
+                self._process = psutil.Process()
+            except Exception:
+                return None
+        return self._process.memory_info().rss / 1024
+
+    @contextmanager
+    def phase(self, name):
+        """Mesure une phase du démarrage (les phases peuvent s'imbriquer)"""
+        if not self.enabled:
+            yield
+            return
+
+        record = {"name": name, "depth": self._depth}
+        self.phases.append(record)
+        self._depth += 1
+        rss_before = self._rss_kb()
+        py_before = tracemalloc.get_traced_memory()[0]
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            record["wall_ms"] = (time.perf_counter() - start) * 1000
+            record["py_alloc_kb"] = (tracemalloc.get_traced_memory()[0] - py_before) / 1024
+            rss_after = self._rss_kb()
+            record["rss_kb"] = (rss_after - rss_before
+                                if rss_before is not None and rss_after is not None else None)
+            self._depth -= 1
+
+    def _install_import_hook(self):
+        self._original_import = builtins.__import__
+        tracer = self
+
+        def traced_import(name, globals=None, locals=None, fromlist=(), level=0):
+            # Seuls les premiers imports (module pas encore chargé) coûtent quelque chose
+            if level != 0 or name in sys.modules:
+                return tracer._original_import(name, globals, locals, fromlist, level)
+
+            record = {"name": name, "depth": len(tracer._import_stack), "children_ms": 0.0}
+            tracer._import_stack.append(record)
+            start = time.perf_counter()
+            try:
+                return tracer._original_import(name, globals, locals, fromlist, level)
+            finally:
+                elapsed = (time.perf_counter() - start) * 1000
+                tracer._import_stack.pop()
+                record["inclusive_ms"] = elapsed
+                record["self_ms"] = elapsed - record.pop("children_ms")
+                if tracer._import_stack:
+                    tracer._import_stack[-1]["children_ms"] += elapsed
+                tracer.imports.append(record)
+
+        builtins.__import__ = traced_import
+
+    def stop(self):
+        """Désinstalle le hook d'import et arrête tracemalloc"""
+        if self._original_import is not None:
+            builtins.__import__ = self._original_import
+            self._original_import = None
+        if tracemalloc.is_tracing():
+            tracemalloc.stop()
+
+    def report(self, top_imports=15):
+        """Affiche la répartition du démarrage et l'exporte en JSON si demandé"""
+        if not self.enabled:
+            return
+
+        total_ms = (time.perf_counter() - self._start) * 1000
+        print(f"⏱️ Démarrage tracé: {total_ms:.0f} ms au total")
+        print("   Phases (temps, allocations Python, RSS):")
+        for record in self.phases:
+            rss = f"{record['rss_kb']:+.0f} Ko RSS" if record.get("rss_kb") is not None else "RSS ?"
+            print(f"   {'  ' * record['depth']}• {record['name']}: "
+                  f"{record.get('wall_ms', 0):.1f} ms, "
+                  f"{record.get('py_alloc_kb', 0):+.0f} Ko Python, {rss}")
+
+        slowest = sorted(self.imports, key=lambda r: -r["self_ms"])[:top_imports]
+        if slowest:
+            print("   Imports les plus coûteux (temps propre / inclusif):")
+            for record in slowest:
+                print(f"   • {record['name']}: {record['self_ms']:.1f} ms / "
+                      f"{record['inclusive_ms']:.1f} ms")
+
+        if self.export_path:
+            try:
+                with open(self.export_path, 'w', encoding='utf-8') as f:
+                    json.dump({"total_ms": total_ms, "phases": self.phases,
+                               "imports": self.imports}, f, indent=2)
+                print(f"💾 Trace de démarrage exportée: {self.export_path}")
+            except Exception as e:
+                print(f"❌ Erreur export de la trace: {e}")
+
+        self.stop()
+
+
+# Instance globale (activée avant les autres imports de l'application)
+startup_tracer = StartupTracer()
+startup_tracer.configure()
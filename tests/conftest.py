@@ -0,0 +1,26 @@
+import os
+import sys
+
+import pytest
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+@pytest.fixture(scope="session")
+def qapp():
+    """QApplication partagée par tous les tests (écran offscreen)"""
+    from PyQt5.QtWidgets import QApplication
+    return QApplication.instance() or QApplication([])
+
+
+@pytest.fixture
+def run_events(qapp):
+    """Fait tourner la boucle d'événements pendant `ms` millisecondes"""
+    from PyQt5.QtCore import QEventLoop, QTimer
+
+    def run(ms):
+        loop = QEventLoop()
+        QTimer.singleShot(ms, loop.quit)
+        loop.exec_()
+    return run
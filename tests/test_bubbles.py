@@ -0,0 +1,113 @@
+import pytest
+
+import bubbles
+from bubbles import BubbleScheduler
+from config import BUBBLE_MIN_DISPLAY_MS, BUBBLE_PIN_MAX_WAIT_MS
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 100.0
+
+    def monotonic(self):
+        return self.now
+
+    def advance_ms(self, ms):
+        self.now += ms / 1000.0
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    fake = FakeClock()
+    monkeypatch.setattr(bubbles, "time", fake)
+    return fake
+
+
+@pytest.fixture
+def scheduler(qapp, clock):
+    from PyQt5.QtCore import QObject, pyqtSignal
+
+    class FakeBubble(QObject):
+        hidden = pyqtSignal()
+
+        def __init__(self):
+            super().__init__()
+            self.visible = False
+            self.is_pinned = False
+
+        def isVisible(self):
+            return self.visible
+
+        def hide(self):
+            self.visible = False
+            self.hidden.emit()
+
+    bubble = FakeBubble()
+    shown = []
+
+    def display(message, bubble_type, duration):
+        bubble.visible = True
+        bubble.is_pinned = False
+        shown.append(message)
+
+    scheduler = BubbleScheduler(bubble, display)
+    scheduler.shown = shown
+    return scheduler
+
+
+def test_highest_priority_is_shown_first(scheduler):
+    scheduler.post("miaou")
+    scheduler.post("bonjour", priority="chat")
+    scheduler.post("rappel", priority="reminder")
+    scheduler.post("alerte", priority="alert")
+    assert scheduler.shown == ["miaou"]
+
+    scheduler.bubble.hide()
+    scheduler.bubble.hide()
+    scheduler.bubble.hide()
+    assert scheduler.shown == ["miaou", "alerte", "rappel", "bonjour"]
+
+
+def test_higher_priority_replaces_after_min_display(scheduler, clock):
+    scheduler.post("miaou")
+    scheduler.post("alerte", priority="alert")
+    assert scheduler.shown == ["miaou"]
+
+    clock.advance_ms(BUBBLE_MIN_DISPLAY_MS + 1)
+    scheduler._pump()
+    assert scheduler.shown == ["miaou", "alerte"]
+
+
+def test_pinned_bubble_holds_ambient_messages(scheduler, clock):
+    scheduler.post("épinglé", priority="chat")
+    scheduler.bubble.is_pinned = True
+    scheduler.post("miaou")
+
+    clock.advance_ms(BUBBLE_PIN_MAX_WAIT_MS * 2)
+    scheduler._pump()
+    assert scheduler.shown == ["épinglé"]
+
+
+def test_alert_preempts_a_pinned_bubble(scheduler, clock):
+    scheduler.post("épinglé", priority="alert", source="alert:cpu")
+    scheduler.bubble.is_pinned = True
+    scheduler.post("batterie", priority="alert", source="alert:battery")
+
+    clock.advance_ms(BUBBLE_MIN_DISPLAY_MS + 1)
+    scheduler._pump()
+    assert scheduler.shown == ["épinglé", "batterie"]
+
+
+def test_reminder_waits_at_most_the_pin_limit(scheduler, clock):
+    scheduler.post("épinglé", priority="chat")
+    scheduler.bubble.is_pinned = True
+    scheduler.post("rappel", priority="reminder")
+
+    clock.advance_ms(BUBBLE_PIN_MAX_WAIT_MS - 10)
+    scheduler._pump()
+    assert scheduler.shown == ["épinglé"]
+    assert scheduler._timer.isActive()
+
+    clock.advance_ms(20)
+    scheduler._pump()
+    assert scheduler.shown == ["épinglé", "rappel"]
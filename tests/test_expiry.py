@@ -0,0 +1,59 @@
+import pytest
+
+from config import EXPIRY_SLACK_MS
+from expiry import ExpiryScheduler
+
+
+@pytest.fixture
+def scheduler(qapp):
+    scheduler = ExpiryScheduler()
+    scheduler.clock = 0.0
+    scheduler._now = lambda: scheduler.clock
+    return scheduler
+
+
+def test_close_deadlines_expire_in_one_pass(scheduler):
+    expired = []
+    scheduler.schedule("a", 1000, lambda: expired.append("a"))
+    scheduler.schedule("b", 1000 + EXPIRY_SLACK_MS - 10, lambda: expired.append("b"))
+    scheduler.schedule("c", 1000 + EXPIRY_SLACK_MS + 100, lambda: expired.append("c"))
+
+    scheduler.clock = 1000
+    scheduler._expire_due()
+    assert expired == ["a", "b"]
+    assert scheduler.passes == 1 and len(scheduler) == 1
+    assert scheduler._timer.isActive()
+
+    scheduler.clock = 1000 + EXPIRY_SLACK_MS + 100
+    scheduler._expire_due()
+    assert expired == ["a", "b", "c"]
+    assert len(scheduler) == 0 and not scheduler._timer.isActive()
+
+
+def test_cancel_and_reschedule_skip_the_old_deadline(scheduler):
+    expired = []
+    scheduler.schedule("food", 1000, lambda: expired.append("food"))
+    scheduler.schedule("poop", 1000, lambda: expired.append("poop"))
+    scheduler.cancel("food")
+    scheduler.schedule("poop", 5000, lambda: expired.append("poop again"))
+    assert "food" not in scheduler
+    assert scheduler.remaining("poop") == 5000
+
+    scheduler.clock = 1000
+    scheduler._expire_due()
+    assert expired == []
+
+    scheduler.clock = 5000
+    scheduler._expire_due()
+    assert expired == ["poop again"]
+    assert scheduler.expired == 1
+
+
+def test_timer_is_armed_on_the_nearest_deadline(scheduler):
+    scheduler.schedule("late", 60000, lambda: None)
+    scheduler.schedule("soon", 2000, lambda: None)
+    assert scheduler._timer.remainingTime() < 3000  # timer approximatif de Qt (±5 %)
+
+    scheduler.cancel("soon")
+    scheduler.cancel("late")
+    assert not scheduler._timer.isActive()
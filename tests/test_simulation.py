@@ -0,0 +1,114 @@
+import pytest
+
+from config import PHYSICS_STEP_MS
+from simulation import ManualClock, PetSimulation, SimFood, SimTimers
+
+STEP = PHYSICS_STEP_MS / 1000.0
+
+
+def make_sim():
+    clock = ManualClock()
+    sim = PetSimulation(clock=clock, verbose=False)
+    sim.place(500, 500)
+    return clock, sim
+
+
+def test_velocity_setter_does_not_run_due_timers():
+    """Une simple affectation ne doit lancer aucun timer au milieu d'une méthode"""
+    clock, sim = make_sim()
+    fired = []
+    sim.timers.call_later(1000, lambda: fired.append(sim.timers.now))
+    events = []
+    sim.listener = lambda event, *args: events.append(event)
+
+    clock.advance(5.0)
+    sim.velocity_x = 2.0
+    assert fired == [] and events == ["wake"]
+
+    clock.advance(STEP)
+    sim.advance()
+    assert len(fired) == 1
+
+
+def test_one_shot_ends_with_its_last_frame_at_the_render_interval():
+    clock, sim = make_sim()
+    sim.frame_interval_ms = 96  # 100 ms arrondis au tick de 16 ms de l'horloge
+    sim.play_one_shot('Hurt')
+    duration = sim.frame_counts['Hurt'] * 0.096
+
+    clock.advance(duration - 0.01)
+    sim.advance()
+    assert sim.is_playing_one_shot
+
+    clock.advance(0.02)
+    sim.advance()
+    assert not sim.is_playing_one_shot and sim.animation == 'Idle'
+
+
+def test_idle_follows_visible_food():
+    clock, sim = make_sim()
+    food = SimFood(900, 700)
+    sim.add_food(food)
+    assert not sim.is_idle()
+
+    food.visible = False
+    sim.update_food_visibility(food)
+    assert sim.is_idle()
+
+    food.visible = True
+    sim.update_food_visibility(food)
+    sim.remove_food(food)
+    assert sim.is_idle()
+
+
+def test_timers_fire_in_due_order():
+    timers = SimTimers()
+    fired = []
+    timers.call_later(300, lambda: fired.append("c"))
+    timers.call_later(100, lambda: fired.append("a"))
+    timers.call_later(100, lambda: fired.append("b"))
+    timers.start("tick", 250, lambda: fired.append("tick"))
+
+    assert timers.run_due(0.6) == 5
+    assert fired == ["a", "b", "tick", "c", "tick"]
+
+
+def test_restarting_or_stopping_a_named_timer_drops_the_old_due():
+    timers = SimTimers()
+    fired = []
+    timers.start("behavior", 100, lambda: fired.append("old"))
+    timers.start("behavior", 500, lambda: fired.append("new"))
+    timers.run_due(0.4)
+    assert fired == []
+    assert timers.next_due() == pytest.approx(0.5)
+
+    timers.stop("behavior")
+    assert timers.next_due() is None
+    assert timers.run_due(10.0) == 0 and fired == []
+
+
+def test_steps_do_not_depend_on_frame_jitter():
+    positions = []
+    # Même durée totale ; chaque tick reste sous MAX_PHYSICS_STEPS pas
+    for frames in ([0.05] * 20 + [0.01],
+                   [0.013, 0.041, 0.07, 0.007, 0.069] + [0.05] * 16 + [0.01]):
+        clock, sim = make_sim()
+        sim.velocity_x = 2.0
+        for dt in frames:
+            clock.advance(dt)
+            sim.advance()
+        positions.append((sim.stats["physics_steps"], sim.x, sim.y))
+    assert positions[0] == positions[1]
+
+
+def test_render_position_interpolates_between_steps():
+    clock, sim = make_sim()
+    sim.velocity_x = 2.0
+    clock.advance(STEP * 2.5)
+    alpha = sim.advance()
+
+    assert sim.stats["physics_steps"] == 2
+    assert alpha == pytest.approx(0.5)
+    x, _ = sim.render_position(alpha)
+    assert sim.previous_x < x < sim.x
+    assert x == pytest.approx((sim.previous_x + sim.x) / 2)
@@ -0,0 +1,42 @@
+import itertools
+import math
+import random
+
+from spatial import poisson_disk_points
+
+
+def min_gap(points):
+    return min(math.dist(a, b) for a, b in itertools.combinations(points, 2))
+
+
+def test_points_are_spaced_and_inside_the_zones():
+    zones = [(0, 0, 399, 299), (1000, 500, 1199, 699)]
+    points = poisson_disk_points(zones, 40, 30, rng=random.Random(1))
+
+    assert len(points) == 40
+    assert min_gap(points) >= 30
+    for x, y in points:
+        assert any(left <= x <= right and top <= y <= bottom
+                   for left, top, right, bottom in zones)
+
+
+def test_existing_points_are_avoided():
+    existing = [(50, 50), (150, 50)]
+    points = poisson_disk_points([(0, 0, 199, 99)], 10, 40, existing=existing,
+                                 rng=random.Random(2))
+
+    assert points
+    assert min_gap(points + existing) >= 40
+
+
+def test_full_zone_returns_fewer_points():
+    # 100x100 avec 60 px d'écart : cinq points au plus (coins et centre)
+    points = poisson_disk_points([(0, 0, 99, 99)], 50, 60, rng=random.Random(3))
+
+    assert 1 <= len(points) <= 5
+    assert len(points) == 1 or min_gap(points) >= 60
+
+
+def test_empty_request_or_zones():
+    assert poisson_disk_points([(0, 0, 99, 99)], 0, 10) == []
+    assert poisson_disk_points([(10, 0, 5, 99)], 5, 10) == []
@@ -0,0 +1,44 @@
+import pytest
+
+
+@pytest.fixture
+def ui(qapp):
+    import ui_components
+    return ui_components
+
+
+def test_same_text_reuses_its_layout(ui):
+    cache = ui.TextLayoutCache(max_entries=2)
+    font = ui.bubble_font()
+    first = cache.get("Miaou !", font, 250)
+
+    assert cache.get("Miaou !", font, 250) is first
+    assert cache.get("Miaou !", font, 120) is not first
+    assert (cache.hits, cache.misses) == (1, 2)
+
+
+def test_least_recently_used_layout_is_evicted(ui):
+    cache = ui.TextLayoutCache(max_entries=2)
+    font = ui.bubble_font()
+    a = cache.get("a", font, 250)
+    cache.get("b", font, 250)
+    cache.get("a", font, 250)
+    cache.get("c", font, 250)
+
+    assert cache.get("a", font, 250) is a
+    assert cache.stats() == {"hits": 2, "misses": 3, "entries": 2}
+
+
+def test_layout_size_matches_drawtext(ui):
+    from PyQt5.QtCore import QRect, Qt
+    from PyQt5.QtGui import QFontMetrics
+
+    font = ui.bubble_font()
+    text = "Une très longue phrase qui ne tient pas sur une seule ligne\net un saut"
+    layout = ui.TextLayout(text, font, 200)
+    expected = QFontMetrics(font).boundingRect(
+        QRect(0, 0, 200, 10000), Qt.AlignCenter | Qt.TextWordWrap, text)
+
+    # Arrondi au pixel près
+    assert abs(layout.size().height() - expected.height()) <= 1
+    assert abs(layout.size().width() - expected.width()) <= 1
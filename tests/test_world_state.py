@@ -0,0 +1,52 @@
+import json
+
+import pytest
+
+from config import WORLD_SAVE_DELAY_MS
+from world_state import WorldStateStore
+
+
+def test_close_writes_and_ignores_later_changes(qapp, tmp_path):
+    store = WorldStateStore(str(tmp_path / "world.json"))
+    store.save_later(lambda: {"pet": {"x": 1}})
+    store.close()
+    store.save_later(lambda: {"pet": {"x": 2}})
+    store.close()
+
+    assert store.load()["pet"] == {"x": 1}
+
+
+def test_other_version_is_ignored(qapp, tmp_path):
+    path = tmp_path / "world.json"
+    path.write_text(json.dumps({"v": 0, "pet": {}}))
+
+    assert WorldStateStore(str(path)).load() is None
+
+
+def test_hidden_window_keeps_the_saved_world(qapp, run_events, tmp_path, monkeypatch):
+    """Fermer la fenêtre (l'application reste dans la barre système) ne doit
+    pas vider la sauvegarde : le prochain lancement retrouve les objets"""
+    pytest.importorskip("PyQt5.QtMultimedia", exc_type=ImportError)
+    import pet as pet_module
+
+    monkeypatch.chdir(tmp_path)
+    path = str(tmp_path / "world.json")
+    qapp.setQuitOnLastWindowClosed(False)
+
+    monkeypatch.setattr(pet_module, "world_store", WorldStateStore(path))
+    pet = pet_module.MinouPet()
+    pet.spawn_food(2)
+    pet.spawn_poop(1)
+    pet.close()
+    pet.spawn_poop(1)
+    run_events(WORLD_SAVE_DELAY_MS + 200)
+    pet._save_world_now()  # aboutToQuit
+
+    with open(path, "rb") as f:
+        saved = json.loads(f.read())
+    assert len(saved["poop"]) == 2  # la nourriture a pu être mangée entre-temps
+
+    monkeypatch.setattr(pet_module, "world_store", WorldStateStore(path))
+    restored = pet_module.MinouPet()
+    assert len(restored.sim.foods) == len(saved["food"])
+    assert len(restored.active_poop_items) == len(saved["poop"])
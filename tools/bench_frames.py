@@ -0,0 +1,92 @@
+"""
+Benchmark des frames tournées vers la gauche : un animal qui marche vers la
+gauche pendant N minutes, avec le retournement à la volée (transformed() à
+chaque frame, l'ancien _update_sprite_display) puis avec les frames
+pré-retournées d'AnimationFrames.
+
+    python tools/bench_frames.py [--minutes 10] [--pet cat] [--animation Walk]
+
+Tourne sans écran (QT_QPA_PLATFORM=offscreen par défaut). tracemalloc ne voit
+que les allocations Python : les pixels alloués par Qt sont comptés à part.
+"""
+import argparse
+import os
+import sys
+import time
+import tracemalloc
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from PyQt5.QtWidgets import QApplication, QLabel
+from PyQt5.QtGui import QPixmap, QTransform
+
+from config import ANIMATION_FRAME_RATE, CAT_WIDTH, CAT_HEIGHT
+from sprites import AnimationFrames, decode_animation, sprite_paths
+
+
+def pixel_bytes(pixmap):
+    return pixmap.width() * pixmap.height() * 4
+
+
+def run(label, frames, show_frame, ticks):
+    """Affiche `ticks` frames ; show_frame(index) retourne les pixmaps créés"""
+    tracemalloc.start()
+    created = 0
+    created_bytes = 0
+    start = time.perf_counter()
+    for tick in range(ticks):
+        for pixmap in show_frame(tick % len(frames.right)):
+            created += 1
+            created_bytes += pixel_bytes(pixmap)
+    elapsed = time.perf_counter() - start
+    _, python_peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    print(f"{label:<14} {elapsed / ticks * 1e6:7.1f} us/frame   "
+          f"{created:6d} pixmaps créés ({created_bytes / 1e6:7.1f} Mo de pixels)   "
+          f"pic Python {python_peak / 1024:6.1f} Ko")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--minutes", type=float, default=10)
+    parser.add_argument("--pet", default="cat")
+    parser.add_argument("--animation", default="Walk")
+    args = parser.parse_args()
+
+    app = QApplication.instance() or QApplication(sys.argv[:1])
+    images = decode_animation(sprite_paths(args.pet)[args.animation], CAT_WIDTH, CAT_HEIGHT)
+    if not images:
+        sys.exit(f"Aucune frame pour {args.pet}/{args.animation}")
+    pixmaps = [QPixmap.fromImage(image) for image in images]
+
+    ticks = int(args.minutes * 60 * 1000 / ANIMATION_FRAME_RATE)
+    print(f"{args.pet}/{args.animation} vers la gauche, {len(pixmaps)} frames, "
+          f"{ticks} affichages ({args.minutes:g} min à {ANIMATION_FRAME_RATE} ms)")
+    label = QLabel()
+
+    # Avant : un nouveau pixmap retourné à chaque affichage
+    flipped = AnimationFrames(pixmaps)
+
+    def show_transformed(index):
+        pixmap = flipped.right[index].transformed(QTransform().scale(-1, 1))
+        label.setPixmap(pixmap)
+        return (pixmap,)
+
+    run("transformed()", flipped, show_transformed, ticks)
+
+    # Après : frames gauches construites une fois, puis simple lecture
+    mirrored = AnimationFrames(pixmaps)
+
+    def show_mirrored(index):
+        built = mirrored._left is None
+        label.setPixmap(mirrored.frame(index, facing_right=False))
+        return mirrored.left if built else ()
+
+    run("pré-retournées", mirrored, show_mirrored, ticks)
+    app.processEvents()
+
+
+if __name__ == "__main__":
+    main()
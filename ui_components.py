@@ -1,15 +1,17 @@
 """
 Composants UI pour Minou - Interface moderne et sombre
 """
+import math
 import random
+from collections import OrderedDict
 from PyQt5.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QPushButton, 
                              QLabel, QLineEdit, QTextEdit, QApplication, 
                              QGraphicsDropShadowEffect, QFrame)
 from PyQt5.QtCore import (Qt, QTimer, QPoint, pyqtSignal, QPropertyAnimation, 
-                          QEasingCurve, QRect, QThread, pyqtSlot, QRectF, QPointF)
+                          QEasingCurve, QRect, QThread, pyqtSlot, QRectF, QPointF, QSize)
 from PyQt5.QtGui import (QFont, QPainter, QPainterPath, QColor, QBrush, 
-                         QPen, QLinearGradient)
-from config import DARK_THEME, config_manager
+                         QPen, QLinearGradient, QPixmap, QTextLayout, QTextOption)
+from config import DARK_THEME, BUBBLE_CACHE_SIZE, TEXT_LAYOUT_CACHE_SIZE, config_manager
 from utils import reminder_manager, notes_manager
 from PyQt5.QtWidgets import QSizePolicy
 
@@ -224,7 +226,196 @@ class ControlBox(QWidget):
         if hasattr(self, 'drag_start_position'):
             self.move(self.pos() + event.pos() - self.drag_start_position)
 
+# Couleurs des bulles selon le type : (fond, texte)
+BUBBLE_COLORS = {
+    "normal": (DARK_THEME['bg_secondary'], DARK_THEME['text_primary']),
+    "love": (DARK_THEME['accent_purple'], "white"),
+    "alert": (DARK_THEME['error'], "white"), 
+    "info": (DARK_THEME['bg_secondary'], "white")
+}
+
+# Largeur maximum du texte d'une bulle
+BUBBLE_TEXT_WIDTH = 400
+
+_bubble_font = None
+
+
+def bubble_font():
+    """Police du texte des bulles (créée une seule fois)"""
+    global _bubble_font
+    if _bubble_font is None:
+        _bubble_font = QFont("Arial", 11, QFont.Bold)
+    return _bubble_font
+
+
+class TextLayout:
+    """Texte mis en page une seule fois : sa taille sert à dimensionner la
+    bulle, ses lignes déjà calculées servent au dessin"""
+    
+    def __init__(self, text, font, max_width):
+        # Comme drawText : les retours à la ligne deviennent des sauts de ligne
+        self._layout = QTextLayout(text.replace('\n', '\u2028'), font)
+        option = QTextOption()
+        option.setWrapMode(QTextOption.WordWrap)
+        self._layout.setTextOption(option)
+        
+        lines = []
+        height = 0.0
+        self._layout.beginLayout()
+        while True:
+            line = self._layout.createLine()
+            if not line.isValid():
+                break
+            line.setLineWidth(max_width)
+            # Interligne de la police entre les lignes, comme drawText
+            if lines:
+                height += line.leading()
+            line.setPosition(QPointF(0.0, height))
+            height += line.height()
+            lines.append(line)
+        self._layout.endLayout()
+        
+        # Lignes centrées dans le bloc, comme Qt.AlignCenter
+        self.width = max((line.naturalTextWidth() for line in lines), default=0.0)
+        self.height = height
+        for line in lines:
+            line.setPosition(QPointF((self.width - line.naturalTextWidth()) / 2, line.y()))
+    
+    def size(self):
+        return QSize(math.ceil(self.width), math.ceil(self.height))
+    
+    def draw(self, painter, rect):
+        """Dessine le bloc centré dans `rect` avec le stylo courant"""
+        x = rect.x() + (rect.width() - self.width) / 2
+        y = rect.y() + (rect.height() - self.height) / 2
+        self._layout.draw(painter, QPointF(x, y))
+
+
+class TextLayoutCache:
+    """Mises en page par (texte, police, largeur max), partagées entre la
+    mesure et le dessin ; les moins récemment utilisées sont évincées"""
+    
+    def __init__(self, max_entries=TEXT_LAYOUT_CACHE_SIZE):
+        self._entries = OrderedDict()  # (texte, police, largeur) -> TextLayout
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+    
+    def get(self, text, font, max_width):
+        key = (text, font.key(), max_width)
+        layout = self._entries.get(key)
+        if layout is not None:
+            self.hits += 1
+            self._entries.move_to_end(key)
+            return layout
+        
+        self.misses += 1
+        layout = TextLayout(text, font, max_width)
+        self._entries[key] = layout
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+        return layout
+    
+    def stats(self):
+        return {"hits": self.hits, "misses": self.misses, "entries": len(self._entries)}
+
+
+# Instance globale
+text_layouts = TextLayoutCache()
+
+
+def render_bubble(message, bubble_type, width, height, dpr=1.0):
+    """Dessine une bulle de dialogue complète dans un pixmap transparent"""
+    pixmap = QPixmap(max(1, round(width * dpr)), max(1, round(height * dpr)))
+    pixmap.setDevicePixelRatio(dpr)
+    pixmap.fill(Qt.transparent)
+    
+    painter = QPainter(pixmap)
+    painter.setRenderHint(QPainter.Antialiasing)
+    try:
+        bg_color, text_color = BUBBLE_COLORS.get(bubble_type, BUBBLE_COLORS["normal"])
+        
+        # CORRECTION : Utiliser QRectF au lieu de QRect
+        rect = QRectF(10.0, 10.0, float(width - 20), float(height - 30))
+        
+        # Fond avec gradient
+        gradient = QLinearGradient(rect.topLeft(), rect.bottomLeft())
+        gradient.setColorAt(0, QColor(bg_color))
+        gradient.setColorAt(1, QColor(bg_color).darker(120))
+        
+        path = QPainterPath()
+        path.addRoundedRect(rect, 15.0, 15.0)  # CORRECTION : utiliser des float
+        
+        # Queue de la bulle (correction des types aussi)
+        queue_start = QPointF(rect.center().x() - 15.0, rect.bottom())
+        queue_tip = QPointF(rect.center().x(), float(height - 5))
+        queue_end = QPointF(rect.center().x() + 15.0, rect.bottom())
+        
+        path.moveTo(queue_start)
+        path.lineTo(queue_tip)
+        path.lineTo(queue_end)
+        path.closeSubpath()
+        
+        # Ombre portée
+        shadow_path = QPainterPath(path)
+        shadow_path.translate(2, 2)
+        painter.fillPath(shadow_path, QColor(0, 0, 0, 100))
+        
+        # Bulle principale
+        painter.fillPath(path, QBrush(gradient))
+        painter.setPen(QPen(QColor(bg_color).lighter(150), 2))
+        painter.drawPath(path)
+        
+        # Texte (mise en page déjà faite pour dimensionner la bulle)
+        painter.setPen(QColor(text_color))
+        text_rect = rect.toRect().adjusted(10, 10, -10, -10)
+        layout = text_layouts.get(message, bubble_font(), BUBBLE_TEXT_WIDTH)
+        layout.draw(painter, QRectF(text_rect))
+    finally:
+        painter.end()
+    
+    return pixmap
+
+
+class BubblePixmapCache:
+    """Bulles déjà rendues, par (message, type, taille) ; les moins
+    récemment affichées sont évincées au-delà de `max_entries`"""
+    
+    def __init__(self, max_entries=BUBBLE_CACHE_SIZE):
+        self._entries = OrderedDict()  # (message, type, largeur, hauteur, dpr) -> QPixmap
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+    
+    def get(self, message, bubble_type, width, height, dpr=1.0):
+        """Pixmap de la bulle, rendu seulement au premier affichage"""
+        key = (message, bubble_type, width, height, dpr)
+        pixmap = self._entries.get(key)
+        if pixmap is not None:
+            self.hits += 1
+            self._entries.move_to_end(key)
+            return pixmap
+        
+        self.misses += 1
+        pixmap = render_bubble(message, bubble_type, width, height, dpr)
+        self._entries[key] = pixmap
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+        return pixmap
+    
+    def clear(self):
+        self._entries.clear()
+    
+    def stats(self):
+        return {"hits": self.hits, "misses": self.misses, "entries": len(self._entries)}
+
+
 class SpeechBubble(QWidget):
+    pixmap_cache = BubblePixmapCache()
+    
+    # Émis quand la bulle disparaît (fin du message, fermeture)
+    hidden = pyqtSignal()
+    
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setWindowFlags(Qt.FramelessWindowHint | Qt.WindowStaysOnTopHint | Qt.Tool)
@@ -247,17 +438,11 @@ class SpeechBubble(QWidget):
         self.bubble_type = msg_type
         self.is_pinned = False  # Réinitialiser l'état d'épinglage
         
-        # Calculer la taille plus précisément
-        font = QFont("Arial", 11, QFont.Bold)
-        from PyQt5.QtGui import QFontMetrics
-        metrics = QFontMetrics(font)
-        
-        # Largeur maximum de 400 pixels
-        max_width = 400
-        text_rect = metrics.boundingRect(0, 0, max_width, 500, Qt.TextWordWrap, text)
+        # Taille du texte mis en page (réutilisée telle quelle au dessin)
+        text_size = text_layouts.get(text, bubble_font(), BUBBLE_TEXT_WIDTH).size()
         
-        bubble_width = max(200, text_rect.width() + 60)  # Plus de marge
-        bubble_height = max(80, text_rect.height() + 50)  # Plus de marge
+        bubble_width = max(200, text_size.width() + 60)  # Plus de marge
+        bubble_height = max(80, text_size.height() + 50)  # Plus de marge
         
         self.resize(bubble_width, bubble_height + 25)  # +25 pour la queue
         
@@ -317,6 +502,11 @@ class SpeechBubble(QWidget):
             # Désépingler : redémarrer le timer
             self.fade_timer.start(3000)  # 3 secondes par défaut
     
+    def hideEvent(self, event):
+        super().hideEvent(event)
+        if not event.spontaneous():
+            self.hidden.emit()
+    
     def mousePressEvent(self, event):
         """Gère le clic sur la bulle pour l'épingler/désépingler"""
         if event.button() == Qt.LeftButton:
@@ -324,60 +514,14 @@ class SpeechBubble(QWidget):
         super().mousePressEvent(event)
     
     def paintEvent(self, event):
-        """Dessine la bulle de dialogue"""
+        """Dessine la bulle de dialogue (un seul blit du rendu en cache)"""
         painter = QPainter(self)
-        painter.setRenderHint(QPainter.Antialiasing)
         
         try:
-            # Couleurs selon le type
-            colors = {
-                "normal": (DARK_THEME['bg_secondary'], DARK_THEME['text_primary']),
-                "love": (DARK_THEME['accent_purple'], "white"),
-                "alert": (DARK_THEME['error'], "white"), 
-                "info": (DARK_THEME['bg_secondary'], "white")
-            }
-            
-            bg_color, text_color = colors.get(self.bubble_type, colors["normal"])
-            
-            # CORRECTION : Utiliser QRectF au lieu de QRect
-            rect = QRectF(10.0, 10.0, float(self.width() - 20), float(self.height() - 30))
-            
-            # Fond avec gradient
-            gradient = QLinearGradient(rect.topLeft(), rect.bottomLeft())
-            gradient.setColorAt(0, QColor(bg_color))
-            gradient.setColorAt(1, QColor(bg_color).darker(120))
-            
-            path = QPainterPath()
-            path.addRoundedRect(rect, 15.0, 15.0)  # CORRECTION : utiliser des float
-            
-            # Queue de la bulle (correction des types aussi)
-            queue_start = QPointF(rect.center().x() - 15.0, rect.bottom())
-            queue_tip = QPointF(rect.center().x(), float(self.height() - 5))
-            queue_end = QPointF(rect.center().x() + 15.0, rect.bottom())
-            
-            path.moveTo(queue_start)
-            path.lineTo(queue_tip)
-            path.lineTo(queue_end)
-            path.closeSubpath()
-            
-            # Ombre portée
-            shadow_path = QPainterPath(path)
-            shadow_path.translate(2, 2)
-            painter.fillPath(shadow_path, QColor(0, 0, 0, 100))
-            
-            # Bulle principale
-            painter.fillPath(path, QBrush(gradient))
-            painter.setPen(QPen(QColor(bg_color).lighter(150), 2))
-            painter.drawPath(path)
-            
-            # Texte
-            painter.setPen(QColor(text_color))
-            font = QFont("Arial", 11, QFont.Bold)
-            painter.setFont(font)
-            
-            # CORRECTION : Convertir QRectF en QRect pour drawText
-            text_rect = rect.toRect().adjusted(10, 10, -10, -10)
-            painter.drawText(text_rect, Qt.AlignCenter | Qt.TextWordWrap, self.message)
+            pixmap = self.pixmap_cache.get(self.message, self.bubble_type,
+                                           self.width(), self.height(),
+                                           self.devicePixelRatioF())
+            painter.drawPixmap(0, 0, pixmap)
             
         except Exception as e:
             print(f"Erreur dans paintEvent: {e}")
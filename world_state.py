@@ -0,0 +1,113 @@
+"""
+Sauvegarde du monde de Minou - position et état de l'animal, nourriture et
+poops, écrits en JSON compact sans bloquer l'interface et relus au démarrage
+"""
+import json
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from PyQt5.QtCore import QObject, QTimer
+
+from config import WORLD_STATE_FILE, WORLD_SAVE_DELAY_MS
+
+# Version du format : un fichier d'une autre version est ignoré
+WORLD_STATE_VERSION = 1
+
+
+class WorldStateStore(QObject):
+    """Instantané du monde sur disque.
+
+    Format (JSON sans espaces) :
+      {"v": 1,
+       "pet": {"x", "y", "vx", "vy", "animation", "right", "quiet"},
+       "food": [[x, y, asset, ttl_ms ou null], ...],
+       "poop": [[x, y, asset, ttl_ms ou null], ...]}
+
+    save_later(snapshot) regroupe les changements : `snapshot()` est appelé
+    une seule fois, WORLD_SAVE_DELAY_MS après le premier, puis le fichier est
+    écrit par un thread (remplacement atomique). close() écrit tout de suite
+    et ignore les changements suivants.
+    """
+
+    def __init__(self, path=WORLD_STATE_FILE, delay_ms=WORLD_SAVE_DELAY_MS, parent=None):
+        super().__init__(parent)
+        self.path = path
+        self.closed = False
+        self.writes = 0
+        self.load_ms = 0.0
+        self._snapshot = None
+        self._writer = None
+        self._pending_write = None
+
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setInterval(delay_ms)
+        self._timer.timeout.connect(self._save)
+
+    def load(self):
+        """État sauvegardé, ou None s'il n'existe pas ou est illisible"""
+        start = time.perf_counter()
+        try:
+            with open(self.path, "rb") as f:
+                state = json.loads(f.read())
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            print(f"⚠️ Sauvegarde du monde illisible ({e}), ignorée")
+            return None
+        finally:
+            self.load_ms = (time.perf_counter() - start) * 1000
+
+        if not isinstance(state, dict) or state.get("v") != WORLD_STATE_VERSION:
+            return None
+        return state
+
+    def save_later(self, snapshot):
+        """Programme une sauvegarde de `snapshot()` (les appels rapprochés sont regroupés)"""
+        if self.closed:
+            return
+        self._snapshot = snapshot
+        if not self._timer.isActive():
+            self._timer.start()
+
+    def close(self, snapshot=None):
+        """Dernière sauvegarde, écrite avant de rendre la main"""
+        if self.closed:
+            return
+        self._timer.stop()
+        snapshot = snapshot or self._snapshot
+        self.closed = True
+        if self._pending_write is not None:
+            self._pending_write.result()
+        if snapshot is not None:
+            self._write(self._encode(snapshot()))
+        if self._writer is not None:
+            self._writer.shutdown(wait=True)
+
+    def _save(self):
+        if self._snapshot is None:
+            return
+        # L'instantané lit les widgets : il est pris ici, seule l'écriture part en thread
+        data = self._encode(self._snapshot())
+        if self._writer is None:
+            self._writer = ThreadPoolExecutor(max_workers=1, thread_name_prefix="world-save")
+        self._pending_write = self._writer.submit(self._write, data)
+
+    @staticmethod
+    def _encode(state):
+        state = dict(state, v=WORLD_STATE_VERSION)
+        return json.dumps(state, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+    def _write(self, data):
+        tmp_path = self.path + ".tmp"
+        try:
+            with open(tmp_path, "wb") as f:
+                f.write(data)
+            os.replace(tmp_path, self.path)
+            self.writes += 1
+        except OSError as e:
+            print(f"⚠️ Impossible de sauvegarder le monde: {e}")
+
+
+# Instance globale
+world_store = WorldStateStore()